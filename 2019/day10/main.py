@@ -1,3 +1,4 @@
+from functools import cache
 from math import gcd, sqrt
 from typing import Optional
 
@@ -25,24 +26,31 @@ def compute_quadrant(horiz_rng: range, vert_rng: range, added: set[tuple[int, in
     return sorted(dirs, key=lambda x: x[1]/sqrt(x[1] ** 2 + x[0] ** 2), reverse=reverse)
 
 
-def compute_directions(loc: tuple[int, int], dims: tuple[int, int]) -> list[tuple[int, int]]:
+@cache
+def field_directions(dims: tuple[int, int]) -> tuple[tuple[int, int], ...]:
+    # every direction in a field of this size, clockwise from straight up,
+    # shared by every location and every field of the same size
     height, width = dims
     dirs: list[tuple[int, int]] = []
     added: set[tuple[int, int]] = set()
-    left = - loc[1]
-    right = width - loc[1]
-    up = - loc[0]
-    down = height - loc[0]
     # top right quadrant
-    dirs.extend(compute_quadrant(range(right + 1), range(up, 1), added, reverse=False))
+    dirs.extend(compute_quadrant(range(width + 1), range(-height, 1), added, reverse=False))
     # bottom right quadrant
-    dirs.extend(compute_quadrant(range(right, -1, -1), range(down + 1), added, reverse=True))
+    dirs.extend(compute_quadrant(range(width, -1, -1), range(height + 1), added, reverse=True))
     # bottom left quadrant
-    dirs.extend(compute_quadrant(range(0, left - 1, -1), range(down, -1, -1), added, reverse=True))
+    dirs.extend(compute_quadrant(range(0, -width - 1, -1), range(height, -1, -1), added, reverse=True))
     # top left quadrant
-    dirs.extend(compute_quadrant(range(left, 1), range(0, up - 1, -1), added, reverse=False))
+    dirs.extend(compute_quadrant(range(-width, 1), range(0, -height - 1, -1), added, reverse=False))
+    return tuple(dirs)
 
-    return dirs
+
+def compute_directions(loc: tuple[int, int], dims: tuple[int, int]) -> list[tuple[int, int]]:
+    height, width = dims
+    left = - loc[1]
+    right = width - loc[1]
+    up = - loc[0]
+    down = height - loc[0]
+    return [(vert, horiz) for vert, horiz in field_directions(dims) if up <= vert <= down and left <= horiz <= right]
 
 def count_viewable(loc: tuple[int, int], field: list[str]) -> int:
     width = len(field[0])
@@ -107,6 +115,25 @@ def find_nth_eliminated(coords: tuple[int, int], n: int, field: list[str]) -> tu
                 return lasered
 
 
+def read_field(filename: str) -> list[str]:
+    with open(filename) as file:
+        return [line.strip() for line in file.readlines()]
+
+
+def part_one(filename: str) -> Optional[int]:
+    res = find_best(read_field(filename))
+    return res[0] if res is not None else None
+
+
+def part_two(filename: str) -> Optional[int]:
+    field = read_field(filename)
+    res = find_best(field)
+    if res is None:
+        return None
+    lasered = find_nth_eliminated(res[1], 200, field)
+    return lasered[1] * 100 + lasered[0]
+
+
 if __name__ == "__main__":
     with open("sample1.txt") as file:
         field = [line.strip() for line in file.readlines()]
@@ -128,11 +155,5 @@ if __name__ == "__main__":
 
     print("finished tests")
 
-    with open("input.txt") as file:
-        field = [line.strip() for line in file.readlines()]
-    res = find_best(field)
-    print(res)
-    if res is not None:
-       coords = res[1]
-       lasered = find_nth_eliminated(coords, 200, field)
-       print(lasered[1] * 100 + lasered[0])
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
@@ -283,6 +283,20 @@ def compute_energy(planets: list[Coords], velocities: list[Coords]) -> int:
     )
 
 
+def read_planets(filename: str) -> list[Coords]:
+    with open(filename) as file:
+        return parse_coords(file.readlines())
+
+
+def part_one(filename: str) -> int:
+    planets_after, velocities = run(read_planets(filename), 1000)
+    return compute_energy(planets_after, velocities)
+
+
+def part_two(filename: str) -> int:
+    return run_forever(read_planets(filename))
+
+
 if __name__ == "__main__":
     with open("sample.txt") as file:
         planets = parse_coords(file.readlines())
@@ -295,11 +309,5 @@ if __name__ == "__main__":
     timesteps = run_forever(planets)
     assert timesteps == 2772, timesteps
 
-    with open("input.txt") as file:
-        planets = parse_coords(file.readlines())
-    planets_after, velocities = run(planets, 1000)
-    energy = compute_energy(planets_after, velocities)
-    print(energy)
-
-    timesteps = run_forever(planets)
-    print(timesteps)
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
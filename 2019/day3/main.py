@@ -1,114 +1,113 @@
+from collections.abc import Iterator
+from dataclasses import dataclass
 from typing import Optional
 
-def find_intersection(left: list[str], right: list[str]) -> Optional[int]:
-    lpoints = trace_path(left)
-    rpoints = trace_path(right)
-    intersections = lpoints & rpoints
-    min_ = None
-    for intersection in intersections:
-        norm = abs(intersection[0]) + abs(intersection[1])
-        if min_ is None:
-            min_ = norm
-        elif min_ >= norm:
-            min_ = norm
-    return min_
-
-
-def trace_path(wire: list[str]) -> set[tuple[int, int]]:
-    pos: tuple[int, int] =  (0, 0)
-    points: set[tuple[int, int]] = set()
-    for point in wire:
-        match point[0], point[1:]:
-            case "R", digits:
-                vert, horiz = pos
-                dx = int(digits)
-                for i in range(1, dx + 1):
-                    points.add((vert, horiz + i))
-                pos = vert, horiz + dx
-            case "L", d:
-                vert, horiz = pos
-                dx = int(d)
-                for i in range(1, dx + 1):
-                    points.add((vert, horiz - i))
-                pos = vert, horiz - dx
-            case "U", d:
-                vert, horiz = pos
-                dx = int(d)
-                for i in range(1, dx + 1):
-                    points.add((vert + i, horiz))
-                pos = vert + dx, horiz
-            case "D", d:
-                vert, horiz = pos
-                dx = int(d)
-                for i in range(1, dx + 1):
-                    points.add((vert - i, horiz))
-                pos = vert - dx, horiz
+from aoc.intervals import IntervalTree
+
+
+@dataclass(frozen=True)
+class Segment:
+    """A straight stretch of wire on a row or column, `line`, covering
+    `start <= position < stop` along it, entered at `entry` after `steps` steps.
+    The entry itself belongs to the previous segment."""
+
+    line: int
+    start: int
+    stop: int
+    entry: int
+    steps: int
+
+    def steps_at(self, position: int) -> int:
+        return self.steps + abs(position - self.entry)
+
+
+# the horizontal and the vertical segments of a wire
+Wire = tuple[list[Segment], list[Segment]]
+
+# (line, position, steps of both wires) of a point where the wires cross
+Crossing = tuple[int, int, int]
+
+
+def trace_segments(moves: list[str]) -> Wire:
+    horizontal: list[Segment] = []
+    vertical: list[Segment] = []
+    vert, horiz, steps = 0, 0, 0
+    for move in moves:
+        match move[0], int(move[1:]):
+            case "R", dx:
+                horizontal.append(Segment(vert, horiz + 1, horiz + dx + 1, horiz, steps))
+                horiz += dx
+            case "L", dx:
+                horizontal.append(Segment(vert, horiz - dx, horiz, horiz, steps))
+                horiz -= dx
+            case "U", dx:
+                vertical.append(Segment(horiz, vert + 1, vert + dx + 1, vert, steps))
+                vert += dx
+            case "D", dx:
+                vertical.append(Segment(horiz, vert - dx, vert, vert, steps))
+                vert -= dx
             case _:
-                raise ValueError(f"Unexpected move {point}")
-    return points
+                raise ValueError(f"Unexpected move {move}")
+        steps += dx
+    return horizontal, vertical
+
+
+def perpendicular_crossings(segments: list[Segment], others: list[Segment]) -> Iterator[Crossing]:
+    """Crossings of segments with the segments running the other way."""
+    tree = IntervalTree((segment.start, segment.stop, segment) for segment in segments)
+    for other in others:
+        for _, _, segment in tree.at(other.line):
+            if other.start <= segment.line < other.stop:
+                yield segment.line, other.line, segment.steps_at(other.line) + other.steps_at(segment.line)
+
+
+def parallel_crossings(segments: list[Segment], others: list[Segment]) -> Iterator[Crossing]:
+    """Points shared by segments running the same way on the same line.
+
+    Only the ends of every overlap and its point closest to the origin are yielded,
+    steps only change linearly along an overlap so they are smallest at one of its ends.
+    """
+    tree = IntervalTree((segment.start, segment.stop, segment) for segment in segments)
+    for other in others:
+        for start, stop, segment in tree.overlapping(other.start, other.stop):
+            if segment.line != other.line:
+                continue
+            first, last = max(start, other.start), min(stop, other.stop) - 1
+            for position in {first, last, min(max(0, first), last)}:
+                yield segment.line, position, segment.steps_at(position) + other.steps_at(position)
+
+
+def find_crossings(left: list[str], right: list[str]) -> Iterator[Crossing]:
+    left_horizontal, left_vertical = trace_segments(left)
+    right_horizontal, right_vertical = trace_segments(right)
+    yield from perpendicular_crossings(left_horizontal, right_vertical)
+    yield from perpendicular_crossings(right_horizontal, left_vertical)
+    yield from parallel_crossings(left_horizontal, right_horizontal)
+    yield from parallel_crossings(left_vertical, right_vertical)
+
+
+def find_intersection(left: list[str], right: list[str]) -> Optional[int]:
+    return min((abs(line) + abs(position) for line, position, _ in find_crossings(left, right)), default=None)
 
 
 def find_min_steps(left: list[str], right: list[str]) -> Optional[int]:
-    lpoints = trace_path_with_steps(left)
-    rpoints = trace_path_with_steps(right)
-    intersection = lpoints.keys() & rpoints.keys()
-    min_left, min_right = None, None
-    for point in intersection:
-            ldist, rdist = min(lpoints[point]), min(rpoints[point])
-            if min_left is None and min_right is None:
-                min_left, min_right = ldist, rdist
-            elif min_left + min_right > ldist + rdist:
-                min_left, min_right = ldist, rdist
-    if min_left is not None and min_right is not None:
-        return min_left + min_right
-
-
-def trace_path_with_steps(wire: list[str]) -> dict[tuple[int, int], list[int]]:
-    pos: tuple[int, int, int] = (0, 0, 0)
-    points: dict[tuple[int, int], list[int]] = {}
-    for point in wire:
-        match point[0], point[1:]:
-            case "R", digits:
-                vert, horiz, dist = pos
-                dx = int(digits)
-                for i in range(1, dx + 1):
-                    new_point = vert, horiz + i
-                    dists = points.get(new_point, [])
-                    dists.append(dist + i)
-                    points[new_point] = dists
-                pos = vert, horiz + dx, dist + dx
-            case "L", digits:
-                vert, horiz, dist = pos
-                dx = int(digits)
-                for i in range(1, dx + 1):
-                    new_point = vert, horiz - i
-                    dists = points.get(new_point, [])
-                    dists.append(dist + i)
-                    points[new_point] = dists
-                pos = vert, horiz - dx, dist + dx
-            case "U", digits:
-                vert, horiz, dist = pos
-                dx = int(digits)
-                for i in range(1, dx + 1):
-                    new_point = vert + i, horiz
-                    dists = points.get(new_point, [])
-                    dists.append(dist + i)
-                    points[new_point] = dists
-                pos = vert + dx, horiz, dist + dx
-            case "D", digits:
-                vert, horiz, dist = pos
-                dx = int(digits)
-                for i in range(1, dx + 1):
-                    new_point = vert - i, horiz
-                    dists = points.get(new_point, [])
-                    dists.append(dist + i)
-                    points[new_point] = dists
-                pos = vert - dx, horiz, dist + dx
-            case _:
-                raise ValueError(f"Unexpected move {point}")
-    return points
+    return min((steps for _, _, steps in find_crossings(left, right)), default=None)
+
+
+def read_wires(filename: str) -> tuple[list[str], list[str]]:
+    with open(filename) as file:
+        left = file.readline().strip().split(',')
+        right = file.readline().strip().split(',')
+    return left, right
 
 
+def part_one(filename: str) -> int | None:
+    return find_intersection(*read_wires(filename))
+
+
+def part_two(filename: str) -> int | None:
+    return find_min_steps(*read_wires(filename))
+
 
 if __name__ == "__main__":
     left = ["R8", "U5","L5", "D3"]
@@ -121,12 +120,5 @@ if __name__ == "__main__":
     assert total_dist == 30, total_dist
 
     print("processing input")
-    with open("input.txt") as file:
-        left = file.readline().strip().split(',')
-        right = file.readline().strip().split(',')
-    assert left != right
-    dist = find_intersection(left, right)
-    print(dist)
-
-    total_dist = find_min_steps(left, right)
-    print(total_dist)
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
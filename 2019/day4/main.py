@@ -36,6 +36,20 @@ def count_passwords_strict(pswd_range: range = RANGE) -> int:
     return count
 
 
+def read_range(filename: str) -> range:
+    with open(filename) as file:
+        low, high = file.readline().strip().split("-")
+    return range(int(low), int(high) + 1)
+
+
+def part_one(filename: str) -> int:
+    return count_passwords(read_range(filename))
+
+
+def part_two(filename: str) -> int:
+    return count_passwords_strict(read_range(filename))
+
+
 if __name__ == "__main__":
     print(count_passwords())
     print(count_passwords_strict())
\ No newline at end of file
@@ -1,155 +1,87 @@
 from dataclasses import dataclass
+from functools import cache, lru_cache
 from typing import Optional
-from collections.abc  import Generator
+from collections.abc  import Callable, Collection, Generator, Iterable, Sequence
+
+from aoc.counters import count
+from aoc.parallel import fork_map
+from aoc.intcode import VM, Status, machine, read_program
+
+
+# every amplifier runs a few dozen instructions, too few to make up for compiling them
+BACKEND = "interpreter"
+
+PHASES = range(0, 5)
+LOOPED_PHASES = range(5, 10)
+
+# amplifier runs remembered by (phase, input signal)
+CACHE_SIZE = 1 << 12
+
+
+def primed_amplifiers(program: list[int], phases: Iterable[int], backend: str = BACKEND) -> dict[int, VM]:
+    """Machines that took their phase setting and wait for their first input signal.
+
+    The program runs up to where it reads the phase once, then once more per phase,
+    amplifiers fork these machines instead of starting the program over, and with it
+    already decoded.
+    """
+    start = machine(backend)(program)
+    if start.run() is not Status.WAITING:
+        raise ValueError("Amplifier program does not read a phase setting")
+    start.predecode()
+    primed = {}
+    for phase in phases:
+        amplifier = start.fork()
+        amplifier.send(phase)
+        if amplifier.run() is not Status.WAITING:
+            raise ValueError("Amplifier program does not read an input signal")
+        primed[phase] = amplifier
+    return primed
 
 
 @dataclass(frozen=True)
 class Amplifier:
-    phase: int
-
-    def run_program(self, inpt: int, prog: list[int]) -> int:
-        pointer = 0
-        phased = False
-        output: Optional[int] = None
-        while prog[pointer] != 99:
-            digits = str(prog[pointer]).zfill(5)
-            if digits.endswith('1'):
-                mode = digits[:-2][::-1]
-                left = prog[prog[pointer + 1]] if mode[0] == '0' else prog[pointer + 1]
-                right = prog[prog[pointer + 2]] if mode[1] == '0' else prog[pointer + 2]
-                prog[prog[pointer + 3]] = left + right
-                pointer += 4
-            elif digits.endswith('2'):
-                mode = digits[:-2][::-1]
-                left = prog[prog[pointer + 1]] if mode[0] == '0' else prog[pointer + 1]
-                right = prog[prog[pointer + 2]] if mode[1] == '0' else prog[pointer + 2]
-                prog[prog[pointer + 3]] = left * right
-                pointer += 4
-            elif digits.endswith('3'):
-                prog[prog[pointer + 1]] = self.phase if not phased else inpt
-                phased = True
-                pointer += 2
-            elif digits.endswith('4'):
-                mode = digits[:-2][::-1]
-                output = prog[prog[pointer + 1]] if mode[0] == '0' else prog[pointer + 1]
-                pointer += 2
-            elif digits.endswith('5'):
-                mode = digits[:-2][::-1]
-                bit = prog[prog[pointer + 1]] if mode[0] == '0' else prog[pointer + 1]
-                if bit:
-                    pointer = prog[prog[pointer + 2]] if mode[1] == '0' else prog[pointer + 2]
-                else:
-                    pointer += 3
-            elif digits.endswith('6'):
-                mode = digits[:-2][::-1]
-                bit = prog[prog[pointer + 1]] if mode[0] == '0' else prog[pointer + 1]
-                if not bit:
-                    pointer = prog[prog[pointer + 2]] if mode[1] == '0' else prog[pointer + 2]
-                else:
-                    pointer += 3
-            elif digits.endswith('7'):
-                mode = digits[:-2][::-1]
-                left = prog[prog[pointer + 1]] if mode[0] == '0' else prog[pointer + 1]
-                right = prog[prog[pointer + 2]] if mode[1] == '0' else prog[pointer + 2]
-                if left < right:
-                    prog[prog[pointer + 3]] = 1
-                else:
-                    prog[prog[pointer + 3]] = 0
-                pointer += 4
-            elif digits.endswith('8'):
-                mode = digits[:-2][::-1]
-                left = prog[prog[pointer + 1]] if mode[0] == '0' else prog[pointer + 1]
-                right = prog[prog[pointer + 2]] if mode[1] == '0' else prog[pointer + 2]
-                if left == right:
-                    prog[prog[pointer + 3]] = 1
-                else:
-                    prog[prog[pointer + 3]] = 0
-                pointer += 4
-            else:
-                raise ValueError(f"Unknown op code: {prog[pointer]}")
-        if output is not None:
-            return output
+    primed: VM
+
+    def run_program(self, inpt: int) -> int:
+        vm = self.primed.fork()
+        vm.send(inpt)
+        outputs = vm.run_until_halt()
+        if outputs:
+            return outputs[-1]
         raise ValueError("Failed to output a value")
 
 @dataclass
 class LoopedAmplifier:
-    phase: int
-
-    def run_program(self, inpt: int, prog: list[int]) -> Generator[int, int, None]:
-        pointer = 0
-        phased = False
-        output: Optional[int] = None
-        while prog[pointer] != 99:
-            digits = str(prog[pointer]).zfill(5)
-            if digits.endswith('1'):
-                mode = digits[:-2][::-1]
-                left = prog[prog[pointer + 1]] if mode[0] == '0' else prog[pointer + 1]
-                right = prog[prog[pointer + 2]] if mode[1] == '0' else prog[pointer + 2]
-                prog[prog[pointer + 3]] = left + right
-                pointer += 4
-            elif digits.endswith('2'):
-                mode = digits[:-2][::-1]
-                left = prog[prog[pointer + 1]] if mode[0] == '0' else prog[pointer + 1]
-                right = prog[prog[pointer + 2]] if mode[1] == '0' else prog[pointer + 2]
-                prog[prog[pointer + 3]] = left * right
-                pointer += 4
-            elif digits.endswith('3'):
-                prog[prog[pointer + 1]] = self.phase if not phased else inpt
-                phased = True
-                pointer += 2
-            elif digits.endswith('4'):
-                mode = digits[:-2][::-1]
-                output = prog[prog[pointer + 1]] if mode[0] == '0' else prog[pointer + 1]
-                pointer += 2
-                inpt = yield output
-            elif digits.endswith('5'):
-                mode = digits[:-2][::-1]
-                bit = prog[prog[pointer + 1]] if mode[0] == '0' else prog[pointer + 1]
-                if bit:
-                    pointer = prog[prog[pointer + 2]] if mode[1] == '0' else prog[pointer + 2]
-                else:
-                    pointer += 3
-            elif digits.endswith('6'):
-                mode = digits[:-2][::-1]
-                bit = prog[prog[pointer + 1]] if mode[0] == '0' else prog[pointer + 1]
-                if not bit:
-                    pointer = prog[prog[pointer + 2]] if mode[1] == '0' else prog[pointer + 2]
-                else:
-                    pointer += 3
-            elif digits.endswith('7'):
-                mode = digits[:-2][::-1]
-                left = prog[prog[pointer + 1]] if mode[0] == '0' else prog[pointer + 1]
-                right = prog[prog[pointer + 2]] if mode[1] == '0' else prog[pointer + 2]
-                if left < right:
-                    prog[prog[pointer + 3]] = 1
-                else:
-                    prog[prog[pointer + 3]] = 0
-                pointer += 4
-            elif digits.endswith('8'):
-                mode = digits[:-2][::-1]
-                left = prog[prog[pointer + 1]] if mode[0] == '0' else prog[pointer + 1]
-                right = prog[prog[pointer + 2]] if mode[1] == '0' else prog[pointer + 2]
-                if left == right:
-                    prog[prog[pointer + 3]] = 1
-                else:
-                    prog[prog[pointer + 3]] = 0
-                pointer += 4
-            else:
-                raise ValueError(f"Unknown op code: {prog[pointer]}")
-
-def chain_amplifiers(phases: list[int], program: list[int]) -> int:
-    amplifiers = [Amplifier(phase) for phase in phases]
+    primed: VM
+
+    def run_program(self, inpt: int) -> Generator[int, int | None, None]:
+        vm = self.primed.fork()
+        vm.send(inpt)
+        return vm.stream()
+
+    def first_pass(self, inpt: int) -> tuple[VM, int]:
+        """A fork of the amplifier paused after its first output, and that output."""
+        vm = self.primed.fork()
+        vm.send(inpt)
+        vm.run(pause_on_output=True)
+        if not vm.outputs:
+            raise ValueError("Failed to output a value")
+        return vm, vm.outputs.popleft()
+
+def chain_amplifiers(phases: list[int], primed: dict[int, VM]) -> int:
+    amplifiers = [Amplifier(primed[phase]) for phase in phases]
     input_ = 0
     for amplifier in amplifiers:
-        input_ = amplifier.run_program(input_, program[:])
+        input_ = amplifier.run_program(input_)
     return input_
 
-def chain_amplifiers_looped(phases: list[int], program: list[int]) -> int:
-    amplifiers = [LoopedAmplifier(phase) for phase in phases]
+def chain_amplifiers_looped(phases: list[int], primed: dict[int, VM]) -> int:
+    amplifiers = [LoopedAmplifier(primed[phase]) for phase in phases]
     input_ = 0
-    gens: list[Generator[int, int, None]] = []
+    gens: list[Generator[int, int | None, None]] = []
     for amplifier in amplifiers:
-        g = amplifier.run_program(input_, program[:])
+        g = amplifier.run_program(input_)
         input_ = next(g)
         gens.append(g)
     idx = 0
@@ -164,34 +96,117 @@ def chain_amplifiers_looped(phases: list[int], program: list[int]) -> int:
     return input_ 
 
 
-def permutations(values: list[int]) -> Generator[list[int], None, None]:
-    if not values:
-        yield []
-        return
-    for idx, value in enumerate(values):
-        for sub in permutations(values[:idx] + values[idx + 1:]):
-            yield [value, *sub]
+def run_loop(paused: Sequence[VM], input_: int) -> int:
+    """Feeds the signal round forks of the paused amplifiers until the last one halts, returns the last signal."""
+    machines = [vm.fork() for vm in paused]
+    while True:
+        for vm in machines:
+            vm.send(input_)
+            status = vm.run(pause_on_output=True)
+            if status is Status.OUTPUT:
+                input_ = vm.outputs.popleft()
+            elif status is Status.WAITING:
+                raise ValueError("Intcode program is waiting for input")
+        if status is Status.HALTED:
+            return input_
+
+
+def search_chains(transfer: Callable[[int, int], int], phases: Collection[int], amplifiers: int) -> int:
+    """Highest signal out of a chain of amplifiers with distinct phases, `transfer` giving
+    the output of an amplifier for its phase and input. Chains that share a prefix
+    share its runs, and so do prefixes ending on the same signal with the same phases left."""
+
+    @cache
+    def best(input_: int, remaining: frozenset[int], left: int) -> int:
+        if left == 0:
+            return input_
+        return max(best(transfer(phase, input_), remaining - {phase}, left - 1) for phase in remaining)
+
+    return best(0, frozenset(phases), amplifiers)
+
+
+def search_loops(primed: dict[int, VM], amplifiers: int, first: int | None = None) -> int:
+    """Highest signal out of a feedback loop of amplifiers with distinct phases,
+    only among the loops whose first amplifier has the phase `first` when it is given.
+
+    The first pass through a prefix is shared by every loop starting with it.
+    Nothing is pruned: an arbitrary program gives no bound on the final signal of a loop
+    from its first pass, so every loop still runs to the end.
+    """
+
+    @lru_cache(maxsize=CACHE_SIZE)
+    def first_pass(phase: int, input_: int) -> tuple[VM, int]:
+        count("amplifier runs")
+        return LoopedAmplifier(primed[phase]).first_pass(input_)
+
+    def best(paused: tuple[VM, ...], input_: int, remaining: frozenset[int]) -> int:
+        if len(paused) == amplifiers:
+            return run_loop(paused, input_)
+        results = []
+        for phase in remaining:
+            vm, output = first_pass(phase, input_)
+            results.append(best((*paused, vm), output, remaining - {phase}))
+        return max(results)
+
+    if first is None:
+        return best((), 0, frozenset(primed))
+    vm, output = first_pass(first, 0)
+    return best((vm,), output, frozenset(primed) - {first})
+
+
+def _amplifiers(phases: Collection[int], amplifiers: int | None) -> int:
+    amplifiers = len(phases) if amplifiers is None else amplifiers
+    if not 0 < amplifiers <= len(phases):
+        raise ValueError(f"Cannot chain {amplifiers} amplifiers with {len(phases)} distinct phases")
+    return amplifiers
+
+
+def test_combinations(
+    program: list[int], backend: str = BACKEND, phases: Collection[int] = PHASES, amplifiers: int | None = None
+) -> Optional[int]:
+    amplifiers = _amplifiers(phases, amplifiers)
+    primed = primed_amplifiers(program, phases, backend)
+
+    @lru_cache(maxsize=CACHE_SIZE)
+    def transfer(phase: int, input_: int) -> int:
+        count("amplifier runs")
+        return Amplifier(primed[phase]).run_program(input_)
+
+    return search_chains(transfer, phases, amplifiers)
+
+
+def test_combinations_looped(
+    program: list[int],
+    backend: str = BACKEND,
+    phases: Collection[int] = LOOPED_PHASES,
+    amplifiers: int | None = None,
+    jobs: int = 1,
+) -> Optional[int]:
+    """With more than one job, the loops are split by the phase of their first amplifier
+    between forked processes, which inherit the primed amplifiers."""
+    amplifiers = _amplifiers(phases, amplifiers)
+    primed = primed_amplifiers(program, phases, backend)
+    if jobs <= 1:
+        return search_loops(primed, amplifiers)
+    return max(fork_map(lambda first: search_loops(primed, amplifiers, first), sorted(phases), jobs))
 
 
-def test_combinations(program: list[int]) -> Optional[int]:
-    phases = list(range(0, 5))
-    return max(chain_amplifiers(perm, program) for perm in permutations(phases))
+def part_one(filename: str) -> Optional[int]:
+    return test_combinations(read_program(filename))
 
 
-def test_combinations_looped(program: list[int]) -> Optional[int]:
-    phases = list(range(5, 10))
-    return max(chain_amplifiers_looped(perm, program) for perm in permutations(phases))
+def part_two(filename: str) -> Optional[int]:
+    return test_combinations_looped(read_program(filename))
 
 
 if __name__ == "__main__":
     program = [3,15,3,16,1002,16,10,16,1,16,15,15,4,15,99,0,0]
-    assert (res := chain_amplifiers([4,3,2,1,0], program)) == 43210, res
+    assert (res := chain_amplifiers([4,3,2,1,0], primed_amplifiers(program, range(5)))) == 43210, res
     assert (res := test_combinations(program)) == 43210, res
     
     program = [3,26,1001,26,-4,26,3,27,1002,27,2,27,1,27,26,27,4,27,1001,28,-1,28,1005,28,6,99,0,0,5]
+    assert (res := chain_amplifiers_looped([9,8,7,6,5], primed_amplifiers(program, range(5, 10)))) == 139629729, res
     assert (res := test_combinations_looped(program)) == 139629729, res
 
-    with open("input.txt") as file:
-        program = [int(num) for num in file.readline().strip().split(',')]
-    print(test_combinations(program))
-    print(test_combinations_looped(program))
\ No newline at end of file
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
\ No newline at end of file
@@ -0,0 +1,17 @@
+import unittest as ut
+
+import main
+
+
+# the feedback loop example, its best phases are 9,8,7,6,5
+PROGRAM = [3,26,1001,26,-4,26,3,27,1002,27,2,27,1,27,26,27,4,27,1001,28,-1,28,1005,28,6,99,0,0,5]
+
+
+class TestLoopedSearch(ut.TestCase):
+    def test_jobs(self) -> None:
+        self.assertEqual(main.test_combinations_looped(PROGRAM, jobs=1), 139629729)
+        self.assertEqual(main.test_combinations_looped(PROGRAM, jobs=3), 139629729)
+
+
+if __name__ == "__main__":
+    ut.main()
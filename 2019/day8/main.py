@@ -1,29 +1,20 @@
+from aoc.inputs import DIGITS, read_digits
 
 
-def parse_image(image: str, dims: tuple[int, int]) -> list[list[list[int]]]:
-    layers: list[list[list[int]]] = []
-    layer: list[list[int]] = []
-    row: list[int] = []
+def parse_image(image: bytes, dims: tuple[int, int]) -> list[list[bytes]]:
     width, height = dims
-    for digit in image:
-        row.append(int(digit))
-        if len(row) == width:
-            layer.append(row)
-            row = []
-        if len(layer) == height:
-            layers.append(layer)
-            layer = []    
-    return layers
-
-
-def validate(layers: list[list[list[int]]]) -> int:
+    rows = [image[idx:idx + width] for idx in range(0, len(image), width)]
+    return [rows[idx:idx + height] for idx in range(0, len(rows), height)]
+
+
+def validate(layers: list[list[bytes]]) -> int:
     layer = min(layers, key=lambda lar: sum(1 for row in lar for digit in row if digit == 0))
     ones = sum(1 for row in layer for digit in row if digit == 1)
     twos = sum(1 for row in layer for digit in row if digit == 2)
     return ones * twos
 
 
-def render(layers: list[list[list[int]]], dims: tuple[int, int]) -> list[str]:
+def render(layers: list[list[bytes]], dims: tuple[int, int]) -> list[str]:
     actual: list[list[str]] = []
     width, height = dims
     for jdx in range(height):
@@ -42,17 +33,26 @@ def render(layers: list[list[list[int]]], dims: tuple[int, int]) -> list[str]:
     return [''.join(row) for row in actual]
 
 
+DIMS = (25, 6)
+
+
+def read_image(filename: str) -> bytes:
+    return read_digits(filename)
+
+
+def part_one(filename: str) -> int:
+    return validate(parse_image(read_image(filename), DIMS))
+
+
+def part_two(filename: str) -> str:
+    return "\n".join(render(parse_image(read_image(filename), DIMS), DIMS))
+
+
 if __name__ == "__main__":
-    image = "123456789012"
+    image = b"123456789012".translate(DIGITS)
     dims = (3, 2)
     layers = parse_image(image, dims)
     assert (res := validate(layers)) == 1, res
 
-    with open("input.txt") as file:
-        image = file.readline().strip()
-    dims = (25, 6)
-    layers = parse_image(image, dims)
-    print(validate(layers))
-
-    for row in render(layers, dims):
-        print(row)
\ No newline at end of file
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
\ No newline at end of file
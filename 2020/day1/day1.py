@@ -28,6 +28,24 @@ def find_sum3(seq: Sequence[int], sum_: int) -> list[tuple[int, int, int]]:
                     triplets.append((elem, elem_, elem__))
     return triplets
 
+
+def read_entries(filename: str) -> list[int]:
+    with open(filename, "r") as file:
+        return [int(elem) for elem in file.readlines()]
+
+
+def part_one(filename: str) -> int:
+    pairs = find_sum(read_entries(filename), 2020)
+    assert len(pairs) == 1
+    return pairs[0][0] * pairs[0][1]
+
+
+def part_two(filename: str) -> int:
+    triplets = find_sum3(read_entries(filename), 2020)
+    assert len(triplets) == 1
+    return triplets[0][0] * triplets[0][1] * triplets[0][2]
+
+
 if __name__ == "__main__":
     with open("sample.txt", "r") as file:
         elems = [int(elem) for elem in file.readlines()]
@@ -38,12 +56,6 @@ if __name__ == "__main__":
     assert len(triplets) == 1
     assert triplets[0][0] * triplets[0][1] * triplets[0][2] == 241861950
 
-    with open("input.txt", "r") as file:
-        elems = [int(elem) for elem in file.readlines()]
-    pairs = find_sum(elems, 2020)
-    assert len(pairs) == 1
-    print(pairs[0][0] * pairs[0][1])
-    triplets = find_sum3(elems, 2020)
-    assert len(triplets) == 1
-    print(triplets[0][0] * triplets[0][1] * triplets[0][2])
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
   
\ No newline at end of file
@@ -1,5 +1,8 @@
 from typing import Union
 from operator import ge, le
+from pathlib import Path
+
+from aoc.variants import Registry
 
 CompTree = dict[int, Union["CompTree", int]]
 
@@ -122,6 +125,33 @@ def count_orderings_memo(values: list[int]) -> int:
     return solve(values[::-1])
 
 
+def read_joltages(filename: str) -> list[int]:
+    with open(filename, "r") as file:
+        joltages = [int(line.strip()) for line in file.readlines()]
+    return sorted([0] + joltages)
+
+
+# the searches walk every ordering, and their number grows exponentially with the adapters,
+# memoising on the remaining adapters keeps the count polynomial, costs are in microseconds
+count_joltage_orderings = Registry(
+    "count_joltage_orderings",
+    size=len,
+    examples=lambda: [(read_joltages(str(Path(__file__).parent / name)),) for name in ("small.txt", "sample.txt")],
+)
+count_joltage_orderings.add(lambda values: find_orders(values, values[0]), "2^n", scale=0.015, name="find_orders")
+count_joltage_orderings.add(enumerate_orderings, "2^n", scale=0.1)
+count_joltage_orderings.add(count_orderings, "2^n", scale=0.015)
+count_joltage_orderings.add(count_orderings_memo, "n^2", scale=0.3)
+
+
+def part_one(filename: str) -> int:
+    return diffs(read_joltages(filename))
+
+
+def part_two(filename: str) -> int:
+    return count_joltage_orderings(read_joltages(filename))
+
+
 if __name__ == "__main__":
     with open("small.txt", "r") as file:
         joltages = [int(line.strip()) for line in file.readlines()]
@@ -137,10 +167,5 @@ if __name__ == "__main__":
     assert (result := diffs(sorted_)) == 220, result
     assert (result := count_orderings_memo(sorted_)) == 19208, result
 
-    with open("input.txt", "r") as file:
-        joltages = [int(line.strip()) for line in file.readlines()]
-    sorted_ = sorted([0] + joltages)
-    assert len(sorted_) == len(set(sorted_))
-
-    print(diffs(sorted_))
-    print(count_orderings_memo(sorted_))
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
@@ -193,6 +193,22 @@ def do_actions_waypoint(start: Point, waypoint: Point, actions: list[tuple[Actio
     return (north, east), (wnorth, weast)
 
 
+def read_actions(filename: str) -> list[tuple[Action, int]]:
+    with open(filename, "r") as file:
+        return [parse_action(line.strip()) for line in file.readlines()]
+
+
+def part_one(filename: str) -> int:
+    start = (Direction.East, 0, 0)
+    return distance(start, do_actions(start, read_actions(filename)))
+
+
+def part_two(filename: str) -> int:
+    start = (0, 0)
+    end, _ = do_actions_waypoint(start, (1, 10), read_actions(filename))
+    return simple_distance(start, end)
+
+
 if __name__ == "__main__":
     with open("sample.txt", "r") as file:
         actions = [parse_action(line.strip()) for line in file.readlines()] 
@@ -206,14 +222,5 @@ if __name__ == "__main__":
     end, waypoint_end = do_actions_waypoint(start, waypoint, actions)
     assert simple_distance(start, end) == 286
 
-    with open("input.txt", "r") as file:
-        actions = [parse_action(line.strip()) for line in file.readlines()] 
-
-    start = (Direction.East, 0, 0)
-    end = do_actions(start, actions)
-    print(distance(start, end))
-
-    start = (0, 0)
-    waypoint = (1, 10)
-    end, _ = do_actions_waypoint(start, waypoint, actions)
-    print(simple_distance(start, end))
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
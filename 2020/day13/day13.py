@@ -1,5 +1,8 @@
 from typing import Optional
-from math import prod, floor
+from math import floor, prod
+
+from aoc.numtheory import crt
+from aoc.variants import Registry
 
 
 def parse_and_index_buses(line: str) -> list[tuple[int, int]]:
@@ -52,19 +55,46 @@ def find_earliest_timestamp_better(indexed_buses: list[tuple[int, int]]) -> int:
 
 
 def find_earliest_timestamp_best(indexed_buses: list[tuple[int, int]]) -> int:
-    prev: list[int] = []
-    def solve(timestamp: int, idx: int, bus: int): 
-        rem = (timestamp + idx) % bus
-        while rem != 0:
-            timestamp += prod(prev)
-            rem = (timestamp + idx) % bus
-        return timestamp
-    
-    timestamp = 1
-    for idx, bus in indexed_buses:
-        timestamp = solve(timestamp, idx, bus)
-        prev.append(bus)
-    return timestamp
+    # bus leaves idx minutes after the timestamp, timestamp = -idx (mod bus)
+    timestamp, period = crt((-idx, bus) for idx, bus in indexed_buses)
+    return timestamp or period
+
+
+# the searches step through timestamps up to the answer, bounded by the product of the buses,
+# the chinese remainder theorem takes a few steps per bit of it, costs are in microseconds
+earliest_timestamp = Registry(
+    "earliest_timestamp",
+    size=lambda indexed_buses: prod(bus for _, bus in indexed_buses),
+    examples=lambda: [
+        ([(0, 7), (1, 13), (4, 59), (6, 31), (7, 19)],),
+        ([(0, 17), (2, 13), (3, 19)],),
+        ([(0, 67), (1, 7), (2, 59), (3, 61)],),
+    ],
+)
+earliest_timestamp.add(find_earliest_timestamp, "n", scale=0.03)
+earliest_timestamp.add(find_earliest_timestamp_better, "n", scale=0.07)
+earliest_timestamp.add(find_earliest_timestamp_best, "log n", scale=5.0)
+
+
+def read_notes(filename: str) -> tuple[int, list[tuple[int, int]]]:
+    with open(filename) as file:
+        earliest_departure_time = int(file.readline().strip())
+        indexed_buses = parse_and_index_buses(file.readline().strip())
+    return earliest_departure_time, indexed_buses
+
+
+def part_one(filename: str) -> int:
+    earliest_departure_time, indexed_buses = read_notes(filename)
+    earliest = find_earliest_bus_and_time(earliest_departure_time, only_buses(indexed_buses))
+    if earliest is None:
+        raise ValueError("Buses list was empty.")
+    bus, time = earliest
+    return bus * time
+
+
+def part_two(filename: str) -> int:
+    _, indexed_buses = read_notes(filename)
+    return earliest_timestamp(indexed_buses)
 
 
 if __name__ == "__main__":
@@ -86,16 +116,5 @@ if __name__ == "__main__":
     timestamp = find_earliest_timestamp_best(indexed_buses)
     assert timestamp == 1068781, timestamp
 
-    with open("input.txt") as file:
-        earliest_departure_time = int(file.readline().strip())
-        indexed_buses = parse_and_index_buses(file.readline().strip())
-        buses = only_buses(indexed_buses)
-
-    earliest = find_earliest_bus_and_time(earliest_departure_time, buses)
-    if earliest is not None:
-        bus, time = earliest
-        print(bus * time)
-    else:
-        raise ValueError(f"Buses list was empty.")
-    timestamp = find_earliest_timestamp_best(indexed_buses)
-    print(timestamp)
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
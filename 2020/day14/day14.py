@@ -76,6 +76,23 @@ def do_actions_mem(mem: dict[int, int], actions: list[tuple[Action, tuple[int, i
                 mem[subloc] = number
 
 
+def read_actions(filename: str) -> list[tuple[Action, tuple[int, int] | list[tuple[int, int]]]]:
+    with open(filename) as file:
+        return parse_actions(file.readlines())
+
+
+def part_one(filename: str) -> int:
+    mem: dict[int, int] = {}
+    do_actions(mem, read_actions(filename))
+    return sum(mem.values())
+
+
+def part_two(filename: str) -> int:
+    mem: dict[int, int] = {}
+    do_actions_mem(mem, read_actions(filename))
+    return sum(mem.values())
+
+
 if __name__ == "__main__":
     with open("sample.txt") as file:
         actions = parse_actions(file.readlines())
@@ -88,9 +105,5 @@ if __name__ == "__main__":
     do_actions_mem(mem, actions)
     assert sum(mem.values()) == 208
 
-    with open("input.txt") as file:
-        actions = parse_actions(file.readlines())
-
-    mem: dict[int, int] = {}
-    do_actions(mem, actions)
-    print(sum(mem.values()))
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
@@ -17,6 +17,22 @@ def take_turns(target_turn: int, spoken: dict[int, tuple[bool, int]], last_numbe
 def take_initial_turns(initial: list[int]) -> dict[int, tuple[bool, int]]:
     return {number: (True, turn) for turn, number in enumerate(initial, start = 1)}
 
+
+def read_initial(filename: str) -> list[int]:
+    with open(filename) as file:
+        return [int(number) for number in file.readline().strip().split(",")]
+
+
+def part_one(filename: str) -> int:
+    initial = read_initial(filename)
+    return take_turns(2020, take_initial_turns(initial), initial[-1])
+
+
+def part_two(filename: str) -> int:
+    initial = read_initial(filename)
+    return take_turns(30_000_000, take_initial_turns(initial), initial[-1])
+
+
 if __name__ == "__main__":
     sample1 = [0, 3, 6]
     spoken = take_initial_turns(sample1)
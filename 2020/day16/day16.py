@@ -3,6 +3,8 @@ from collections.abc import Iterator
 from dataclasses import dataclass
 import re
 
+from aoc.intervals import IntervalSet
+
 
 Rules = dict[str, tuple[range, range]]
 
@@ -59,19 +61,21 @@ def parse_other_tickets(lines: Iterator[str]) -> tuple[list[Ticket], Iterator[st
     return tickets, lines
 
 
-def find_ticket_invalid_values(ticket: Ticket, rules: Rules) -> list[int]:
-    invalid_values: list[int] = []
-    for value in ticket.field_values:
-        if all((value not in rng1) and (value not in rng2) for rng1, rng2 in rules.values()):
-            invalid_values.append(value)
-    return invalid_values   
+def valid_values(rules: Rules) -> IntervalSet:
+    """Every value allowed by at least one rule."""
+    return IntervalSet((rng.start, rng.stop) for ranges in rules.values() for rng in ranges)
+
+
+def find_ticket_invalid_values(ticket: Ticket, valid: IntervalSet) -> list[int]:
+    return [value for value in ticket.field_values if value not in valid]
 
 
 def find_all_tickets_invalid_values(tickets: list[Ticket], rules: Rules) -> tuple[list[int], list[Ticket]]:
     invalid_values: list[int] = []
     valid_tickets: list[Ticket] = []
+    valid = valid_values(rules)
     for ticket in tickets:
-        invalid = find_ticket_invalid_values(ticket, rules)
+        invalid = find_ticket_invalid_values(ticket, valid)
         if invalid:
             invalid_values.extend(invalid)
         else:
@@ -79,21 +83,24 @@ def find_all_tickets_invalid_values(tickets: list[Ticket], rules: Rules) -> tupl
     return invalid_values, valid_tickets
 
 
-if __name__ == "__main__":
-    with open("sample.txt") as file:
+def part_one(filename: str) -> int:
+    with open(filename) as file:
         itr = iter(file.readlines())
     rules, itr = parse_rules(itr)
-    my_ticket, itr = parse_my_ticket(itr)
+    _, itr = parse_my_ticket(itr)
     other_tickets, _ = parse_other_tickets(itr)
-    
     invalid_values, _ = find_all_tickets_invalid_values(other_tickets, rules)
-    assert (result := sum(invalid_values)) == 71, result
+    return sum(invalid_values)
+
 
-    with open("input.txt") as file:
+if __name__ == "__main__":
+    with open("sample.txt") as file:
         itr = iter(file.readlines())
     rules, itr = parse_rules(itr)
     my_ticket, itr = parse_my_ticket(itr)
     other_tickets, _ = parse_other_tickets(itr)
     
-    invalid_values, valid_tickets = find_all_tickets_invalid_values(other_tickets, rules)
-    print(sum(invalid_values))
+    invalid_values, _ = find_all_tickets_invalid_values(other_tickets, rules)
+    assert (result := sum(invalid_values)) == 71, result
+
+    print(part_one("input.txt"))
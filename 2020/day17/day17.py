@@ -1,113 +1,58 @@
-from collections.abc import Generator
 from itertools import product
 
+from aoc.automaton import SparseAutomaton
 
-Cube = tuple[int, int, int]
+
+Cube = tuple[int, ...]
 Grid = set[Cube]
 
-Hypercube = tuple[int, int, int, int]
-Hypergrid = set[Hypercube]
-
-
-def yield_neighbors(cube: Cube) -> Generator[Cube, None, None]:
-    return ((cube[0] + i, cube[1] + j, cube[2] + k) for i, j, k in product(*[[-1, 0, 1]] * 3) if not (i == j == k == 0))
-
-
-def yield_hyper_neighbors(hcube: Hypercube) -> Generator[Hypercube, None, None]:
-    return ((hcube[0] + i, hcube[1] + j, hcube[2] + k, hcube[3] + l) for i, j, k, l in product(*[[-1, 0, 1]] * 4) if not (i == j == k == l == 0))
-
-
-def run_cycle(cubes: Grid) -> Grid:
-    cubes_after: Grid = set()
-    candidates: dict[Cube, int] = {}
-    inactive: Grid = set()
-    for cube in cubes:
-        active = 0
-        for neighbor in yield_neighbors(cube):
-            if neighbor in cubes:
-                active += 1
-            elif neighbor not in inactive:
-                candidates[neighbor] = candidates.get(neighbor, 0) + 1
-                if candidates[neighbor] > 3:
-                    inactive.add(neighbor)
-                    candidates.pop(neighbor)
-        if active in {2, 3}:
-            cubes_after.add(cube)
-    new_active = {cube for cube, count in candidates.items() if count == 3}
-    return cubes_after | new_active
-
-
-def run_hcycle(hcubes: Hypergrid) -> Hypergrid:
-    hcubes_after: Hypergrid = set()
-    candidates: dict[Hypercube, int] = {}
-    inactive: Hypergrid = set()
-    for hcube in hcubes:
-        active = 0
-        for neighbor in yield_hyper_neighbors(hcube):
-            if neighbor in hcubes:
-                active += 1
-            elif neighbor not in inactive:
-                candidates[neighbor] = candidates.get(neighbor, 0) + 1
-                if candidates[neighbor] > 3:
-                    inactive.add(neighbor)
-                    candidates.pop(neighbor)
-        if active in {2, 3}:
-            hcubes_after.add(hcube)
-    new_active = {hcube for hcube, count in candidates.items() if count == 3}
-    return hcubes_after | new_active
-
-
-def run_cycles(cubes: Grid, cycles: int) -> Grid:
-    for _ in range(cycles):
-        cubes = run_cycle(cubes)
-    return cubes
-
-
-def run_hcycles(hcubes: Hypergrid, cycles: int) -> Hypergrid:
-    for _ in range(cycles):
-        hcubes = run_hcycle(hcubes)
-    return hcubes
-
-
-def parse_active(lines: list[str]) -> Grid:
+
+def neighbor_offsets(dimensions: int) -> list[Cube]:
+    return [offset for offset in product([-1, 0, 1], repeat=dimensions) if any(offset)]
+
+
+# an active cube stays active with 2 or 3 active neighbors, an inactive one with 3 becomes active
+CUBES = SparseAutomaton(neighbor_offsets(3), birth={3}, survival={2, 3})
+HYPERCUBES = SparseAutomaton(neighbor_offsets(4), birth={3}, survival={2, 3})
+
+
+def run_cycles(automaton: SparseAutomaton, cubes: Grid, cycles: int) -> set[int]:
+    return automaton.run(cubes, cycles)
+
+
+def parse_active(lines: list[str], dimensions: int = 3) -> Grid:
     grid: Grid = set()
     for y, row in enumerate(lines):
         for x, cube in enumerate(row.strip()):
             if cube == "#":
-                grid.add((x, y, 0))
+                grid.add((x, y) + (0,) * (dimensions - 2))
     return grid
 
 
-def parse_hyper_active(lines: list[str]) -> Hypergrid:
-    hgrid: Hypergrid = set()
-    for y, row in enumerate(lines):
-        for x, hcube in enumerate(row.strip()):
-            if hcube == "#":
-                hgrid.add((x, y, 0, 0))
-    return hgrid
+def part_one(filename: str) -> int:
+    with open(filename) as file:
+        cubes = parse_active(file.readlines())
+    return len(run_cycles(CUBES, cubes, 6))
+
+
+def part_two(filename: str) -> int:
+    with open(filename) as file:
+        hcubes = parse_active(file.readlines(), dimensions=4)
+    return len(run_cycles(HYPERCUBES, hcubes, 6))
 
 
 if __name__ == "__main__":
     with open("sample.txt") as file:
         cubes = parse_active(file.readlines())
     
-    cubes = run_cycles(cubes, 6)
-    assert (result := len(cubes)) == 112, result
+    active = run_cycles(CUBES, cubes, 6)
+    assert (result := len(active)) == 112, result
 
     with open("sample.txt") as file:
-        hcubes = parse_hyper_active(file.readlines())
+        hcubes = parse_active(file.readlines(), dimensions=4)
     
-    hcubes = run_hcycles(hcubes, 6)
-    assert (result := len(hcubes)) == 848, result
+    active = run_cycles(HYPERCUBES, hcubes, 6)
+    assert (result := len(active)) == 848, result
 
-    with open("input.txt") as file:
-        cubes = parse_active(file.readlines())
-    
-    cubes = run_cycles(cubes, 6)
-    print(len(cubes))
-
-    with open("input.txt") as file:
-        hcubes = parse_hyper_active(file.readlines())
-    
-    hcubes = run_hcycles(hcubes, 6)
-    print(len(hcubes))
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
@@ -183,6 +183,18 @@ def eval_expression_order(expr: Expression) -> int:
             raise ValueError(f"Unknown expression: {expr}")
 
 
+def part_one(filename: str) -> int:
+    with open(filename) as file:
+        exprs = parse_expressions(file.readlines())
+    return sum(eval_expression(expr) for expr in exprs)
+
+
+def part_two(filename: str) -> int:
+    with open(filename) as file:
+        exprs = parse_expressions(file.readlines())
+    return sum(eval_expression_order(expr) for expr in exprs)
+
+
 if __name__ == "__main__":
     with open("sample.txt") as file:
         lines = file.readlines()
@@ -194,12 +206,5 @@ if __name__ == "__main__":
     results_ord = [eval_expression_order(expr) for expr in exprs]
     assert results_ord == [231, 51, 46, 1445, 669060, 23340], results_ord
 
-    with open("input.txt") as file:
-        lines = file.readlines()
-    exprs = parse_expressions(lines)
-
-    results = [eval_expression(expr) for expr in exprs]
-    print(sum(results))
-
-    results_ord = [eval_expression_order(expr) for expr in exprs]
-    print(sum(results_ord))
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
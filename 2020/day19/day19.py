@@ -133,6 +133,26 @@ def check_images_infinite(images: list[str], rules: Rules) -> list[str]:
     return valid_images
 
 
+def read_rules_and_images(filename: str) -> tuple[Rules, list[str]]:
+    with open(filename) as file:
+        itr = iter(file.readlines())
+    rules = parse_rules(itr)
+    return rules, [line.strip() for line in itr]
+
+
+def part_one(filename: str) -> int:
+    rules, images = read_rules_and_images(filename)
+    return len(check_images(images, rules))
+
+
+def part_two(filename: str) -> int:
+    rules, images = read_rules_and_images(filename)
+    # the looping rules of the second part, input2.txt holds the same replacement
+    rules[8] = Ref(seqs=[[42], [42, 8]])
+    rules[11] = Ref(seqs=[[42, 31], [42, 11, 31]])
+    return len(check_images_infinite(images, rules))
+
+
 if __name__ == "__main__":
     with open("sample.txt") as file:
         lines = file.readlines()
@@ -153,14 +173,7 @@ if __name__ == "__main__":
     assert len(valid_images) == 12, len(valid_images)
     print("samples work")
 
-    with open("input.txt") as file:
-        lines = file.readlines()
-    itr = iter(lines)
-    rules = parse_rules(itr)
-    images = list(line.strip() for line in itr)
-
-    valid_images = check_images(images, rules)
-    print(len(valid_images))
+    print(part_one("input.txt"))
 
     with open("input2.txt") as file:
         lines = file.readlines()
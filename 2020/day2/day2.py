@@ -30,6 +30,20 @@ def is_valid2(rule: Rule) -> bool:
     return (left == letter) ^ (right == letter)
 
 
+def read_rules(filename: str) -> list[Rule]:
+    with open(filename, "r") as file:
+        rules = [parse_rule_and_password(line) for line in file.readlines()]
+    return [rule for rule in rules if rule is not None]
+
+
+def part_one(filename: str) -> int:
+    return sum(1 for rule in read_rules(filename) if is_valid(rule))
+
+
+def part_two(filename: str) -> int:
+    return sum(1 for rule in read_rules(filename) if is_valid2(rule))
+
+
 if __name__ == "__main__":
     with open("sample.txt", "r") as file:
         rules = [parse_rule_and_password(line) for line in file.readlines()]
@@ -39,10 +53,5 @@ if __name__ == "__main__":
         total = sum(1 for rule in rules if rule is not None and is_valid2(rule))
         assert total == 1
 
-    with open("input.txt", "r") as file:
-        rules = [parse_rule_and_password(line) for line in file.readlines()]
-        assert all(rule is not None for rule in rules)
-        total = sum(1 for rule in rules if rule is not None and is_valid(rule))
-        print(total)
-        total = sum(1 for rule in rules if rule is not None and is_valid2(rule))
-        print(total)
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
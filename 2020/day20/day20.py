@@ -1,5 +1,5 @@
 from collections import deque
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 from typing import Optional
 from enum import Enum
 from math import sqrt
@@ -7,6 +7,8 @@ from functools import partial
 from operator import and_
 import re
 
+from aoc.inputs import split_records
+
 
 class Border(Enum):
     Up = 0
@@ -33,26 +35,13 @@ Arranged = dict[tuple[int, int], tuple[int, Tile]]
 NAME = re.compile(r"Tile (\d+)\:")
 
 
-def parse_tiles(lines: list[str]) -> deque[tuple[int, Tile]]:
+def parse_tiles(lines: Iterable[str]) -> deque[tuple[int, Tile]]:
     tiles: deque[tuple[int, Tile]] = deque()
-
-    tile_name: Optional[int] = None
-    current_tile: Tile = []
-    for line in lines:
-        line = line.strip()
-        if not line and tile_name is not None:
-            tiles.append((tile_name, current_tile))
-            current_tile = []
-            continue
-        match_ = NAME.match(line)
-        if match_ is not None:
-            tile_name = int(match_.groups()[0])
-        else:
-            current_tile.append([cell == "#" for cell in line])
-    else:
-        if tile_name is not None:
-            tiles.append((tile_name, current_tile))
-
+    for name, *rows in split_records(lines):
+        match_ = NAME.match(name)
+        if match_ is None:
+            raise ValueError(f"Bad tile header {name}")
+        tiles.append((int(match_.groups()[0]), [[cell == "#" for cell in row] for row in rows]))
     return tiles
 
 
@@ -219,6 +208,22 @@ def find_dragons(image: list[list[bool]]) -> int:
     print(num_dragons)
     return total - num_dragons * sum(not func(False) for row in DRAGON for func in row)
 
+
+def read_arrangement(filename: str) -> Arranged:
+    with open(filename) as file:
+        tiles = parse_tiles(file)
+    return arrange_tiles(tiles)
+
+
+def part_one(filename: str) -> int:
+    locations = get_locs(read_arrangement(filename))
+    return locations[0][0] * locations[0][-1] * locations[-1][0] * locations[-1][-1]
+
+
+def part_two(filename: str) -> int:
+    return find_dragons(get_image(read_arrangement(filename)))
+
+
 if __name__ == "__main__":
     with open("sample.txt") as file:
         lines = file.readlines()
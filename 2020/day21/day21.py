@@ -72,6 +72,22 @@ def get_canonical_dangerous_list(mapping: dict[str, str]) -> str:
     return ','.join(ingr for _, ingr in sorted(mapping.items(), key=lambda x: x[0]))
 
 
+def read_foods(filename: str) -> list[tuple[list[str], list[str]]]:
+    with open(filename) as file:
+        return parse_ingredients_and_allergies(file.readlines())
+
+
+def part_one(filename: str) -> int:
+    ingredients_and_allergies = read_foods(filename)
+    safe, _ = find_safe(ingredients_and_allergies)
+    return count_safe(ingredients_and_allergies, safe)
+
+
+def part_two(filename: str) -> str:
+    safe, possible = find_safe(read_foods(filename))
+    return get_canonical_dangerous_list(find_unsafe(remove_safe(safe, possible)))
+
+
 if __name__ == "__main__":
     with open("sample.txt") as file:
         lines = file.readlines()
@@ -83,12 +99,5 @@ if __name__ == "__main__":
     mapping = find_unsafe(possible)
     assert get_canonical_dangerous_list(mapping) == "mxmxvkd,sqjhc,fvjkl"
 
-    with open("input.txt") as file:
-        lines = file.readlines()
-    ingredients_and_allergies = parse_ingredients_and_allergies(lines)
-    certainly_safe, possible = find_safe(ingredients_and_allergies)
-    total = count_safe(ingredients_and_allergies, certainly_safe)
-    print(total)
-    possible = remove_safe(safe, possible)
-    mapping = find_unsafe(possible)
-    print(get_canonical_dangerous_list(mapping))
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
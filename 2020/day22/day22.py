@@ -1,5 +1,10 @@
 from collections import deque
 
+from aoc.counters import count
+
+# peak rss in MiB, the recursive games keep every seen pair of decks
+MEMORY_BUDGET_MIB = 64
+
 
 def parse_decks(lines: list[str]) -> tuple[deque[int], deque[int]]:
     left, right = deque[int](), deque[int]()
@@ -70,15 +75,31 @@ def run_recur_game(left: deque[int], right: deque[int]) -> tuple[bool, deque[int
             raise ValueError("Cards should be unique!")
         pair = tuple([tuple(left), tuple(right)])
         if pair in seen_before:
+            count("recursive game states", len(seen_before))
             return True, left
         else:
             seen_before.add(pair)
 
+    count("recursive game states", len(seen_before))
     if left:
         return True, left
     return False, right
 
 
+def read_decks(filename: str) -> tuple[deque[int], deque[int]]:
+    with open(filename) as file:
+        return parse_decks(file.readlines())
+
+
+def part_one(filename: str) -> int:
+    return count_score(run_game(*read_decks(filename)))
+
+
+def part_two(filename: str) -> int:
+    _, deck = run_recur_game(*read_decks(filename))
+    return count_score(deck)
+
+
 if __name__ == "__main__":
     with open("sample.txt") as file:
         lines = file.readlines()
@@ -91,13 +112,5 @@ if __name__ == "__main__":
     score = count_score(deck)
     assert score == 291
 
-    with open("input.txt") as file:
-        lines = file.readlines()
-    left, right = parse_decks(lines)
-    deck = run_game(left.copy(), right.copy())
-    score = count_score(deck)
-    print(score)
-
-    winner, deck = run_recur_game(left.copy(), right.copy())
-    score = count_score(deck)
-    print(winner, score)
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
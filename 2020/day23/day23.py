@@ -1,5 +1,10 @@
 from itertools import cycle, takewhile, islice
 
+from aoc.variants import Registry
+
+# peak rss in MiB, part two links a million cups
+MEMORY_BUDGET_MIB = {1: 64, 2: 256}
+
 
 def find_destination(start: int, min_: int, max_: int, picked_up: list[int]) -> int:
     start -= 1
@@ -83,6 +88,42 @@ def order(cups: list[int]) -> list[int]:
     return list(takewhile(lambda x: x != 1, circle))
 
 
+# the variants leave the circle rotated differently, so they are compared from cup 1,
+# costs are microseconds per round for a circle of n cups
+play = Registry(
+    "play",
+    size=lambda cups, rounds: len(cups),
+    examples=lambda: [
+        ([3, 8, 9, 1, 2, 5, 4, 6, 7], 10),
+        ([3, 8, 9, 1, 2, 5, 4, 6, 7], 100),
+        (list(range(500, 0, -1)), 500),
+    ],
+    canonical=order,
+)
+play.add(run, "n", scale=0.18, overhead=4.0)
+play.add(run_faster, "n", scale=0.011, overhead=2.7)
+play.add(run_even_faster, "1", overhead=1.7)
+
+
+def read_cups(filename: str) -> list[int]:
+    # one digit per cup, or comma separated labels for circles with more than nine cups
+    with open(filename) as file:
+        line = file.readline().strip()
+    return [int(i) for i in (line.split(",") if "," in line else line)]
+
+
+def part_one(filename: str) -> str:
+    return ''.join(str(i) for i in order(play(read_cups(filename), 100)))
+
+
+def part_two(filename: str) -> int:
+    cups = read_cups(filename)
+    cups.extend(range(max(cups) + 1, 1_000_001))
+    shifted = play(cups, 10_000_000)
+    idx = shifted.index(1)
+    return shifted[(idx + 1) % len(shifted)] * shifted[(idx + 2) % len(shifted)]
+
+
 if __name__ == "__main__":
     cups = [int(i) for i in "389125467"]
     shifted = run_even_faster(cups, 10)
@@ -100,15 +141,6 @@ if __name__ == "__main__":
     result = shifted[idx + 1] * shifted[idx + 2] 
     assert result == 149245887792, result
 
-    cups = [int(i) for i in "583976241"]
-    shifted = run_faster(cups, 100)
-    ordered = order(shifted)
-    print(''.join(str(i) for i in ordered))
-
-    cups = [int(i) for i in "583976241"] 
-    cups.extend(range(10, 1_000_001))
-    shifted = run_even_faster(cups, 10_000_000)
-    idx = shifted.index(1)
-    result = shifted[idx + 1] * shifted[idx + 2] 
-    print(result)
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
 
@@ -0,0 +1,27 @@
+import random
+import sys
+from types import ModuleType
+
+# cups in the circle, part two plays 10 million rounds with a million cups
+SIZES = (5_000, 10_000, 20_000, 40_000, 80_000)
+
+# rounds played per cup, the same ratio as in part two
+ROUNDS_PER_CUP = 10
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """A shuffled circle of cups labelled 1 to `size`."""
+    cups = list(range(1, size + 1))
+    random.Random(seed).shuffle(cups)
+    if size <= 9:
+        return "".join(str(cup) for cup in cups) + "\n"
+    return ",".join(str(cup) for cup in cups) + "\n"
+
+
+def workload(solution: ModuleType, filename: str) -> list[int]:
+    cups = solution.read_cups(filename)
+    return solution.run_even_faster(cups, ROUNDS_PER_CUP * len(cups))
+
+
+if __name__ == "__main__":
+    print(generate(int(sys.argv[1]), int(sys.argv[2]) if len(sys.argv) > 2 else 0), end="")
@@ -1,18 +1,25 @@
 from typing import Optional
-from collections.abc import Iterator, Generator
+from collections.abc import Iterator
 from itertools import chain
-from functools import reduce
 
+from aoc.automaton import SparseAutomaton
 
-MAPPING: dict[str, tuple[float, float]] = {
-    "ne": (1/2, 1/2),
-    "se": (1/2, -1/2),
-    "w": (-1, 0),
-    "e": (1, 0),
-    "nw": (-1/2, 1/2),
-    "sw": (-1/2, -1/2)
+
+Tile = tuple[int, int]
+
+# doubled width coordinates, east and west move two columns so the diagonals stay integral
+MAPPING: dict[str, Tile] = {
+    "ne": (1, 1),
+    "se": (1, -1),
+    "w": (-2, 0),
+    "e": (2, 0),
+    "nw": (-1, 1),
+    "sw": (-1, -1)
 }
 
+# a black tile with zero or more than two black neighbors turns white, a white one with two turns black
+FLOOR = SparseAutomaton(MAPPING.values(), birth={2}, survival={1, 2})
+
 
 def peek(itr: Iterator[str]) -> tuple[Optional[str], Iterator[str]]:
     try:
@@ -22,9 +29,9 @@ def peek(itr: Iterator[str]) -> tuple[Optional[str], Iterator[str]]:
     return elem, chain([elem], itr)
 
 
-def parse_tile(line: str) -> tuple[float, float]:
+def parse_tile(line: str) -> Tile:
     itr = iter(line)
-    tile: tuple[float, float] = (0., 0.)
+    tile: Tile = (0, 0)
     while True:
         elem, itr = peek(itr)
         if elem is None:
@@ -39,8 +46,8 @@ def parse_tile(line: str) -> tuple[float, float]:
     return tile
 
 
-def parse_tiles(lines: list[str]) -> list[tuple[float, float]]:
-    tiles: list[tuple[float, float]] = []
+def parse_tiles(lines: list[str]) -> list[Tile]:
+    tiles: list[Tile] = []
     for line in lines:
         line = line.strip()
         tile = parse_tile(line)
@@ -48,44 +55,34 @@ def parse_tiles(lines: list[str]) -> list[tuple[float, float]]:
     return tiles
 
 
-def flip_tiles(tiles:list[tuple[float, float]]) -> dict[tuple[float, float], bool]:
-    flipped: dict[tuple[float, float], bool] = {}
+def flip_tiles(tiles: list[Tile]) -> set[Tile]:
+    """The tiles flipped an odd number of times, which show their black side."""
+    black: set[Tile] = set()
     for tile in tiles:
-        flipped[tile] = not flipped.get(tile, False)
-    return flipped
+        black ^= {tile}
+    return black
 
 
-def count_black(tiles: dict[tuple[float, float], bool]):
-    return sum(color for color in tiles.values())
+def count_black(tiles: set[Tile] | set[int]) -> int:
+    return len(tiles)
 
 
-def get_neighboors(tile: tuple[float, float]) -> Generator[tuple[float, float], None, None]:
-    for other in MAPPING.values():
-        yield (tile[0] + other[0], tile[1] + other[1])
+def run(tiles: set[Tile], days: int) -> set[int]:
+    return FLOOR.run(tiles, days)
 
 
-def run_day(tiles: dict[tuple[float, float], bool]) -> dict[tuple[float, float], bool]:
-    expanded: dict[tuple[float, float], bool] = {}
-    for tile, color in tiles.items():
-        for neighbor in get_neighboors(tile):
-            if neighbor not in tiles:
-                expanded[neighbor] = False
-            expanded[tile] = color
+def read_flipped(filename: str) -> set[Tile]:
+    with open(filename) as file:
+        return flip_tiles(parse_tiles(file.readlines()))
 
-    new_tiles: dict[tuple[float, float], bool] = {}
-    for tile, color in expanded.items():
-        total = sum(tiles[other] for other in get_neighboors(tile) if other in tiles)
-        if color and (total == 0 or total > 2):
-            new_tiles[tile] = not color
-        elif not color and total == 2:
-            new_tiles[tile] = not color
-        else:
-            new_tiles[tile] = color
-    return new_tiles
 
+def part_one(filename: str) -> int:
+    return count_black(read_flipped(filename))
+
+
+def part_two(filename: str) -> int:
+    return count_black(run(read_flipped(filename), 100))
 
-def run(tiles: dict[tuple[float, float], bool], days: int) -> dict[tuple[float, float], bool]:
-    return reduce(lambda agg, _: run_day(agg), range(days), tiles)
 
 if __name__ == "__main__":
     with open("sample.txt") as file:
@@ -95,19 +92,10 @@ if __name__ == "__main__":
     black = count_black(flipped)
     assert black == 10, black
     
-    flipped = run(flipped, 100)
-    black = count_black(flipped)
+    black = count_black(run(flipped, 100))
     assert black == 2208, black
     
     print("tests okay")
 
-    with open("input.txt") as file:
-        lines = file.readlines()
-    tiles = parse_tiles(lines)
-    flipped = flip_tiles(tiles)
-    black = count_black(flipped)
-    print(black)
-
-    flipped = run(flipped, 100)
-    black = count_black(flipped)
-    print(black)
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
@@ -1,23 +1,40 @@
+from collections.abc import Sequence
 from typing import Optional
 
+from aoc.numtheory import discrete_log, modpow
+
+# peak rss in MiB, the baby-step table of find_loop_size is bounded
+MEMORY_BUDGET_MIB = 64
+
+MODULUS = 20201227
+
 
 def transform_key(subject_number: int, loop_size: int, start_value: int = 1) -> int:
-    value = start_value
-    for _ in range(loop_size):
-        value = value * subject_number
-        value = value % 20201227
-    return value
+    return start_value * pow(subject_number, loop_size, MODULUS) % MODULUS
+
+
+def transform_keys(subject_numbers: Sequence[int], loop_size: int) -> list[int]:
+    """Every subject number transformed with the same loop size."""
+    return modpow(subject_numbers, loop_size, MODULUS)
 
 
 def find_loop_size(subject_number: int, known_key: int) -> Optional[int]:
-    memo: dict[int, int] = {0: 1}
-    total_loops = 0
-    while True:
-        key = transform_key(subject_number, 1, memo[total_loops])
-        total_loops += 1
-        memo[total_loops] = key
-        if key == known_key:
-            return total_loops
+    loop_size = discrete_log(subject_number, known_key, MODULUS, order=MODULUS - 1)
+    # a loop size of zero is no loop, a key of 1 comes back after a full turn of the group
+    return MODULUS - 1 if loop_size == 0 else loop_size
+
+
+def part_one(filename: str) -> Optional[int]:
+    with open(filename) as file:
+        card_key, door_key = (int(line.strip()) for line in file.readlines())
+    card_loop_size = find_loop_size(7, card_key)
+    if card_loop_size is None:
+        return None
+    # the card's loop size gives back its public key from 7 and the encryption key from the door's
+    public_key, encryption_key = transform_keys([7, door_key], card_loop_size)
+    if public_key != card_key:
+        raise ValueError(f"Loop size {card_loop_size} does not give the card key {card_key}")
+    return encryption_key
 
 
 if __name__ == "__main__":
@@ -1,12 +1,14 @@
 from math import prod
 
-Grid = list[str]
+from aoc.grid import Grid
+
+TREE = ord("#")
 
 
 def slope(cur: tuple[int, int], move: tuple[int, int], grid: Grid) -> tuple[int, int]:
     horizontal, vertical = cur
     right, down = move
-    border_h = len(grid[0])
+    border_h = grid.width
     new_horizontal = horizontal + right
     if new_horizontal >= border_h:
         new_horizontal = new_horizontal % border_h
@@ -16,18 +18,41 @@ def slope(cur: tuple[int, int], move: tuple[int, int], grid: Grid) -> tuple[int,
 
 def finished(cur: tuple[int, int], grid: Grid) -> bool:
     _, vertical = cur
-    return vertical >= len(grid)
+    return vertical >= grid.height
 
 def is_tree(cur: tuple[int, int], grid: Grid) -> bool:
     horizontal, vertical = cur
-    square = grid[vertical][horizontal]
-    return square == "#"
+    return grid[vertical, horizontal] == TREE
+
+
+MOVES = [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2)]
+
+
+def count_trees(move: tuple[int, int], grid: Grid) -> int:
+    cur = (0, 0)
+    total = 0
+    while not finished(cur, grid):
+        total += is_tree(cur, grid)
+        cur = slope(cur, move, grid)
+    return total
+
+
+def read_grid(filename: str) -> Grid:
+    return Grid.read(filename)
+
+
+def part_one(filename: str) -> int:
+    return count_trees((3, 1), read_grid(filename))
+
+
+def part_two(filename: str) -> int:
+    grid = read_grid(filename)
+    return prod(count_trees(move, grid) for move in MOVES)
 
 
 if __name__ == "__main__":
     moves = [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2)]
-    with open("sample.txt", "r") as file:
-        grid = [line.strip() for line in file.readlines()]
+    grid = read_grid("sample.txt")
     trees: list[int] = []
     for move in moves:
         cur = (0, 0)
@@ -38,14 +63,4 @@ if __name__ == "__main__":
         trees.append(total)
     assert trees[1] == 7 and prod(trees) == 336
        
-    with open("input.txt", "r") as file:
-        grid = [line.strip() for line in file.readlines()]
-    trees: list[int] = []
-    for move in moves:
-        cur = (0, 0)
-        total = 0
-        while not finished(cur, grid):
-            total += is_tree(cur, grid)
-            cur = slope(cur, move, grid)
-        trees.append(total)
-    print(trees[1], prod(trees))
+    print(part_one("input.txt"), part_two("input.txt"))
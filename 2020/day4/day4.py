@@ -1,4 +1,7 @@
 import re
+from collections.abc import Iterable, Iterator
+
+from aoc.inputs import split_records
 
 
 Record = dict[str, str]
@@ -45,23 +48,29 @@ def check_field(key: str, value:str) -> bool:
         return all(letter.isdigit() for letter in value) and len(value) == 9
     return key in OPTIONAL
 
-def parse_text(text:list[str]) -> list[Record]:
-    records: list[Record] = []
-    record: Record = {}
-    for line in text:
-        line = line.strip()
-        if not line:
-            records.append(record)
-            record = {}
-            continue
-        pairs = line.split()
-        for pair in pairs:
-            key, value = pair.split(":")
-            if check_field(key, value):
-                record[key] = value
-    else:
-        records.append(record)
-    return records
+def parse_text(text: Iterable[str], strict: bool = True) -> Iterator[Record]:
+    for lines in split_records(text):
+        record: Record = {}
+        for line in lines:
+            for pair in line.split():
+                key, value = pair.split(":")
+                if not strict or check_field(key, value):
+                    record[key] = value
+        yield record
+
+
+def is_complete(record: Record) -> bool:
+    return FIELDS.difference(record.keys()) in [set(), OPTIONAL]
+
+
+def part_one(filename: str) -> int:
+    with open(filename) as file:
+        return sum(1 for record in parse_text(file, strict=False) if is_complete(record))
+
+
+def part_two(filename: str) -> int:
+    with open(filename) as file:
+        return sum(1 for record in parse_text(file) if is_complete(record))
 
 
 if __name__ == "__main__":
@@ -70,8 +79,6 @@ if __name__ == "__main__":
     records = parse_text(text) 
     assert 2 == (total := sum(1 for record in records if FIELDS.difference(record.keys()) in [set(), OPTIONAL])), total
 
-    with open("input.txt") as file:
-        text = file.readlines()
-    records = parse_text(text) 
-    print(sum(1 for record in records if FIELDS.difference(record.keys()) in [set(), OPTIONAL]))
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
 
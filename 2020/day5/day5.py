@@ -41,6 +41,20 @@ def find_missing(ids: list[int]) -> int:
     contiguous = range(first, last + 1)
     return set(contiguous).difference(set(ids)).pop()
 
+
+def read_ids(filename: str) -> list[int]:
+    with open(filename) as file:
+        return [get_id(*find_seat(line.strip())) for line in file.readlines()]
+
+
+def part_one(filename: str) -> int:
+    return max(read_ids(filename))
+
+
+def part_two(filename: str) -> int:
+    return find_missing(read_ids(filename))
+
+
 if __name__ == "__main__":
     with open("sample.txt") as file:
         seats: list[tuple[int, int]] = []
@@ -49,10 +63,5 @@ if __name__ == "__main__":
             seats.append(seat)
     assert [get_id(*seat) for seat in seats] == [567, 119, 820]
 
-    with open("input.txt") as file:
-        seats: list[tuple[int, int]] = []
-        for line in file.readlines():
-            seat = find_seat(line.strip())
-            seats.append(seat)
-    print(max(get_id(*seat) for seat in seats))
-    print(find_missing([get_id(*seat) for seat in seats]))
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
@@ -1,19 +1,10 @@
-from typing import Iterable
+from collections.abc import Iterable, Iterator
 
+from aoc.inputs import split_records
 
-def parse_groups(text: Iterable[str]) -> list[list[str]]:
-    groups: list[list[str]] = []
-    group: list[str] = []
-    for line in text:
-        line = line.strip()
-        if not line:
-            groups.append(group)
-            group = []
-        else:
-            group.append(line)
-    else:
-        groups.append(group)
-    return groups
+
+def parse_groups(text: Iterable[str]) -> Iterator[list[str]]:
+    return split_records(text)
 
 
 def count_group(group: list[str]) -> int:
@@ -28,20 +19,25 @@ def count_everyone_group(group: list[str]) -> int:
     return len(common)
 
 
+def part_one(filename: str) -> int:
+    with open(filename) as file:
+        return sum(count_group(group) for group in parse_groups(file))
+
+
+def part_two(filename: str) -> int:
+    with open(filename) as file:
+        return sum(count_everyone_group(group) for group in parse_groups(file))
+
+
 if __name__ == "__main__":
     with open("sample.txt") as file:
-        groups = parse_groups(file.readlines())
+        groups = list(parse_groups(file.readlines()))
     total: int = sum(count_group(group) for group in groups)
     assert total == 11, total
 
     total = sum(count_everyone_group(group) for group in groups)
     assert total == 6, total
 
-    with open("input.txt") as file:
-        groups = parse_groups(file.readlines())
-    total = sum(count_group(group) for group in groups)
-    print(total)
-
-    total = sum(count_everyone_group(group) for group in groups)
-    print(total)
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
 
@@ -2,6 +2,8 @@ from typing import Optional
 from collections.abc import Iterable
 import re
 
+from aoc.graph import Graph
+
 
 Bag = str
 Rules = dict[Bag, Optional[list[tuple[int, Bag]]]]
@@ -36,37 +38,42 @@ def parse_rules(text: Iterable[str]) -> Rules:
     return rules
 
 
+def make_graph(rules: Rules) -> Graph:
+    """Edges from every bag to the bags directly inside of it, weighted by their count."""
+    return Graph.from_edges(
+        ((container, name, count) for container, contained in rules.items() for count, name in contained or ()),
+        nodes=rules,
+    )
+
+
 def count_contained(bag: Bag, rules: Rules) -> int:
-    stack: list[Bag] = [bag]
-    found: set[Bag] = set()
-    while stack:
-        bag = stack.pop()
-        for container, contained in rules.items():
-            if contained is not None:
-                for _, name in contained:
-                    if bag == name:
-                        stack.append(container)
-                        found.add(container)
-    return len(found)
-
-
-def count_inside(bag: Bag, rules: Rules, root: bool) -> int:
-    contained = rules[bag]
-    if contained is not None:
-        if not root:
-            return 1 + sum(size * count_inside(other, rules, False) for size, other in contained)
-        else:
-            return sum(size * count_inside(other, rules, False) for size, other in contained)
-    return 1
+    graph = make_graph(rules).reverse()
+    return len(graph.reachable(graph.id(bag))) - 1
+
+
+def count_inside(bag: Bag, rules: Rules) -> int:
+    graph = make_graph(rules)
+    inside = graph.fold(lambda _, contained: sum(count * (1 + size) for count, size in contained))
+    return inside[graph.id(bag)]
+
+
+def part_one(filename: str) -> int:
+    with open(filename, "r") as file:
+        rules = parse_rules(file.readlines())
+    return count_contained("shiny gold bags", rules)
+
+
+def part_two(filename: str) -> int:
+    with open(filename, "r") as file:
+        rules = parse_rules(file.readlines())
+    return count_inside("shiny gold bags", rules)
 
 
 if __name__ == "__main__":
     with open("sample.txt", "r") as file:
         rules = parse_rules(file.readlines())
     assert (result := count_contained("shiny gold bags", rules)) == 4, result
-    assert (result := count_inside("shiny gold bags", rules, True)) == 32, result
+    assert (result := count_inside("shiny gold bags", rules)) == 32, result
 
-    with open("input.txt", "r") as file:
-        rules = parse_rules(file.readlines())
-    print(count_contained("shiny gold bags", rules))
-    print(count_inside("shiny gold bags", rules, True))
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
@@ -68,6 +68,20 @@ def find_terminating_program(program: Program) -> Optional[int]:
             return acc
 
 
+def read_program(filename: str) -> Program:
+    with open(filename, "r") as file:
+        return {id_: parse_command(line) for id_, line in enumerate(file.readlines())}
+
+
+def part_one(filename: str) -> int:
+    acc, _ = run_program(read_program(filename))
+    return acc
+
+
+def part_two(filename: str) -> Optional[int]:
+    return find_terminating_program(read_program(filename))
+
+
 if __name__ == "__main__":
     program: Program = {}
     with open("sample.txt", "r") as file:
@@ -79,13 +93,6 @@ if __name__ == "__main__":
 
     assert (result := find_terminating_program(program)) == 8, result
 
-    program = {}
-    with open("input.txt", "r") as file:
-        for id_, line in enumerate(file.readlines()):
-            cmd = parse_command(line)
-            program[id_] = cmd
-    acc, _ = run_program(program)
-    print(acc)
-
-    print(find_terminating_program(program))
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
 
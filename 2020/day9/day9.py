@@ -34,6 +34,31 @@ def find_range(number:int, history: list[int]) -> Optional[list[int]]:
                 return history[idx1:idx2 + 1]
 
 
+def read_history(filename: str) -> list[int]:
+    with open(filename, "r") as file:
+        return [int(line.strip()) for line in file.readlines()]
+
+
+def find_invalid(history: list[int], preamble: int = 25) -> Optional[int]:
+    numbers = iter(history)
+    first = get_first_n(preamble, numbers)
+    result = check_numbers(first, numbers)
+    return result[0] if result is not None else None
+
+
+def part_one(filename: str) -> Optional[int]:
+    return find_invalid(read_history(filename))
+
+
+def part_two(filename: str) -> Optional[int]:
+    history = read_history(filename)
+    number = find_invalid(history)
+    if number is None:
+        return None
+    rng = find_range(number, history)
+    return min(rng) + max(rng) if rng is not None else None
+
+
 if __name__ == "__main__":
     with open("sample.txt", "r") as file:
         history = [int(line.strip()) for line in file.readlines()]
@@ -45,14 +70,5 @@ if __name__ == "__main__":
     rng = find_range(number, history)
     assert rng is not None and min(rng) + max(rng) == 62
 
-    with open("input.txt", "r") as file:
-        history = [int(line.strip()) for line in file.readlines()]
-    numbers = iter(history)
-    first = get_first_n(25, numbers)
-    result = check_numbers(first, numbers)
-    if result is not None: 
-        print(result[0])
-        number = result[0]
-        rng = find_range(number, history)
-        if rng is not None:
-            print(min(rng) + max(rng))
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
@@ -1,8 +1,10 @@
 from typing import Optional
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 from collections import deque, Counter
 from itertools import product, combinations
 
+from aoc.inputs import split_records
+
 
 Point = tuple[int, int, int]
 
@@ -88,21 +90,16 @@ def overlap_cubes(cube: set[Point], other: set[Point]) -> Optional[set[Point]]:
         return max(candidates, key=lambda cand: len(cube & cand))
         
 
-def parse_scanners(lines: list[str]) -> deque[set[Point]]:
+def parse_scanners(lines: Iterable[str]) -> deque[set[Point]]:
     scanners: deque[set[Point]] = deque()
-    scanner: set[Point] = set()
-    for line in lines:
-        line = line.strip()
-        if line.startswith("---"):
-            continue
-        elif not line:
-            scanners.append(scanner)
-            scanner = set()
-        else:
+    for record in split_records(lines):
+        scanner: set[Point] = set()
+        for line in record:
+            if line.startswith("---"):
+                continue
             x, y, z  = line.split(",")
             point: Point = (int(x), int(y), int(z))
             scanner.add(point)
-    else:
         scanners.append(scanner)
     return scanners
 
@@ -138,6 +135,13 @@ def merge_scanners(scanners: deque[set[Point]]) -> Optional[set[Point]]:
     return final
 
 
+def part_one(filename: str) -> Optional[int]:
+    with open(filename) as file:
+        scanners = parse_scanners(file)
+    merged = merge_scanners(scanners)
+    return len(merged) if merged is not None else None
+
+
 if __name__ == "__main__":
     with open("sample.txt") as file:
         lines = file.readlines() 
@@ -77,11 +77,16 @@ def find_pairs(lines: list[str], literal: bool = False) -> list[int]:
     return pairs
 
 
-if __name__ == "__main__":
-    with open("input.txt") as file:
-        lines = file.readlines()
-    pairs = find_pairs(lines)
-    print(sum(pairs))
+def part_one(filename: str) -> int:
+    with open(filename) as file:
+        return sum(find_pairs(file.readlines()))
+
+
+def part_two(filename: str) -> int:
+    with open(filename) as file:
+        return sum(find_pairs(file.readlines(), literal=True))
 
-    actual_pairs = find_pairs(lines, literal=True)
-    print(sum(actual_pairs))
+
+if __name__ == "__main__":
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
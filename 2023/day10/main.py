@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from enum import Enum, IntEnum
 
+from aoc.grid import Grid
+
 
 class Side(IntEnum):
     North = 1
@@ -68,59 +70,50 @@ class Tile:
                 raise ValueError(f"Invalid pipe {pipe}")
 
 
+# pipe characters, in the order of the Pipe values
+CHARS = "|-LJ7FS."
+
+START = ord("S")
+
+
 @dataclass
 class TileGrid:
-    _grid: list[list[Tile]]
+    _grid: Grid
     _start: tuple[int, int]
 
     @classmethod
     def parse_pipes_with_start(cls, lines: list[str]) -> "TileGrid":
-        grid: list[list[Pipe]] = []
-        start: tuple[int, int] | None = None
-        for y, line in enumerate(lines):
-            row: list[Pipe] = []
-            for x, elem in enumerate(line.strip()):
-                pipe = Pipe.parse_pipe(elem)
-                if pipe == Pipe.Start:
-                    start = (x, y)
-                row.append(pipe)
-            grid.append(row)
-        if start is not None:
-            start_pipe = cls._figure_out_start(grid, start)
-            return cls(
-                _grid=[
-                    [
-                        Tile.create_with_sides(
-                            pipe if pipe != Pipe.Start else start_pipe
-                        )
-                        for pipe in row
-                    ]
-                    for row in grid
-                ],
-                _start=start,
-            )
+        grid = Grid.parse(lines)
+        found = grid.find(START)
+        if found is not None:
+            row, col = found
+            start = (col, row)
+            grid[row, col] = ord(CHARS[cls._figure_out_start(grid, start).value - 1])
+            return cls(_grid=grid, _start=start)
         raise ValueError(f"Bad input {lines}")
 
     @staticmethod
-    def _figure_out_start(grid: list[list[Pipe]], loc: tuple[int, int]) -> Pipe:
+    def _pipe(grid: Grid, x: int, y: int) -> Pipe:
+        return Pipe.parse_pipe(chr(grid[y, x]))
+
+    @staticmethod
+    def _figure_out_start(grid: Grid, loc: tuple[int, int]) -> Pipe:
         x, y = loc
         next_tiles: list[Side] = []
-        size_y = len(grid)
-        size_x = len(grid[0])
-        if x - 1 <= 0:
-            pipe = grid[y][x - 1]
+        if x - 1 >= 0:
+            pipe = TileGrid._pipe(grid, x - 1, y)
             if pipe in {Pipe.WestToEast, Pipe.SouthToEast, Pipe.NorthToEast}:
                 next_tiles.append(Side.West)
-        if x + 1 < size_x:
-            pipe = grid[y][x + 1]
+        if x + 1 < grid.width:
+            pipe = TileGrid._pipe(grid, x + 1, y)
             if pipe in {Pipe.WestToEast, Pipe.NorthToWest, Pipe.SouthToWest}:
                 next_tiles.append(Side.East)
-        if y + 1 < size_y:
-            pipe = grid[y + 1][x]
+        if y + 1 < grid.height:
+            pipe = TileGrid._pipe(grid, x, y + 1)
             if pipe in {Pipe.NorthToEast, Pipe.NorthToSouth, Pipe.NorthToWest}:
                 next_tiles.append(Side.South)
         if y - 1 >= 0:
-            pipe = grid[y - 1][x]
+            pipe = TileGrid._pipe(grid, x, y - 1)
             if pipe in {Pipe.SouthToEast, Pipe.SouthToWest, Pipe.NorthToSouth}:
                 next_tiles.append(Side.North)
 
@@ -142,7 +135,7 @@ class TileGrid:
 
     def __getitem__(self, loc: tuple[int, int]) -> Tile:
         x, y = loc
-        return self._grid[y][x]
+        return TILES[self._grid[y, x]]
 
     def _get_next(
         self, loc: tuple[int, int], side: Side, tile: Tile
@@ -196,7 +189,8 @@ class TileGrid:
             count = False
             parallel: Pipe | None = None
             # somehow account for parallel pipes
-            for x, tile in enumerate(row):
+            for x, char in enumerate(row):
+                tile = TILES[char]
                 if (x, y) in loop:
                     match (tile.pipe, parallel):
                         case (Pipe.SouthToEast, None):
@@ -224,6 +218,25 @@ class TileGrid:
         return area
 
 
+# tiles of every pipe, by the character code of the pipe
+TILES = {
+    ord(char): Tile.create_with_sides(Pipe.parse_pipe(char)) for char in CHARS if char != "S"
+}
+
+
+def read_tilegrid(filename: str) -> TileGrid:
+    with open(filename) as file:
+        return TileGrid.parse_pipes_with_start(file.readlines())
+
+
+def part_one(filename: str) -> int:
+    return len(read_tilegrid(filename).get_loop()) // 2
+
+
+def part_two(filename: str) -> int:
+    return read_tilegrid(filename).count_inside_area()
+
+
 if __name__ == "__main__":
     with open("sample.txt") as file:
         tilegrid = TileGrid.parse_pipes_with_start(file.readlines())
@@ -235,9 +248,5 @@ if __name__ == "__main__":
     area = tilegrid.count_inside_area()
     assert area == 8, area
 
-    with open("input.txt") as file:
-        tilegrid = TileGrid.parse_pipes_with_start(file.readlines())
-    loop = tilegrid.get_loop()
-    print(len(loop) // 2)
-
-    print(tilegrid.count_inside_area())
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
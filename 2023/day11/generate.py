@@ -0,0 +1,37 @@
+import math
+import random
+import sys
+from types import ModuleType
+
+# galaxy counts, the real input has about 435 galaxies on a 140 x 140 image
+SIZES = (50, 100, 200, 400, 800)
+
+DENSITY = 0.022
+EMPTY_SHARE = 0.05
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """An image with `size` galaxies and a few empty rows and columns to expand."""
+    rng = random.Random(seed)
+    side = max(3, math.ceil(math.sqrt(size / DENSITY)))
+    empty_rows = set(rng.sample(range(side), max(1, int(side * EMPTY_SHARE))))
+    empty_cols = set(rng.sample(range(side), max(1, int(side * EMPTY_SHARE))))
+    free = [
+        (row, col)
+        for row in range(side)
+        if row not in empty_rows
+        for col in range(side)
+        if col not in empty_cols
+    ]
+    galaxies = set(rng.sample(free, min(size, len(free))))
+    return "\n".join(
+        "".join("#" if (row, col) in galaxies else "." for col in range(side)) for row in range(side)
+    ) + "\n"
+
+
+def workload(solution: ModuleType, filename: str) -> int:
+    return solution.read_galaxies(filename).compute_shortest_distance_between_all_pairs(2)
+
+
+if __name__ == "__main__":
+    print(generate(int(sys.argv[1]), int(sys.argv[2]) if len(sys.argv) > 2 else 0), end="")
@@ -1,32 +1,29 @@
 from dataclasses import dataclass
 from itertools import combinations
 
+from aoc.grid import Grid
+
 Coord = tuple[int, int]
 Pair = tuple[Coord, Coord]
 
+GALAXY = ord("#")
+
 
 @dataclass
 class Galaxies:
-    _grid: list[list[bool]]
+    _grid: Grid
     _empty_rows: set[int]
     _empty_cols: set[int]
 
     @classmethod
     def parse(cls, lines: list[str]) -> "Galaxies":
-        grid = [[elem == "#" for elem in line.strip()] for line in lines]
-        empty_rows = {idx for idx, row in enumerate(grid) if not any(row)}
-        empty_cols = {
-            idx for idx, _ in enumerate(grid[0]) if not any(row[idx] for row in grid)
-        }
+        grid = Grid.parse(lines)
+        empty_rows = {idx for idx in range(grid.height) if GALAXY not in grid.row(idx)}
+        empty_cols = {idx for idx in range(grid.width) if GALAXY not in grid.column(idx)}
         return cls(grid, empty_rows, empty_cols)
 
     def _find_galaxies(self) -> list[Coord]:
-        return [
-            (idx, jdx)
-            for idx, row in enumerate(self._grid)
-            for jdx, elem in enumerate(row)
-            if elem
-        ]
+        return list(self._grid.find_all(GALAXY))
 
     def _count_empty_between(self, pair: Pair) -> tuple[int, int]:
         (left_row, left_col), (right_row, right_col) = pair
@@ -58,6 +55,19 @@ class Galaxies:
         )
 
 
+def read_galaxies(filename: str) -> Galaxies:
+    with open(filename) as file:
+        return Galaxies.parse(file.readlines())
+
+
+def part_one(filename: str) -> int:
+    return read_galaxies(filename).compute_shortest_distance_between_all_pairs(2)
+
+
+def part_two(filename: str) -> int:
+    return read_galaxies(filename).compute_shortest_distance_between_all_pairs(1_000_000)
+
+
 if __name__ == "__main__":
     with open("sample.txt") as file:
         galaxies = Galaxies.parse(file.readlines())
@@ -70,10 +80,5 @@ if __name__ == "__main__":
     distance = galaxies.compute_shortest_distance_between_all_pairs(100)
     assert distance == 8410, distance
 
-    with open("input.txt") as file:
-        galaxies = Galaxies.parse(file.readlines())
-    distance = galaxies.compute_shortest_distance_between_all_pairs(2)
-    print(distance)
-
-    distance = galaxies.compute_shortest_distance_between_all_pairs(1_000_000)
-    print(distance)
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
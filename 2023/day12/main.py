@@ -3,6 +3,8 @@ from enum import Enum
 from itertools import repeat, chain
 from functools import reduce
 
+from aoc.counters import count
+
 
 class Spring(Enum):
     Okay = 1
@@ -38,8 +40,11 @@ class SpringRow:
     def count_orderings(self) -> int:
         broken = self._broken[:]
         springs = self._springs[::-1]
+        calls = 0
 
         def go(springs: list[Spring], broken: list[int], start: bool, end: bool) -> int:
+            nonlocal calls
+            calls += 1
             copy = springs[:]
             try:
                 spring = copy.pop()
@@ -79,7 +84,9 @@ class SpringRow:
                 case _:
                     raise ValueError(f"Unreachable {spring, broken, start, end}")
 
-        return go(springs, broken, False, False)
+        orderings = go(springs, broken, False, False)
+        count("orderings calls", calls)
+        return orderings
 
     @staticmethod
     def split_on_okay(springs: list[Spring]) -> list[list[Spring]]:
@@ -103,8 +110,11 @@ class SpringRow:
             rev5,
         )
         groups = self.split_on_okay(springs)
+        calls = 0
 
         def go(broken: list[int], groups: list[list[Spring]]) -> int:
+            nonlocal calls
+            calls += 1
             if not broken:
                 return (
                     1
@@ -155,7 +165,22 @@ class SpringRow:
                 )
             raise ValueError(f"Unreachable {broken, groups}")
 
-        return go(broken, groups)
+        orderings = go(broken, groups)
+        count("unfolded orderings calls", calls)
+        return orderings
+
+
+def read_springrows(filename: str) -> list[SpringRow]:
+    with open(filename) as file:
+        return [SpringRow.parse_row(line) for line in file.readlines()]
+
+
+def part_one(filename: str) -> int:
+    return sum(springrow.count_orderings() for springrow in read_springrows(filename))
+
+
+def part_two(filename: str) -> int:
+    return sum(springrow.count_orderings_unfold() for springrow in read_springrows(filename))
 
 
 if __name__ == "__main__":
@@ -167,10 +192,5 @@ if __name__ == "__main__":
     total = sum(springrow.count_orderings_unfold() for springrow in springrows)
     assert total == 525152, total
 
-    with open("input.txt") as file:
-        springrows = [SpringRow.parse_row(line) for line in file.readlines()]
-    total = sum(springrow.count_orderings() for springrow in springrows)
-    print(total)
-
-    total = sum(springrow.count_orderings_unfold() for springrow in springrows)
-    print(total)
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
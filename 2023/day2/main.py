@@ -72,12 +72,19 @@ def find_power_of_least_cubes(game: Game) -> int:
     return red * green * blue
 
 
+def read_games(filename: str) -> list[Game]:
+    with open(filename) as file:
+        return parse_games(file.readlines())
+
+
+def part_one(filename: str) -> int:
+    return sum(game.id for game in read_games(filename) if validate_game(game))
+
+
+def part_two(filename: str) -> int:
+    return sum(find_power_of_least_cubes(game) for game in read_games(filename))
+
+
 if __name__ == "__main__":
-    with open("input.txt") as file:
-        lines = file.readlines()
-    games = parse_games(lines)
-    valid_games = [game for game in games if validate_game(game)]
-    print(sum(game.id for game in valid_games))
-
-    total_powers = sum(find_power_of_least_cubes(game) for game in games)
-    print(total_powers)
\ No newline at end of file
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
\ No newline at end of file
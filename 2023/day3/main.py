@@ -3,25 +3,29 @@ from itertools import count, chain
 from dataclasses import dataclass
 from math import prod
 
+from aoc.grid import Grid
+
 
 DIRECTIONS = [(0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1)]
 
 
+EMPTY = ord(".")
+GEAR = ord("*")
+
+
+def is_digit(char: int | None) -> bool:
+    return char is not None and 48 <= char <= 57
+
+
 @dataclass(frozen=True)
 class Image:
-    _grid: list[str]
-
-    def __getitem__(self, pair: tuple[int, int]) -> str:
-        idx, jdx = pair
-        if idx < 0 or jdx < 0:
-            raise IndexError(f"Index out of bounds row: {idx}, col: {jdx}")
-        try:
-            char = self._grid[idx][jdx]
-        except IndexError:
-            raise IndexError(f"Index out of bounds row: {idx}, col: {jdx}")
-        return char
-
-    def __iter__(self) -> Iterator[str]:
+    _grid: Grid
+
+    def __getitem__(self, pair: tuple[int, int]) -> int | None:
+        """The character code at (row, col), None outside of the image."""
+        return self._grid.get(*pair)
+
+    def __iter__(self) -> Iterator[bytearray]:
         yield from self._grid
 
     def _get_surrounding_numbers(self, idx: int, jdx: int, visited: set[tuple[int, int]]) -> Iterator[int]:
@@ -35,11 +39,7 @@ class Image:
         for step in DIRECTIONS:
             dx, dy = step 
             coords = (idx + dx, jdx + dy)
-            try:
-                char = self[coords]
-            except IndexError:
-                continue
-            if char.isdigit() and coords not in visited:
+            if is_digit(self[coords]) and coords not in visited:
                 number = self._expand_left_and_right(coords, visited)
                 yield number
                 visited.add(coords)
@@ -51,15 +51,12 @@ class Image:
         Registers the coords of each digit in the number as visisted, so the number is not returned twice.
         """
         idx, jdx = coords
-        total = self[idx, jdx]
+        total = chr(self[idx, jdx])
         def expand(total: str, dir_: Iterator[int], combine: Callable[[str, str], str]):
             for step in dir_:
-                try:
-                    char = self[idx, jdx + step]
-                except IndexError:
-                    break
-                if char.isdigit():
-                    total = combine(char, total)
+                char = self[idx, jdx + step]
+                if is_digit(char):
+                    total = combine(chr(char), total)
                     visited.add((idx, jdx + step))
                 else:
                     break
@@ -75,7 +72,7 @@ class Image:
                 self._get_surrounding_numbers(idx, jdx, visited)
                 for idx, row in enumerate(self)
                 for jdx, char in enumerate(row)
-                if char != '.' and not char.isdigit()
+                if char != EMPTY and not is_digit(char)
             )
         ) 
  
@@ -89,25 +86,31 @@ class Image:
         visited: set[tuple[int, int]] = set()
         return [
             self._take_product(list(self._get_surrounding_numbers(idx, jdx, visited)))
-            for idx, row in enumerate(image)
+            for idx, row in enumerate(self)
             for jdx, char in enumerate(row)
-            if char == '*'
+            if char == GEAR
         ]
 
 
+def read_image(filename: str) -> Image:
+    return Image(Grid.read(filename))
+
+
+def part_one(filename: str) -> int:
+    return sum(read_image(filename).scan())
+
+
+def part_two(filename: str) -> int:
+    return sum(read_image(filename).scan_for_gears())
+
+
 if __name__ == "__main__":
-    with open("sample.txt") as file:
-        image = Image([line.strip() for line in file.readlines()])
+    image = read_image("sample.txt")
     numbers = image.scan()
     assert (result := sum(numbers)) == 4361, result
 
     gear_ratios = image.scan_for_gears()
     assert sum(gear_ratios) == 467835
 
-    with open("input.txt") as file:
-        image = Image([line.strip() for line in file.readlines()])
-    numbers = image.scan()
-    print(sum(numbers))
-
-    gear_ratios = image.scan_for_gears()
-    print(sum(gear_ratios))
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
@@ -88,6 +88,19 @@ def parse_cards(lines: list[str]) -> list[Card]:
     return filter_missing(Card.parse_card(line.strip()) for line in lines)
 
 
+def read_scored_cards(filename: str) -> list[ScoredCard]:
+    with open(filename) as file:
+        return [ScoredCard.compute_score(card) for card in parse_cards(file.readlines())]
+
+
+def part_one(filename: str) -> int:
+    return sum(card.score for card in read_scored_cards(filename))
+
+
+def part_two(filename: str) -> int:
+    return proliferate_iterative(read_scored_cards(filename))
+
+
 if __name__ == "__main__":
     with open("sample.txt") as file:
         cards = parse_cards(file.readlines())
@@ -95,8 +108,5 @@ if __name__ == "__main__":
     assert sum(card.score for card in scored_cards) == 13
     assert (total := proliferate_iterative(scored_cards)) == 30, total
 
-    with open("input.txt") as file:
-        cards = parse_cards(file.readlines())
-    scored_cards = [ScoredCard.compute_score(card) for card in cards]
-    print(sum(card.score for card in scored_cards))
-    print(proliferate_iterative(scored_cards))
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
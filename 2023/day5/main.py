@@ -1,7 +1,10 @@
 import re
-from collections.abc import Iterator
+from collections.abc import Iterable
 from dataclasses import dataclass
 
+from aoc.inputs import split_records
+from aoc.intervals import IntervalSet, IntervalTree
+
 SEEDS = re.compile(r"seeds:((?:\s\d+)+)")
 ORDER = {
     "seed-to-soil": 1,
@@ -16,155 +19,58 @@ ORDER = {
 
 @dataclass(frozen=True)
 class Map:
-    ranges: list[tuple[range, range]]
-
-    @dataclass
-    class _Subdivision:
-        overlap: range | None
-        non_overlap: list[range]
+    # source intervals with the offset that takes them to their destination
+    shifts: IntervalTree[int]
+    sources: IntervalSet
 
     @classmethod
     def parse_map(cls, values: list[tuple[int, int, int]]) -> "Map":
-        ranges: list[tuple[range, range]] = []
-        for value in values:
-            dst_start, src_start, size = value
-            src_range = range(src_start, src_start + size)
-            dst_range = range(dst_start, dst_start + size)
-            ranges.append((src_range, dst_range))
-        return cls(ranges)
+        shifts = [(src_start, src_start + size, dst_start - src_start) for dst_start, src_start, size in values]
+        return cls(IntervalTree(shifts), IntervalSet((start, stop) for start, stop, _ in shifts))
 
     def __getitem__(self, key: int) -> int:
-        for src_range, dst_range in self.ranges:
-            if key in src_range:
-                dst = dst_range.start + (key - src_range.start)
-                break
-        else:
-            dst = key
-        return dst
-
-    @staticmethod
-    def _subdivide(left: range, right: range) -> _Subdivision:
-        """Subdivides the left range into overlap with right and non-overlaps.
-        It is not symmetric in left and right.
-        Instead, only members of left are of interest.
-        """
-        # right is contained in left
-        if left.start <= right.start and right.stop <= left.stop:
-            if left.start == right.start and right.stop == left.stop:
-                return Map._Subdivision(overlap=right, non_overlap=[])
-            if left.start < right.start and right.stop == left.stop:
-                lower = range(left.start, right.start)
-                return Map._Subdivision(overlap=right, non_overlap=[lower])
-            if left.start == right.start and right.stop < left.stop:
-                upper = range(right.stop, left.stop)
-                return Map._Subdivision(overlap=right, non_overlap=[upper])
-            lower = range(left.start, right.start)
-            upper = range(right.stop, left.stop)
-            return Map._Subdivision(overlap=right, non_overlap=[lower, upper])
-        # left is contained in right
-        if right.start <= left.start and left.stop <= right.stop:
-            return Map._Subdivision(overlap=left, non_overlap=[])
-        # left is hanging from below
-        if left.start <= right.start <= left.stop <= right.stop:
-            if left.start == right.start:
-                return Map._Subdivision(overlap=left, non_overlap=[])
-            if right.start == left.stop:
-                return Map._Subdivision(overlap=None, non_overlap=[left])
-            inbetween = range(right.start, left.stop)
-            lower = range(left.start, right.start)
-            return Map._Subdivision(overlap=inbetween, non_overlap=[lower])
-        # left is hanging from above
-        if right.start <= left.start <= right.stop <= left.stop:
-            if right.stop == left.stop:
-                return Map._Subdivision(overlap=left, non_overlap=[])
-            if left.start == right.stop:
-                return Map._Subdivision(overlap=None, non_overlap=[left])
-            inbetween = range(left.start, right.stop)
-            upper = range(right.stop, left.stop)
-            return Map._Subdivision(overlap=inbetween, non_overlap=[upper])
-        # left and right do not overlap
-        # if right.stop < left.start or left.stop < right.start:
-        return Map._Subdivision(overlap=None, non_overlap=[left])
-
-    def map_range(self, rng: range) -> list[range]:
-        to_map = [rng]
-        mapped: list[range] = []
-        for src_range, dst_range in self.ranges:
-            subdivs = [self._subdivide(rng, src_range) for rng in to_map]
-            for subdiv in subdivs:
-                if subdiv.overlap is not None:
-                    start = dst_range.start + (subdiv.overlap.start - src_range.start)
-                    stop = dst_range.start + (subdiv.overlap.stop - src_range.start)
-                    mapped.append(range(start, stop))
-            to_map = [rng for subdiv in subdivs for rng in subdiv.non_overlap]
-        mapped.extend(to_map)
-        return mapped
-
-
-def extract_values(itr: Iterator[str]) -> list[tuple[int, int, int]]:
+        for _, _, shift in self.shifts.at(key):
+            return key + shift
+        return key
+
+    def map_intervals(self, values: IntervalSet) -> IntervalSet:
+        """Shifts the parts of the values covered by a source, the rest maps to itself."""
+        shifted = IntervalSet(
+            (max(start, src_start) + shift, min(stop, src_stop) + shift)
+            for start, stop in values
+            for src_start, src_stop, shift in self.shifts.overlapping(start, stop)
+        )
+        return shifted | (values - self.sources)
+
+
+def extract_values(rows: Iterable[str]) -> list[tuple[int, int, int]]:
     values: list[tuple[int, int, int]] = []
-    line = next(itr, "").strip()
-    while line:
-        dst_start, src_start, size = (int(num) for num in line.split())
+    for row in rows:
+        dst_start, src_start, size = (int(num) for num in row.split())
         values.append((dst_start, src_start, size))
-        line = next(itr, "").strip()
     return values
 
 
-def parse_seeds_and_maps(lines: list[str]) -> tuple[list[int], dict[str, Map]]:
-    itr = iter(lines)
-    m = SEEDS.match(next(itr, "").strip())
+def parse_seeds_and_maps(lines: Iterable[str]) -> tuple[list[int], dict[str, Map]]:
+    blocks = split_records(lines)
+    m = SEEDS.match(next(blocks, [""])[0])
     if m is not None:
         seeds = [int(num) for num in m.group(1).strip().split()]
     else:
         raise ValueError("No seeds found.")
 
-    next(itr, "")
-
     maps: dict[str, Map] = {}
-    while True:
-        line = next(itr, "").strip()
-        match line:
-            case "seed-to-soil map:":
-                values = extract_values(itr)
-                map_ = Map.parse_map(values)
-                maps["seed-to-soil"] = map_
-            case "soil-to-fertilizer map:":
-                values = extract_values(itr)
-                map_ = Map.parse_map(values)
-                maps["soil-to-fertilizer"] = map_
-            case "fertilizer-to-water map:":
-                values = extract_values(itr)
-                map_ = Map.parse_map(values)
-                maps["fertilizer-to-water"] = map_
-            case "water-to-light map:":
-                values = extract_values(itr)
-                map_ = Map.parse_map(values)
-                maps["water-to-light"] = map_
-            case "light-to-temperature map:":
-                values = extract_values(itr)
-                map_ = Map.parse_map(values)
-                maps["light-to-temperature"] = map_
-            case "temperature-to-humidity map:":
-                values = extract_values(itr)
-                map_ = Map.parse_map(values)
-                maps["temperature-to-humidity"] = map_
-            case "humidity-to-location map:":
-                values = extract_values(itr)
-                map_ = Map.parse_map(values)
-                maps["humidity-to-location"] = map_
-            case _:
-                break
+    for header, *rows in blocks:
+        name = header.removesuffix(" map:")
+        if name not in ORDER:
+            break
+        maps[name] = Map.parse_map(extract_values(rows))
     return seeds, maps
 
 
-def parse_seeds(seeds: list[int]) -> list[range]:
-    actual_seeds: list[range] = []
+def parse_seeds(seeds: list[int]) -> IntervalSet:
     itr = iter(seeds)
-    for seed_start, seed_range in zip(itr, itr):
-        rng = range(seed_start, seed_start + seed_range)
-        actual_seeds.append(rng)
-    return actual_seeds
+    return IntervalSet((seed_start, seed_start + seed_range) for seed_start, seed_range in zip(itr, itr))
 
 
 def map_seed_to_location(seed: int, maps: dict[str, Map]) -> int:
@@ -174,37 +80,37 @@ def map_seed_to_location(seed: int, maps: dict[str, Map]) -> int:
     return value
 
 
-def map_seed_to_location_rng(seeds: range, maps: dict[str, Map]) -> list[range]:
-    values = [seeds]
+def map_seeds_to_locations(seeds: IntervalSet, maps: dict[str, Map]) -> IntervalSet:
+    values = seeds
     for _, map_ in sorted(maps.items(), key=lambda x: ORDER[x[0]]):
-        values = [rng for value in values for rng in map_.map_range(value)]
+        values = map_.map_intervals(values)
     return values
 
 
+def read_seeds_and_maps(filename: str) -> tuple[list[int], dict[str, Map]]:
+    with open(filename) as file:
+        return parse_seeds_and_maps(file)
+
+
+def part_one(filename: str) -> int:
+    seeds, maps = read_seeds_and_maps(filename)
+    return min(map_seed_to_location(seed, maps) for seed in seeds)
+
+
+def part_two(filename: str) -> int:
+    seeds, maps = read_seeds_and_maps(filename)
+    return map_seeds_to_locations(parse_seeds(seeds), maps).starts[0]
+
+
 if __name__ == "__main__":
     with open("sample.txt") as file:
         seeds, maps = parse_seeds_and_maps(file.readlines())
     min_location = min(map_seed_to_location(seed, maps) for seed in seeds)
     assert min_location == 35, min_location
-    actual_seeds = parse_seeds(seeds)
-    min_location = min(
-        rng.start
-        for seeds in actual_seeds
-        for rng in map_seed_to_location_rng(seeds, maps)
-    )
+    min_location = map_seeds_to_locations(parse_seeds(seeds), maps).starts[0]
     assert min_location == 46, min_location
 
     print("test ok!")
 
-    with open("input.txt") as file:
-        seeds, maps = parse_seeds_and_maps(file.readlines())
-    min_location = min(map_seed_to_location(seed, maps) for seed in seeds)
-    print(min_location)
-    # too slow, ranges too big, need to optimize
-    actual_seeds = parse_seeds(seeds)
-    min_location = min(
-        rng.start
-        for seeds in actual_seeds
-        for rng in map_seed_to_location_rng(seeds, maps)
-    )
-    print(min_location)
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
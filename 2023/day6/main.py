@@ -47,6 +47,16 @@ def parse_races_correct(lines: list[str]) -> Race:
     return Race(int(time), int(dist))
 
 
+def part_one(filename: str) -> int:
+    with open(filename) as file:
+        return count_all_wins(parse_races(file.readlines()))
+
+
+def part_two(filename: str) -> int:
+    with open(filename) as file:
+        return parse_races_correct(file.readlines()).count_winning_options()
+
+
 if __name__ == "__main__":
     with open("sample.txt") as file:
         races = parse_races(file.readlines())
@@ -56,10 +66,5 @@ if __name__ == "__main__":
         race = parse_races_correct(file.readlines())
     assert race.count_winning_options() == 71503
 
-    with open("input.txt") as file:
-        races = parse_races(file.readlines())
-    print(count_all_wins(races))
-
-    with open("input.txt") as file:
-        race = parse_races_correct(file.readlines())
-    print(race.count_winning_options())
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
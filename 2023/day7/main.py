@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from collections import Counter
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from enum import IntEnum
 from typing import Self, final
@@ -54,6 +54,22 @@ class Hands(IntEnum):
     Five_of_a_Kind = 6
 
 
+# hand types by the sizes of their groups of equal cards, largest first
+HANDS_BY_COUNTS = {
+    (1, 1, 1, 1, 1): Hands.High_Card,
+    (2, 1, 1, 1): Hands.Pair,
+    (2, 2, 1): Hands.Two_Pair,
+    (3, 1, 1): Hands.Three_of_a_Kind,
+    (3, 2): Hands.Full_House,
+    (4, 1): Hands.Four_of_a_Kind,
+    (5,): Hands.Five_of_a_Kind,
+}
+
+
+def counts(cards: Iterable[IntEnum]) -> tuple[int, ...]:
+    return tuple(sorted(Counter(cards).values(), reverse=True))
+
+
 @dataclass
 class Hand[A: IntEnum](ABC):
     _hand: list[A]
@@ -86,24 +102,7 @@ class NormalHand(Hand[Card]):
 
     @property
     def _eval_hand(self) -> Hands:
-        count = Counter(self)
-        match count.most_common(2):
-            case [(_, 1), _]:
-                return Hands.High_Card
-            case [(_, 2), (_, 1)]:
-                return Hands.Pair
-            case [(_, 2), (_, 2)]:
-                return Hands.Two_Pair
-            case [(_, 3), (_, 1)]:
-                return Hands.Three_of_a_Kind
-            case [(_, 3), (_, 2)]:
-                return Hands.Full_House
-            case [(_, 4), _]:
-                return Hands.Four_of_a_Kind
-            case [(_, 5)]:
-                return Hands.Five_of_a_Kind
-            case _:
-                raise ValueError(f"Unreachable {self._hand}!")
+        return HANDS_BY_COUNTS[counts(self)]
 
 
 @dataclass
@@ -114,50 +113,10 @@ class JokeHand(Hand[JokeCard]):
 
     @property
     def _eval_hand(self) -> Hands:
-        count = Counter(self)
-        jokers = count.get(JokeCard.Jack, 0)
-        del count[JokeCard.Jack]
-        match (count.most_common(2), jokers):
-            case ([(_, 1), _], 0):
-                return Hands.High_Card
-            case ([(_, 1), _], 1):
-                return Hands.Pair
-            case ([(_, 1), _], 2):
-                return Hands.Three_of_a_Kind
-            case ([(_, 1), _], 3):
-                return Hands.Four_of_a_Kind
-            case ([(_, 1)], 4):
-                return Hands.Five_of_a_Kind
-            case ([(_, 2), (_, 1)], 0):
-                return Hands.Pair
-            case ([(_, 2), (_, 1)], 1):
-                return Hands.Three_of_a_Kind
-            case ([(_, 2), (_, 1)], 2):
-                return Hands.Four_of_a_Kind
-            case ([(_, 2)], 3):
-                return Hands.Five_of_a_Kind
-            case ([(_, 2), (_, 2)], 0):
-                return Hands.Two_Pair
-            case ([(_, 2), (_, 2)], 1):
-                return Hands.Full_House
-            case ([(_, 3), (_, 1)], 0):
-                return Hands.Three_of_a_Kind
-            case ([(_, 3), (_, 1)], 1):
-                return Hands.Four_of_a_Kind
-            case ([(_, 3), (_, 2)], 0):
-                return Hands.Full_House
-            case ([(_, 3)], 2):
-                return Hands.Five_of_a_Kind
-            case ([(_, 4), (_, 1)], 0):
-                return Hands.Four_of_a_Kind
-            case ([(_, 4)], 1):
-                return Hands.Five_of_a_Kind
-            case ([(_, 5)], 0):
-                return Hands.Five_of_a_Kind
-            case ([], 5):
-                return Hands.Five_of_a_Kind
-            case _:
-                raise ValueError(f"Unreachable {self._hand}!")
+        jokers = self._hand.count(JokeCard.Jack)
+        rest = counts(card for card in self if card != JokeCard.Jack) or (0,)
+        # jokers always do best joining the largest group
+        return HANDS_BY_COUNTS[(rest[0] + jokers, *rest[1:])]
 
 
 def rank_hands[A: IntEnum](hands: list[tuple[Hand[A], int]]) -> int:
@@ -174,6 +133,16 @@ def parse_hands_and_dips[A: IntEnum](
     ]
 
 
+def part_one(filename: str) -> int:
+    with open(filename) as file:
+        return rank_hands(parse_hands_and_dips(file.readlines(), NormalHand))
+
+
+def part_two(filename: str) -> int:
+    with open(filename) as file:
+        return rank_hands(parse_hands_and_dips(file.readlines(), JokeHand))
+
+
 def main() -> None:
     with open("sample.txt") as file:
         hands = parse_hands_and_dips(file.readlines(), NormalHand)
@@ -185,15 +154,8 @@ def main() -> None:
     total_returns = rank_hands(hands)
     assert total_returns == 5905
 
-    with open("input.txt") as file:
-        hands = parse_hands_and_dips(file.readlines(), NormalHand)
-    total_returns = rank_hands(hands)
-    print(total_returns)
-
-    with open("input.txt") as file:
-        hands = parse_hands_and_dips(file.readlines(), JokeHand)
-    total_returns = rank_hands(hands)
-    print(total_returns)
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
 
 
 if __name__ == "__main__":
@@ -1,10 +1,11 @@
 import re
 from collections.abc import Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from functools import reduce
 from itertools import cycle
-from math import gcd
+
+from aoc.graph import Graph
+from aoc.numtheory import crt
 
 NODE = re.compile(r"(\w+) = \((\w+), (\w+)\)")
 
@@ -14,94 +15,85 @@ class Move(Enum):
     Right = 2
 
 
-@dataclass
-class Node:
-    name: str
-    left: str
-    right: str
-
-
 @dataclass
 class Adjacency:
     _start: str
     _end: str
-    _vectors: dict[str, Node]
-
-    def _move(self, current: Node, dir_: Move) -> Node:
-        match dir_:
-            case Move.Left:
-                return self._vectors[self._vectors[current.name].left]
-            case Move.Right:
-                return self._vectors[self._vectors[current.name].right]
+    _graph: Graph
+    _moves: dict[Move, list[int]] = field(init=False)
+    _ghost_ends: list[bool] = field(init=False)
+
+    def __post_init__(self) -> None:
+        # every node has its left then its right neighbor as edges
+        offsets, targets = self._graph.offsets, self._graph.targets
+        nodes = range(len(self._graph))
+        self._moves = {
+            Move.Left: [targets[offsets[node]] for node in nodes],
+            Move.Right: [targets[offsets[node] + 1] for node in nodes],
+        }
+        self._ghost_ends = [name.endswith(self._end[-1]) for name in self._graph.names]
+
+    def _ghost_starts(self) -> list[int]:
+        return [node for node, name in enumerate(self._graph.names) if name.endswith(self._start[-1])]
 
     def follow_instructions(self, instructions: list[Move]) -> int:
         steps = 0
-        current = self._vectors[self._start]
+        current = self._graph.id(self._start)
+        end = self._graph.id(self._end)
         for dir_ in cycle(instructions):
-            if current.name == self._end:
+            if current == end:
                 break
-            current = self._move(current, dir_)
+            current = self._moves[dir_][current]
             steps += 1
         return steps
 
     def follow_ghost_instructions(self, instructions: list[Move]) -> int:
         steps = 0
-        currents = [
-            value
-            for name, value in self._vectors.items()
-            if name.endswith(self._start[-1])
-        ]
+        currents = self._ghost_starts()
         for dir_ in cycle(instructions):
-            if all(current.name.endswith(self._end[-1]) for current in currents):
+            if all(self._ghost_ends[current] for current in currents):
                 break
-            currents = [self._move(current, dir_) for current in currents]
+            moves = self._moves[dir_]
+            currents = [moves[current] for current in currents]
             steps += 1
         return steps
 
     def find_paths(self, instructions: list[Move]) -> dict[tuple[str, str], int]:
-        currents = [
-            value
-            for name, value in self._vectors.items()
-            if name.endswith(self._start[-1])
-        ]
+        names = self._graph.names
         finals: dict[tuple[str, str], int] = {}
-        for current in currents:
+        for current in self._ghost_starts():
             steps = 0
             the_current = current
             for dir_ in cycle(instructions):
-                if the_current.name.endswith(self._end[-1]):
-                    finals[(current.name, the_current.name)] = steps
+                if self._ghost_ends[the_current]:
+                    finals[(names[current], names[the_current])] = steps
                     break
-                the_current = self._move(the_current, dir_)
+                the_current = self._moves[dir_][the_current]
                 steps += 1
         return finals
 
     def find_paths_and_after(self, instructions: list[Move]) -> tuple[dict[tuple[str, str], int], dict[tuple[str, str], int]]:
-        currents = [
-            value
-            for name, value in self._vectors.items()
-            if name.endswith(self._start[-1])
-        ]
+        names = self._graph.names
         finals: dict[tuple[str, str], int] = {}
         after_finals: dict[tuple[str, str], int] = {}
-        for current in currents:
+        for current in self._ghost_starts():
             steps = 0
             the_current = current
             itr = cycle(instructions)
             while True:
                 dir_ = next(itr)
-                if the_current.name.endswith(self._end[-1]):
-                    finals[(current.name, the_current.name)] = steps
+                if self._ghost_ends[the_current]:
+                    finals[(names[current], names[the_current])] = steps
                     new_steps = 0
                     new_current = the_current
                     for new_dir in itr:
                         new_steps += 1
-                        new_current = self._move(new_current, new_dir)
-                        if new_current.name.endswith(self._end[-1]):
-                            after_finals[(the_current.name, new_current.name)] = new_steps
+                        new_current = self._moves[new_dir][new_current]
+                        if self._ghost_ends[new_current]:
+                            after_finals[(names[the_current], names[new_current])] = new_steps
                             break
                     break
-                the_current = self._move(the_current, dir_)
+                the_current = self._moves[dir_][the_current]
                 steps += 1
         return finals, after_finals
 
@@ -109,26 +101,38 @@ class Adjacency:
 def parse_instructions(lines: list[str]) -> tuple[list[Move], Adjacency]:
     itr = iter(lines)
     moves = [Move.Left if c == "L" else Move.Right for c in next(itr, "").strip()]
-    vec: dict[str, Node] = {}
+    edges: list[tuple[str, str]] = []
+    nodes: list[str] = []
     for line in itr:
         m = NODE.match(line.strip())
         if m is not None:
             name, left, right = m.group(1), m.group(2), m.group(3)
-            node = Node(name, left, right)
-            vec[node.name] = node
-    adjacency = Adjacency("AAA", "ZZZ", vec)
+            nodes.append(name)
+            edges += [(name, left), (name, right)]
+    adjacency = Adjacency("AAA", "ZZZ", Graph.from_edges(edges, nodes))
     return moves, adjacency
 
 
-def find_lcm(x: int, y: int) -> int:
-    d = gcd(x, y)
-    p = x // d
-    q = y // d
-    return p * q * d
+def find_ghost_meeting(paths: Iterable[int]) -> int:
+    # every ghost is back at its end as many steps after reaching it as it took to get there,
+    # x = 0 (mod steps) for all of them, so they first meet when the combined period ends
+    _, period = crt((0, steps) for steps in paths)
+    return period
+
 
+def read_instructions(filename: str) -> tuple[list[Move], Adjacency]:
+    with open(filename) as file:
+        return parse_instructions(file.readlines())
 
-def find_total_lcm(xs: Iterable[int]) -> int:
-    return reduce(find_lcm, xs)
+
+def part_one(filename: str) -> int:
+    moves, adjacency = read_instructions(filename)
+    return adjacency.follow_instructions(moves)
+
+
+def part_two(filename: str) -> int:
+    moves, adjacency = read_instructions(filename)
+    return find_ghost_meeting(adjacency.find_paths(moves).values())
 
 
 if __name__ == "__main__":
@@ -142,14 +146,10 @@ if __name__ == "__main__":
     steps = adjacency.follow_ghost_instructions(moves)
     assert steps == 6, steps
 
-    with open("input.txt") as file:
-        moves, adjacency = parse_instructions(file.readlines())
-    steps = adjacency.follow_instructions(moves)
-    print(steps)
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
 
-    finals = adjacency.find_paths(moves)
-    total = find_total_lcm(finals.values())
-    print(total)
+    moves, adjacency = read_instructions("input.txt")
     finals, after_finals = adjacency.find_paths_and_after(moves)
     for key, value in finals.items():
         print(key, value)
@@ -1,6 +1,8 @@
 from functools import reduce
 from itertools import islice
 
+from aoc.inputs import read_int_rows
+
 
 def predict(history: list[int]) -> int:
     current = history
@@ -44,6 +46,14 @@ def parse_histories(lines: list[str]) -> list[list[int]]:
     return [[int(number) for number in line.strip().split()] for line in lines]
 
 
+def part_one(filename: str) -> int:
+    return sum(predict_all(read_int_rows(filename)))
+
+
+def part_two(filename: str) -> int:
+    return sum(predict_backwards_all(read_int_rows(filename)))
+
+
 if __name__ == "__main__":
     with open("sample.txt") as file:
         histories = parse_histories(file.readlines())
@@ -55,12 +65,5 @@ if __name__ == "__main__":
     total = sum(predictions)
     assert total == 2, total
 
-    with open("input.txt") as file:
-        histories = parse_histories(file.readlines())
-    predictions = predict_all(histories)
-    total = sum(predictions)
-    print(total)
-
-    predictions = predict_backwards_all(histories)
-    total = sum(predictions)
-    print(total)
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
@@ -1,5 +1,7 @@
 from collections import Counter
 
+from aoc.inputs import read_ints
+
 
 def distance(left: list[int], right: list[int]) -> int:
     return sum(abs(litem - ritem) for litem, ritem in zip(sorted(left), sorted(right)))
@@ -11,16 +13,18 @@ def similarity(left: list[int], right: list[int]) -> int:
 
 
 def read_lists(filename: str) -> tuple[list[int], list[int]]:
-    with open(filename) as data:
-        left: list[int] = []
-        right: list[int] = []
-        for litem, ritem in map(lambda x: map(int, x.strip().split()), data.readlines()):
-            left.append(litem)
-            right.append(ritem)
-    return left, right
+    numbers = read_ints(filename)
+    return numbers[::2], numbers[1::2]
+
+
+def part_one(filename: str) -> int:
+    return distance(*read_lists(filename))
+
+
+def part_two(filename: str) -> int:
+    return similarity(*read_lists(filename))
 
 
 if __name__ == "__main__":
-    left, right = read_lists("input.txt")
-    print(distance(left, right))
-    print(similarity(left, right))
\ No newline at end of file
+    print(part_one("input.txt"))
+    print(part_two("input.txt"))
\ No newline at end of file
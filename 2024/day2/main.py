@@ -17,7 +17,15 @@ def count_safe_reports(reports: list[REPORT], dampener: bool = False) -> int:
 def parse_reports(filename: str) -> list[REPORT]:
     with open(filename) as file:
         return [[int(c) for c in line.strip().split()] for line in file.readlines() if line.strip()]
-    
+
+
+def part_one(filename: str) -> int:
+    return count_safe_reports(parse_reports(filename))
+
+
+def part_two(filename: str) -> int:
+    return count_safe_reports(parse_reports(filename), True)
+
 
 if __name__ == "__main__":
     reports = parse_reports("sample.txt")
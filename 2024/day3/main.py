@@ -41,6 +41,14 @@ def compute_and_add(operations: list[OPERATION]) -> int:
     return sum(x * y for x, y in operations)
 
 
+def part_one(filename: str) -> int:
+    return compute_and_add(find_all(read_text(filename)))
+
+
+def part_two(filename: str) -> int:
+    return compute_and_add(find_and_filter(read_text(filename)))
+
+
 if __name__ == "__main__":
     text = read_text("sample.txt")
     operations = find_all(text)
@@ -1,42 +1,35 @@
-from dataclasses import dataclass
+from aoc.graph import Graph
 
 
-@dataclass
-class Number:
-    x: int
-    rules: set[tuple[int, int]]
+def validate_update(update: list[int], rules: Graph) -> bool:
+    # every page must have a rule putting it before each of the pages after it
+    positions = {rules.id(page): idx for idx, page in enumerate(update)}
+    return all(
+        sum(1 for later in rules.successors(node) if positions.get(later, -1) > idx) == len(update) - 1 - idx
+        for node, idx in positions.items()
+    )
 
-    def __lt__(self, other: "Number") -> bool:
-        return (self.x, other.x) in self.rules
-    
-    def __eq__(self, other: "Number") -> bool:
-        return self.x == other.x
 
-
-def validate_update(update: list[int], rules: set[tuple[int, int]]):
-    return all((elem, other) in rules for idx, elem in enumerate(update) for other in update[idx + 1:]) 
-
-
-def sum_valid_updates(updates: list[list[int]], rules: set[tuple[int, int]]) -> int:
+def sum_valid_updates(updates: list[list[int]], rules: Graph) -> int:
     return sum(update[len(update) // 2] for update in updates if validate_update(update, rules))
 
-# NOTE: it is not obvious the rules work with the sorted algorithm but it does work
-def correct_update(update: list[int], rules: set[tuple[int, int]]) -> list[int]:
-    return sorted(update, key=lambda x: Number(x, rules))
+
+def correct_update(update: list[int], rules: Graph) -> list[int]:
+    return [rules.names[node] for node in rules.topological_order(rules.id(page) for page in update)]
 
 
-def sum_invalid_updates(updates: list[list[int]], rules: set[tuple[int, int]]) -> int:
+def sum_invalid_updates(updates: list[list[int]], rules: Graph) -> int:
     invalid = (update for update in updates if not validate_update(update, rules))
     return sum(update[len(update) // 2] for update in map(lambda x: correct_update(x, rules), invalid)) 
 
 
-def parse_updates(filename: str) -> tuple[set[tuple[int, int]], list[list[int]]]:
-    rules: set[tuple[int, int]] = set()
+def parse_updates(filename: str) -> tuple[Graph, list[list[int]]]:
+    rules: list[tuple[int, int]] = []
     with open(filename) as file:
         line = file.readline().strip()
         while line:
            earlier, later = map(int, line.split('|'))
-           rules.add((earlier, later))
+           rules.append((earlier, later))
            line = file.readline().strip()
         
         line = file.readline().strip()
@@ -45,7 +38,18 @@ def parse_updates(filename: str) -> tuple[set[tuple[int, int]], list[list[int]]]
             update = [int(number) for number in line.split(',')]
             updates.append(update)
             line = file.readline().strip()
-    return rules, updates
+    pages = {page for update in updates for page in update}
+    return Graph.from_edges(rules, nodes=sorted(pages)), updates
+
+
+def part_one(filename: str) -> int:
+    rules, updates = parse_updates(filename)
+    return sum_valid_updates(updates, rules)
+
+
+def part_two(filename: str) -> int:
+    rules, updates = parse_updates(filename)
+    return sum_invalid_updates(updates, rules)
 
 
 if __name__ == "__main__":
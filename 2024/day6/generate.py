@@ -0,0 +1,65 @@
+import random
+import sys
+from types import ModuleType
+
+# side of the square map, the real input is 130 x 130
+SIZES = (10, 20, 30, 40, 60)
+
+# share of obstructed positions off the guard's path, about the same as the real input
+DENSITY = 0.048
+
+TURNS = {(-1, 0): (0, 1), (0, 1): (1, 0), (1, 0): (0, -1), (0, -1): (-1, 0)}
+
+Pos = tuple[int, int]
+
+
+def walk(rows: list[list[str]], guard: Pos) -> set[Pos] | None:
+    """Positions the guard visits, None if the guard never leaves the map."""
+    side = len(rows)
+    (x, y), dir_ = guard, (-1, 0)
+    seen: set[tuple[int, int, tuple[int, int]]] = set()
+    while (x, y, dir_) not in seen:
+        seen.add((x, y, dir_))
+        dx, dy = dir_
+        if not (0 <= x + dx < side and 0 <= y + dy < side):
+            return {(x, y) for x, y, _ in seen}
+        if rows[x + dx][y + dy] == "#":
+            dir_ = TURNS[dir_]
+        else:
+            x, y = x + dx, y + dy
+    return None
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """A `size` x `size` map with a guard facing up.
+
+    On a random map the guard leaves after a few steps, so the path is grown first:
+    an obstruction is dropped on the path and kept when the guard still leaves the map
+    and visits at least as many positions. The rest of the map is filled randomly afterwards.
+    """
+    rng = random.Random(seed)
+    rows = [["."] * size for _ in range(size)]
+    guard = (rng.randrange(size // 2, size), rng.randrange(size))
+    path = walk(rows, guard) or {guard}
+    for _ in range(10 * size):
+        x, y = rng.choice(sorted(path - {guard}))
+        rows[x][y] = "#"
+        longer = walk(rows, guard)
+        if longer is not None and len(longer) >= len(path):
+            path = longer
+        else:
+            rows[x][y] = "."
+    for x in range(size):
+        for y in range(size):
+            if (x, y) not in path and rng.random() < DENSITY:
+                rows[x][y] = "#"
+    rows[guard[0]][guard[1]] = "^"
+    return "\n".join("".join(row) for row in rows) + "\n"
+
+
+def workload(solution: ModuleType, filename: str) -> int:
+    return solution.find_loops(*solution.read_map(filename))
+
+
+if __name__ == "__main__":
+    print(generate(int(sys.argv[1]), int(sys.argv[2]) if len(sys.argv) > 2 else 0), end="")
@@ -1,8 +1,15 @@
-from typing import Optional
 from enum import Enum
 from collections import deque
 from itertools import islice
 
+from aoc.grid import Grid
+
+# peak rss in MiB, each candidate obstruction keeps the trajectory of the guard
+MEMORY_BUDGET_MIB = 64
+
+OBSTRUCTION = ord("#")
+OUTSIDE = 0
+
 
 class Direction(Enum):
     Up = (-1, 0)
@@ -37,56 +44,60 @@ class Direction(Enum):
                 raise ValueError("Impossible, enum has a specific number of values and it is covered here.")
 
 
-def print_grid(grid: list[list[bool]], guard_pos: tuple[int, int], dir_: Direction) -> None:
+# in the order the guard turns through them, the index of a direction is its index in the steps
+TURNS = [Direction.Up, Direction.Right, Direction.Down, Direction.Left]
+
+
+def print_grid(grid: Grid, guard_pos: tuple[int, int], dir_: Direction) -> None:
     for idx, row in enumerate(grid):
-        row = "".join(dir_.get_icon() if guard_pos == (idx, jdx) else "." if spot else "#" for jdx, spot in enumerate(row))
+        row = "".join(dir_.get_icon() if guard_pos == (idx, jdx) else "#" if spot == OBSTRUCTION else "." for jdx, spot in enumerate(row))
         print(row)
     print()
 
 
-def count_guard_path(grid: list[list[bool]], guard_pos: tuple[int, int], trace: bool = False) -> int:
-    x_border, y_border = len(grid), len(grid[0])
-    def is_outside(x: int, y: int) -> bool:
-        return x < 0 or x >= x_border or y < 0 or y >= y_border
-    def move_guard(guard_pos: tuple[int, int], dir_: Direction) -> tuple[Optional[tuple[int, int]], Direction]:
-        x, y = guard_pos
-        dx, dy = dir_.value
-        x_new, y_new = x + dx, y + dy
-        if is_outside(x_new, y_new):
-            return None, dir_
-        if grid[x_new][y_new]:
-            return (x_new, y_new), dir_
-        return guard_pos, dir_.turn_right()
-    
-    dir_ = Direction.Up
-    visited: set[tuple[int, int]] = {guard_pos}
-    while guard_pos is not None:
-        guard_pos, dir_ = move_guard(guard_pos, dir_)
+def padded(grid: Grid) -> tuple[bytearray, int]:
+    """The cells surrounded by OUTSIDE cells and the width of a padded row, so that the guard
+    moves by adding the step of its direction and has left once it stands on OUTSIDE."""
+    # one border column, at the end of every row and before the start of the next one
+    width = grid.width + 1
+    border = bytes([OUTSIDE]) * width
+    cells = bytearray(border)
+    for row in grid.rows():
+        cells += row + bytes([OUTSIDE])
+    cells += border
+    return cells, width
+
+
+def count_guard_path(grid: Grid, guard_pos: tuple[int, int], trace: bool = False) -> int:
+    cells, width = padded(grid)
+    steps = [-width, 1, width, -1]
+    position = (guard_pos[0] + 1) * width + guard_pos[1]
+    direction = 0
+    visited = {position}
+    while True:
+        ahead = position + steps[direction]
+        cell = cells[ahead]
+        if cell == OUTSIDE:
+            break
+        if cell == OBSTRUCTION:
+            direction = (direction + 1) % 4
+        else:
+            position = ahead
+            visited.add(position)
         if trace:
-            print_grid(grid, guard_pos, dir_)
-        if guard_pos is not None:
-            visited.add(guard_pos)
+            print_grid(grid, divmod(position - width, width), TURNS[direction])
 
     return len(visited)
 
 
 
-def find_loops(grid: list[list[bool]], init_guard_pos: tuple[int, int]) -> int:
-    x_border, y_border = len(grid), len(grid[0])
-    def is_outside(x: int, y: int) -> bool:
-        return x < 0 or x >= x_border or y < 0 or y >= y_border
-    def move_guard(guard_pos: tuple[int, int], dir_: Direction, block: tuple[int, int] = None) -> tuple[Optional[tuple[int, int]], Direction, bool]:
-        x, y = guard_pos
-        dx, dy = dir_.value
-        x_new, y_new = x + dx, y + dy
-        if is_outside(x_new, y_new):
-            return None, dir_, True
-        if grid[x_new][y_new] and (block is None or block != (x_new, y_new)):
-            return (x_new, y_new), dir_, True
-        return guard_pos, dir_.turn_right(), False
+def find_loops(grid: Grid, init_guard_pos: tuple[int, int]) -> int:
+    cells, width = padded(grid)
+    steps = [-width, 1, width, -1]
+    start = (init_guard_pos[0] + 1) * width + init_guard_pos[1]
 
-    def is_loop(trajectory: deque[tuple[int, int]]) -> bool:
-        loop: list[tuple[int, int]] = []
+    def is_loop(trajectory: deque[int]) -> bool:
+        loop: list[int] = []
         for idx, pos in enumerate(trajectory):
             if loop and pos == loop[0] and loop == list(islice(trajectory, idx, idx + len(loop))):
                 print(f"The size of the loop was {len(loop)}")
@@ -96,10 +107,10 @@ def find_loops(grid: list[list[bool]], init_guard_pos: tuple[int, int]) -> int:
                 return False
         return False
 
-    def is_loop_trick(trajectory: deque[tuple[int, int]]) -> bool:
-        seen: list[tuple[int, int]] = []
+    def is_loop_trick(trajectory: deque[int]) -> bool:
+        seen: list[int] = []
         idx = 0
-        temp: list[tuple[int, int]] = []
+        temp: list[int] = []
         for pos in trajectory:
             if seen and idx == len(seen):
                 return True
@@ -115,43 +126,56 @@ def find_loops(grid: list[list[bool]], init_guard_pos: tuple[int, int]) -> int:
                 seen.append(pos)
         return False
 
-    def find_loop(guard_pos: tuple[int, int], dir_: Direction, block: tuple[int, int], estimated_size: int) -> bool:
-        trajectory = deque([guard_pos])
+    def find_loop(block: int, estimated_size: int) -> bool:
+        position, direction = start, 0
+        trajectory = deque([position])
         total_steps = 0
         while True:
-            guard_pos, dir_, step = move_guard(guard_pos, dir_, block) 
-            if guard_pos is None:
+            ahead = position + steps[direction]
+            cell = cells[ahead]
+            if cell == OUTSIDE:
                 return False
-            total_steps += step
-            if step:
-                trajectory.appendleft(guard_pos)
-                if not (total_steps % estimated_size) and is_loop_trick(trajectory):
-                    return True
-
-    init_dir = Direction.Up
-    dir_ = init_dir
-    visited: set[tuple[int, int]] = set()
-    guard_pos = init_guard_pos
-    while guard_pos is not None:
-        guard_pos, dir_, _ = move_guard(guard_pos, dir_)
-        if guard_pos is not None and guard_pos != init_guard_pos:
-            visited.add(guard_pos)
-    return sum(find_loop(init_guard_pos, init_dir, block, len(visited)) for block in visited)
-
-
-def read_map(filename: str) -> tuple[list[list[bool]], tuple[int, int]]:
-    grid: list[list[bool]] = []
-    guard_pos: Optional[tuple[int, int]] = None
-    with open(filename) as file:
-        for idx, line in enumerate(map(lambda x: x.strip(), file.readlines())):
-            if guard_pos is None and Direction.Up.get_icon() in line:
-                guard_pos = (idx, line.index(Direction.Up.get_icon())) 
-            grid.append([c in {".", "^"} for c in line])
+            if cell == OBSTRUCTION or ahead == block:
+                direction = (direction + 1) % 4
+                continue
+            position = ahead
+            total_steps += 1
+            trajectory.appendleft(position)
+            if not (total_steps % estimated_size) and is_loop_trick(trajectory):
+                return True
+
+    position, direction = start, 0
+    visited: set[int] = set()
+    while True:
+        ahead = position + steps[direction]
+        cell = cells[ahead]
+        if cell == OUTSIDE:
+            break
+        if cell == OBSTRUCTION:
+            direction = (direction + 1) % 4
+        else:
+            position = ahead
+            if position != start:
+                visited.add(position)
+    return sum(find_loop(block, len(visited)) for block in visited)
+
+
+def read_map(filename: str) -> tuple[Grid, tuple[int, int]]:
+    grid = Grid.read(filename)
+    guard_pos = grid.find(ord(Direction.Up.get_icon()))
     if guard_pos is None:
         raise ValueError("Missing guard position on the grid, check input!")
     return grid, guard_pos
 
 
+def part_one(filename: str) -> int:
+    return count_guard_path(*read_map(filename))
+
+
+def part_two(filename: str) -> int:
+    return find_loops(*read_map(filename))
+
+
 if __name__ == "__main__":
     grid, guard_pos = read_map("sample.txt")
     print(count_guard_path(grid, guard_pos))
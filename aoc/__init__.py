@@ -0,0 +1,5 @@
+"""Shared tooling to discover, run and time the solutions in this repository.
+
+Every solution module registers its parts by defining ``part_one`` and
+``part_two`` functions that take the path of a puzzle input and return the answer.
+"""
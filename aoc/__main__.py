@@ -0,0 +1,331 @@
+import argparse
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+from aoc.batch import find_inputs, format_batch, format_throughput, solve_batch
+from aoc.bench import (
+    BASELINE_PATH,
+    BENCHMARKS,
+    METRICS,
+    THRESHOLD,
+    bench,
+    compare,
+    format_comparisons,
+    load_baseline,
+    save_baseline,
+)
+from aoc.cache import ResultCache
+from aoc.discover import Solution, discover, find
+from aoc.harness import MIN_SAMPLE_TIME, SAMPLES, WARMUP, format_timings, time_parts
+from aoc.profiling import MODES, PROFILE_DIR, profile_part
+from aoc.report import format_table, to_json
+from aoc.runner import list_parts, run
+from aoc.scaling import format_scaling, scale
+from aoc.variants import find_registries, format_checks
+from aoc.worker import SOCKET_PATH, format_replies, serve, stop, submit
+
+
+TARGET = re.compile(r"^(\d{4})(?:/(?:day)?(\d+))?$")
+
+
+def parse_target(text: str) -> tuple[int, int | None]:
+    m = TARGET.match(text)
+    if m is None:
+        raise argparse.ArgumentTypeError(f"Expected YEAR or YEAR/DAY, got {text}")
+    year, day = m.groups()
+    return int(year), int(day) if day is not None else None
+
+
+def parse_day(text: str) -> tuple[int, int]:
+    year, day = parse_target(text)
+    if day is None:
+        raise argparse.ArgumentTypeError(f"Expected YEAR/DAY, got {text}")
+    return year, day
+
+
+def select(targets: list[tuple[int, int | None]]) -> list[Solution]:
+    solutions = discover()
+    if not targets:
+        return solutions
+    return [
+        solution
+        for solution in solutions
+        if any(solution.year == year and (day is None or solution.day == day) for year, day in targets)
+    ]
+
+
+def make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="aoc", description="Run and time the solutions.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run parts and report their timings")
+    run_parser.add_argument("targets", nargs="*", type=parse_target, help="YEAR or YEAR/DAY, all solutions if omitted")
+    run_parser.add_argument("--part", type=int, choices=[1, 2], action="append", help="only run the given part")
+    run_parser.add_argument("--input", type=Path, help="input file to use instead of the day's input.txt")
+    run_parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    run_parser.add_argument("--in-process", action="store_true", help="run every part in this process, without memory budgets")
+    run_parser.add_argument(
+        "-j", "--jobs", type=int, default=1, help="isolated parts to run at the same time, 0 for one per cpu"
+    )
+    run_parser.add_argument(
+        "--memory", action="store_true", help="trace Python allocations, slower, implies --refresh"
+    )
+    run_parser.add_argument("--no-cache", action="store_true", help="neither read nor store cached results")
+    run_parser.add_argument("--refresh", action="store_true", help="run every part again and update the cache")
+    run_parser.add_argument(
+        "--profile",
+        choices=MODES,
+        nargs="?",
+        const=MODES[0],
+        help="profile every part in this process instead of timing it, sampling stacks by default",
+    )
+    run_parser.add_argument("--top", type=int, default=15, help="rows in the profile tables")
+    run_parser.add_argument(
+        "--lines", nargs="+", default=[], metavar="FUNCTION", help="also time these functions line by line"
+    )
+    run_parser.add_argument("--profile-dir", type=Path, default=PROFILE_DIR, help="where to write the raw profiles")
+    run_parser.add_argument(
+        "--timeout", type=float, default=300.0, help="seconds before an isolated part is killed, 0 to wait forever"
+    )
+
+    scale_parser = commands.add_parser("scale", help="time a day on generated inputs of growing size")
+    scale_parser.add_argument("target", type=parse_day, help="YEAR/DAY with a generate.py")
+    scale_parser.add_argument("--sizes", type=int, nargs="+", help="input sizes, the generator's SIZES if omitted")
+    scale_parser.add_argument("--part", type=int, choices=[1, 2], help="time a whole part instead of the workload")
+    scale_parser.add_argument("--repeat", type=int, default=1, help="runs per size, the best one is kept")
+    scale_parser.add_argument("--seed", type=int, default=0, help="seed for the generator")
+    scale_parser.add_argument("--limit", type=float, help="skip larger sizes once a run takes this many seconds")
+
+    bench_parser = commands.add_parser("bench", help="time parts repeatedly and compare them against a baseline")
+    bench_parser.add_argument(
+        "targets", nargs="*", type=parse_target, help="YEAR or YEAR/DAY, the usual hot days if omitted"
+    )
+    bench_parser.add_argument("--part", type=int, choices=[1, 2], action="append", help="only run the given part")
+    bench_parser.add_argument("--repeat", type=int, default=5, help="runs per part, each in a fresh interpreter")
+    bench_parser.add_argument("--metric", choices=METRICS, default=METRICS[0], help="time to compare")
+    bench_parser.add_argument(
+        "--threshold", type=float, default=THRESHOLD, help="slowdown of the median that fails, 0.1 for 10%%"
+    )
+    bench_parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="baseline file to compare against")
+    bench_parser.add_argument("--update", action="store_true", help="store the new timings in the baseline")
+    bench_parser.add_argument(
+        "--timeout", type=float, default=300.0, help="seconds before a run is killed, 0 to wait forever"
+    )
+
+    time_parser = commands.add_parser(
+        "time", help="time parts precisely, one forked process per sample and repeated calls for fast parts"
+    )
+    time_parser.add_argument("targets", nargs="+", type=parse_target, help="YEAR or YEAR/DAY")
+    time_parser.add_argument("--part", type=int, choices=[1, 2], action="append", help="only time the given part")
+    time_parser.add_argument("--input", type=Path, help="input file to use instead of the day's input.txt")
+    time_parser.add_argument("--samples", type=int, default=SAMPLES, help="forked processes timed per part")
+    time_parser.add_argument("--warmup", type=int, default=WARMUP, help="untimed calls before every sample")
+    time_parser.add_argument(
+        "--min-time", type=float, default=MIN_SAMPLE_TIME, help="seconds a sample lasts at least, in repeated calls"
+    )
+    time_parser.add_argument("--cpu", type=int, help="pin the samples to this cpu, ideally an isolated one")
+    time_parser.add_argument("--no-gc", action="store_true", help="disable the garbage collector while timing")
+    time_parser.add_argument(
+        "--timeout", type=float, default=300.0, help="seconds before a sample is killed, 0 to wait forever"
+    )
+
+    worker_parser = commands.add_parser("worker", help="keep the solutions imported and solve parts sent to a socket")
+    worker_parser.add_argument("--socket", type=Path, default=SOCKET_PATH, help="Unix socket to listen on")
+    worker_parser.add_argument("--stop", action="store_true", help="stop the worker listening on the socket")
+
+    submit_parser = commands.add_parser("submit", help="solve parts on a running worker")
+    submit_parser.add_argument("targets", nargs="+", type=parse_target, help="YEAR or YEAR/DAY")
+    submit_parser.add_argument("--part", type=int, choices=[1, 2], action="append", help="only run the given part")
+    submit_parser.add_argument("--input", type=Path, help="input file to use instead of the day's input.txt")
+    submit_parser.add_argument("--socket", type=Path, default=SOCKET_PATH, help="Unix socket of the worker")
+
+    batch_parser = commands.add_parser("batch", help="solve one day on many inputs")
+    batch_parser.add_argument("target", type=parse_day, help="YEAR/DAY")
+    batch_parser.add_argument("inputs", nargs="+", type=Path, help="input files, or directories of .txt files")
+    batch_parser.add_argument("--part", type=int, choices=[1, 2], action="append", help="only run the given part")
+    batch_parser.add_argument(
+        "-j", "--jobs", type=int, default=1, help="worker processes, 0 for one per cpu, 1 to solve in this process"
+    )
+    batch_parser.add_argument("--summary", action="store_true", help="only print the throughput")
+
+    variants_parser = commands.add_parser(
+        "variants", help="cross check the registered variants of every day on their small examples"
+    )
+    variants_parser.add_argument("targets", nargs="*", type=parse_target, help="YEAR or YEAR/DAY, all solutions if omitted")
+    return parser
+
+
+def main_batch(args: argparse.Namespace) -> int:
+    try:
+        solution = find(*args.target)
+    except LookupError as error:
+        print(error, file=sys.stderr)
+        return 1
+    inputs = find_inputs(args.inputs)
+    start = time.perf_counter()
+    results = list(solve_batch(solution, inputs, args.part or (1, 2), args.jobs or os.cpu_count() or 1))
+    seconds = time.perf_counter() - start
+    if not args.summary:
+        print(format_batch(results), end="\n\n")
+    print(format_throughput(len(inputs), seconds))
+    return 1 if any(result.measurement.error is not None for result in results) else 0
+
+
+def main_variants(solutions: list[Solution]) -> int:
+    checks = []
+    failed = False
+    for solution in solutions:
+        try:
+            registries = find_registries(solution.load())
+        except Exception as error:
+            print(f"{solution.name} failed to load: {error!r}", file=sys.stderr)
+            failed = True
+            continue
+        for registry in registries:
+            checks.extend((solution.name, check) for check in registry.cross_check())
+    if not checks:
+        print("No variants registered.", file=sys.stderr)
+        return 1
+    print(format_checks(checks))
+    return 1 if failed or any(not check.agrees for _, check in checks) else 0
+
+
+def main_time(solutions: list[Solution], args: argparse.Namespace) -> int:
+    timings = []
+    for timing in time_parts(
+        solutions,
+        args.part or (1, 2),
+        args.input,
+        args.samples,
+        args.warmup,
+        args.cpu,
+        args.no_gc,
+        args.min_time,
+        args.timeout or None,
+    ):
+        print(f"{timing.name} part {timing.part}: {timing.error or f'{timing.calls} calls per sample'}", file=sys.stderr)
+        timings.append(timing)
+    print(format_timings(timings))
+    return 1 if any(timing.error is not None for timing in timings) else 0
+
+
+def main_worker(args: argparse.Namespace) -> int:
+    try:
+        if args.stop:
+            stop(args.socket)
+        else:
+            serve(args.socket)
+    except (OSError, RuntimeError) as error:
+        print(error, file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def main_submit(solutions: list[Solution], args: argparse.Namespace) -> int:
+    try:
+        replies = list(submit(list_parts(solutions, args.part or (1, 2)), args.input, args.socket))
+    except OSError as error:
+        print(f"No worker on {args.socket}: {error}", file=sys.stderr)
+        return 1
+    print(format_replies(replies))
+    return 1 if any(reply.measurement.error is not None for reply in replies) else 0
+
+
+def main_bench(args: argparse.Namespace) -> int:
+    solutions = select(args.targets or BENCHMARKS)
+    if not solutions:
+        print("No solutions matched.", file=sys.stderr)
+        return 1
+    benchmarks = []
+    for benchmark in bench(solutions, args.part or (1, 2), args.repeat, args.timeout or None):
+        print(f"{benchmark.key}: {benchmark.error or f'{benchmark.runs} runs'}", file=sys.stderr)
+        benchmarks.append(benchmark)
+    comparisons = compare(benchmarks, load_baseline(args.baseline), args.metric, args.threshold)
+    print(format_comparisons(comparisons))
+    if args.update:
+        save_baseline(benchmarks, args.baseline)
+        return 1 if any(benchmark.error is not None for benchmark in benchmarks) else 0
+    return 1 if any(comparison.failed for comparison in comparisons) else 0
+
+
+def main_scale(args: argparse.Namespace) -> int:
+    samples = []
+    try:
+        solution = find(*args.target)
+        for sample in scale(solution, args.sizes, args.part, args.repeat, args.seed, args.limit):
+            print(f"{solution.name} size {sample.size}: {sample.seconds:.4f}s", file=sys.stderr)
+            samples.append(sample)
+    except LookupError as error:
+        print(error, file=sys.stderr)
+        return 1
+    print(format_scaling(samples))
+    return 0
+
+
+def main_profile(solutions: list[Solution], args: argparse.Namespace) -> int:
+    failed = False
+    for solution, part in list_parts(solutions, args.part or (1, 2)):
+        try:
+            report = profile_part(solution, part, args.input, args.profile, args.top, args.lines, args.profile_dir)
+        except Exception as error:
+            report = f"{solution.name} part {part} failed: {error!r}"
+            failed = True
+        print(report, end="\n\n")
+    return 1 if failed else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = make_parser().parse_args(argv)
+    if args.command == "scale":
+        return main_scale(args)
+    if args.command == "bench":
+        return main_bench(args)
+    if args.command == "worker":
+        return main_worker(args)
+    if args.command == "batch":
+        return main_batch(args)
+
+    solutions = select(args.targets)
+    if not solutions:
+        print("No solutions matched.", file=sys.stderr)
+        return 1
+
+    if args.command == "submit":
+        return main_submit(solutions, args)
+    if args.command == "variants":
+        return main_variants(solutions)
+    if args.command == "time":
+        return main_time(solutions, args)
+    if args.profile is not None:
+        return main_profile(solutions, args)
+
+    cache = None if args.no_cache else ResultCache()
+    try:
+        measurements = list(
+            run(
+                solutions,
+                args.part or (1, 2),
+                args.input,
+                isolate=not args.in_process,
+                timeout=args.timeout or None,
+                cache=cache,
+                refresh=args.refresh or args.memory,
+                jobs=args.jobs or os.cpu_count() or 1,
+                trace_memory=args.memory,
+            )
+        )
+    finally:
+        if cache is not None:
+            cache.close()
+    measurements.sort(key=lambda measurement: (measurement.year, measurement.day, measurement.part))
+    print(to_json(measurements) if args.json else format_table(measurements))
+    return 1 if any(measurement.error is not None for measurement in measurements) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
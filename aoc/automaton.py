@@ -0,0 +1,192 @@
+"""Life-like cellular automata, where a cell lives on when its number of live neighbours
+is in `survival` and comes alive when it is in `birth`.
+
+`SparseAutomaton` runs on an unbounded lattice given by neighbour offsets, the live cells
+being a set of coordinates packed into single ints so that a neighbour is one addition.
+`BoundedAutomaton` runs on a finite world where every cell has its own list of
+neighbours, either re-evaluating only the cells next to the last changes or,
+when NumPy is installed, the whole world at once as arrays.
+"""
+
+from collections import Counter
+from collections.abc import Collection, Iterable, Sequence
+
+from aoc.counters import count
+
+try:
+    import numpy as np
+except ImportError:  # the dense backend is optional
+    np = None
+
+
+# bits per packed coordinate, coordinates stay within 2**(BITS - 1) of the origin
+BITS = 16
+BIAS = 1 << (BITS - 1)
+
+BACKENDS = ("auto", "python", "numpy")
+
+
+class SparseAutomaton:
+    """Cells on an unbounded lattice of any dimension, alive or not."""
+
+    def __init__(self, offsets: Iterable[Sequence[int]], birth: Collection[int], survival: Collection[int]) -> None:
+        offsets = [tuple(offset) for offset in offsets]
+        if not offsets or len({len(offset) for offset in offsets}) != 1:
+            raise ValueError("Offsets must be non empty and all of the same dimension")
+        if 0 in birth:
+            raise ValueError("Cells cannot be born without live neighbours in an unbounded world")
+        self.dimensions = len(offsets[0])
+        origin = self.pack((0,) * self.dimensions)
+        self.deltas = tuple(self.pack(offset) - origin for offset in offsets)
+        # how far a generation spreads in any dimension
+        self.reach = max(abs(coord) for offset in offsets for coord in offset)
+        self.birth = frozenset(birth)
+        self.survival = frozenset(survival)
+
+    def pack(self, coords: Sequence[int]) -> int:
+        cell = 0
+        for coord in reversed(coords):
+            if not -BIAS <= coord < BIAS:
+                raise ValueError(f"Coordinate {coord} does not fit in {BITS} bits")
+            cell = cell << BITS | (coord + BIAS)
+        return cell
+
+    def unpack(self, cell: int) -> tuple[int, ...]:
+        mask = (1 << BITS) - 1
+        return tuple((cell >> (BITS * dim) & mask) - BIAS for dim in range(self.dimensions))
+
+    def bounds(self, cells: Iterable[int]) -> tuple[int, int]:
+        """The smallest and largest coordinate of the cells in any dimension."""
+        coords = [coord for cell in cells for coord in self.unpack(cell)]
+        return (min(coords), max(coords)) if coords else (0, 0)
+
+    def step(self, cells: set[int]) -> set[int]:
+        """The next generation, the cells must stay `reach` inside the packed range,
+        a coordinate past it would silently carry into the next one."""
+        counts: Counter[int] = Counter()
+        for delta in self.deltas:
+            counts.update(map(delta.__add__, cells))
+        count("cells evaluated", len(counts))
+        birth, survival = self.birth, self.survival
+        alive = {cell for cell, total in counts.items() if (total in survival if cell in cells else total in birth)}
+        if 0 in survival:
+            alive.update(cell for cell in cells if cell not in counts)
+        return alive
+
+    def run(self, cells: Iterable[Sequence[int]], generations: int) -> set[int]:
+        """The packed live cells after the generations, starting from the given coordinates.
+
+        Raises ValueError when the cells grow past the coordinates that fit in `BITS` bits.
+        """
+        alive = {self.pack(coords) for coords in cells}
+        low, high = self.bounds(alive)
+        for _ in range(generations):
+            # bounds of the next generation, measured on the cells only when they might not fit
+            low, high = low - self.reach, high + self.reach
+            if low < -BIAS or high >= BIAS:
+                low, high = self.bounds(alive)
+                low, high = low - self.reach, high + self.reach
+                if low < -BIAS or high >= BIAS:
+                    raise ValueError(f"Cells between {low} and {high} do not fit in {BITS} bits")
+            alive = self.step(alive)
+        return alive
+
+
+class BoundedAutomaton:
+    """Cells 0 to n - 1 where `neighbors[cell]` lists the neighbours of a cell.
+
+    Only the given `cells` take part, every other one stays dead, so births
+    without live neighbours are allowed. Neighbourhoods need not be symmetric.
+    """
+
+    def __init__(
+        self,
+        neighbors: Sequence[Sequence[int]],
+        birth: Collection[int],
+        survival: Collection[int],
+        cells: Iterable[int] | None = None,
+        backend: str = "auto",
+    ) -> None:
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend}, expected one of {', '.join(BACKENDS)}")
+        if backend == "numpy" and np is None:
+            raise ImportError("The numpy backend needs NumPy installed")
+        self.neighbors = neighbors
+        self.birth = frozenset(birth)
+        self.survival = frozenset(survival)
+        self.cells = sorted(range(len(neighbors)) if cells is None else set(cells))
+        if backend == "auto":
+            backend = "python" if np is None else "numpy"
+        self.backend = backend
+        # the cells whose count of live neighbours changes with a cell
+        self.watchers: list[list[int]] = [[] for _ in neighbors]
+        for cell, others in enumerate(neighbors):
+            for other in others:
+                self.watchers[other].append(cell)
+
+    def run(self, alive: bytes | bytearray, generations: int | None = None) -> bytearray:
+        """Live cells, marked by non zero bytes, after the generations or once nothing changes."""
+        if self.backend == "numpy":
+            return self._run_numpy(alive, generations)
+        return self._run_python(alive, generations)
+
+    def _run_python(self, alive: bytes | bytearray, generations: int | None) -> bytearray:
+        taking_part = bytearray(len(self.neighbors))
+        for cell in self.cells:
+            taking_part[cell] = 1
+        state = bytearray(1 if alive[cell] and taking_part[cell] else 0 for cell in range(len(self.neighbors)))
+        counts = [sum(state[other] for other in others) for others in self.neighbors]
+        birth, survival, watchers = self.birth, self.survival, self.watchers
+        pending: Iterable[int] = self.cells
+        generation = 0
+        while generations is None or generation < generations:
+            evaluated = 0
+            flips: list[int] = []
+            for cell in pending:
+                if not taking_part[cell]:
+                    continue
+                evaluated += 1
+                lives = counts[cell] in survival if state[cell] else counts[cell] in birth
+                if lives != bool(state[cell]):
+                    flips.append(cell)
+            count("cells evaluated", evaluated)
+            if not flips:
+                break
+            # only the flipped cells and those watching them can change next
+            changed: set[int] = set(flips)
+            for cell in flips:
+                state[cell] ^= 1
+                delta = 1 if state[cell] else -1
+                for watcher in watchers[cell]:
+                    counts[watcher] += delta
+                changed.update(watchers[cell])
+            pending = changed
+            generation += 1
+        return state
+
+    def _run_numpy(self, alive: bytes | bytearray, generations: int | None) -> bytearray:
+        size = len(self.neighbors)
+        width = max((len(others) for others in self.neighbors), default=0)
+        # missing neighbours point at an extra cell that is always dead
+        table = np.full((size + 1, width), size, dtype=np.intp)
+        for cell, others in enumerate(self.neighbors):
+            table[cell, : len(others)] = others
+        taking_part = np.zeros(size + 1, dtype=bool)
+        taking_part[self.cells] = True
+        born = np.zeros(width + 1, dtype=bool)
+        born[[total for total in self.birth if total <= width]] = True
+        survives = np.zeros(width + 1, dtype=bool)
+        survives[[total for total in self.survival if total <= width]] = True
+        state = np.zeros(size + 1, dtype=np.uint8)
+        state[:size] = np.frombuffer(bytes(alive), dtype=np.uint8) != 0
+        state &= taking_part
+        generation = 0
+        while generations is None or generation < generations:
+            counts = state[table].sum(axis=1)
+            new = np.where(state != 0, survives[counts], born[counts]) & taking_part
+            count("cells evaluated", len(self.cells))
+            if np.array_equal(new, state):
+                break
+            state = new.astype(np.uint8)
+            generation += 1
+        return bytearray(state[:size].tobytes())
@@ -0,0 +1,84 @@
+"""Solving one day on many inputs.
+
+Each process imports the solution once and then solves input after input, so whatever
+the module sets up at import time or keeps in its caches (compiled patterns, lookup
+tables, precomputed directions) is paid for once per process instead of once per input.
+"""
+
+from collections.abc import Collection, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from multiprocessing import get_context
+from pathlib import Path
+
+from aoc.discover import Solution
+from aoc.report import align, format_answer
+from aoc.runner import Measurement, measure
+
+
+# inputs submitted to the pool per worker ahead of the results, enough to keep
+# every worker busy without queueing a whole corpus at once
+PENDING_PER_JOB = 4
+
+
+@dataclass
+class BatchResult:
+    input_path: Path
+    measurement: Measurement
+
+
+def find_inputs(paths: Iterable[Path]) -> list[Path]:
+    """The given files, and the .txt files inside of the given directories."""
+    found: list[Path] = []
+    for path in paths:
+        found.extend(sorted(path.glob("*.txt")) if path.is_dir() else [path])
+    return found
+
+
+def _load(solution: Solution) -> None:
+    solution.load()
+
+
+def solve_batch(
+    solution: Solution, inputs: Iterable[Path], parts: Collection[int] = (1, 2), jobs: int = 1
+) -> Iterator[BatchResult]:
+    """Solves the parts on every input, yielding results as they complete.
+
+    With one job everything runs in this process in input order, with more
+    a pool of worker processes solves them and results come in completion order.
+    """
+    registered = [part for part in sorted(solution.parts()) if part in parts]
+    tasks = ((path, part) for path in inputs for part in registered)
+    if jobs <= 1:
+        for path, part in tasks:
+            yield BatchResult(path, measure(solution, part, path))
+        return
+
+    context = get_context("spawn")
+    with ProcessPoolExecutor(jobs, mp_context=context, initializer=_load, initargs=(solution,)) as pool:
+        pending: dict[Future[Measurement], Path] = {}
+        for path, part in tasks:
+            pending[pool.submit(measure, solution, part, path)] = path
+            if len(pending) < jobs * PENDING_PER_JOB:
+                continue
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield BatchResult(pending.pop(future), future.result())
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield BatchResult(pending.pop(future), future.result())
+
+
+def format_batch(results: Iterable[BatchResult]) -> str:
+    header = ("input", "part", "wall (s)", "answer")
+    rows = [header]
+    for result in results:
+        measurement = result.measurement
+        rows.append((str(result.input_path), str(measurement.part), f"{measurement.wall:.4f}", format_answer(measurement)))
+    return align(rows)
+
+
+def format_throughput(inputs: int, seconds: float) -> str:
+    throughput = inputs / seconds if seconds > 0 else float("inf")
+    return f"{inputs} inputs in {seconds:.2f}s, {throughput:.1f} inputs/s"
@@ -0,0 +1,222 @@
+import json
+import statistics
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from aoc.discover import ROOT, Solution
+from aoc.report import align
+from aoc.runner import list_parts, measure_isolated
+
+
+BASELINE_PATH = ROOT / "benchmarks.json"
+
+# days benchmarked when none are given: the Intcode days and the hottest loops
+BENCHMARKS: list[tuple[int, int | None]] = [
+    (2019, 5),
+    (2019, 7),
+    (2019, 9),
+    (2019, 11),
+    (2020, 11),
+    (2020, 15),
+    (2020, 23),
+    (2024, 6),
+]
+
+METRICS = ("cpu", "wall")
+
+# a part fails when its median grows by more than this share of the baseline median
+THRESHOLD = 0.1
+
+# differences below this many seconds are timer and scheduling noise, whatever the share
+RESOLUTION = 0.001
+
+
+@dataclass
+class Stats:
+    median: float
+    mad: float
+
+    @classmethod
+    def of(cls, values: Sequence[float]) -> "Stats":
+        """Median and median absolute deviation, both robust to the odd slow run."""
+        median = statistics.median(values)
+        return cls(median, statistics.median(abs(value - median) for value in values))
+
+    def rounded(self) -> dict[str, float]:
+        return {"median": round(self.median, 6), "mad": round(self.mad, 6)}
+
+
+@dataclass
+class Benchmark:
+    year: int
+    day: int
+    part: int
+    runs: int = 0
+    answer: object = None
+    cpu: Stats | None = None
+    wall: Stats | None = None
+    error: str | None = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.year}/day{self.day} part {self.part}"
+
+    def stats(self, metric: str) -> Stats | None:
+        return self.cpu if metric == "cpu" else self.wall
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "runs": self.runs,
+            "answer": self.answer,
+            "cpu": self.cpu.rounded() if self.cpu is not None else None,
+            "wall": self.wall.rounded() if self.wall is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, key: str, data: Mapping[str, object]) -> "Benchmark":
+        name, part = key.split(" part ")
+        year, day = name.split("/day")
+        return cls(
+            int(year),
+            int(day),
+            int(part),
+            data["runs"],
+            data["answer"],
+            Stats(**data["cpu"]) if data.get("cpu") else None,
+            Stats(**data["wall"]) if data.get("wall") else None,
+        )
+
+
+def _jsonable(answer: object) -> object:
+    """The answer as it reads back from the baseline file, so the two compare equal."""
+    try:
+        return json.loads(json.dumps(answer))
+    except TypeError:
+        return str(answer)
+
+
+def bench_part(solution: Solution, part: int, repeat: int = 5, timeout: float | None = None) -> Benchmark:
+    """Runs a part `repeat` times, each in a fresh interpreter, and keeps the spread of its timings.
+
+    The first failing run stops the benchmark.
+    """
+    benchmark = Benchmark(solution.year, solution.day, part)
+    walls: list[float] = []
+    cpus: list[float] = []
+    for _ in range(repeat):
+        measurement = measure_isolated(solution, part, timeout=timeout)
+        if measurement.error is not None:
+            benchmark.error = measurement.error
+            return benchmark
+        benchmark.answer = _jsonable(measurement.answer)
+        walls.append(measurement.wall)
+        cpus.append(measurement.cpu)
+    benchmark.runs = len(walls)
+    if walls:
+        benchmark.wall = Stats.of(walls)
+        benchmark.cpu = Stats.of(cpus)
+    return benchmark
+
+
+def bench(
+    solutions: Iterable[Solution], parts: Sequence[int] = (1, 2), repeat: int = 5, timeout: float | None = None
+) -> Iterator[Benchmark]:
+    for solution, part in list_parts(solutions, parts):
+        yield bench_part(solution, part, repeat, timeout)
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict[str, Benchmark]:
+    if not path.exists():
+        return {}
+    with open(path) as file:
+        return {key: Benchmark.from_dict(key, data) for key, data in json.load(file).items()}
+
+
+def save_baseline(benchmarks: Iterable[Benchmark], path: Path = BASELINE_PATH) -> None:
+    """Stores the successful benchmarks, replacing their previous entries and keeping the others."""
+    baseline = load_baseline(path)
+    baseline.update((benchmark.key, benchmark) for benchmark in benchmarks if benchmark.error is None)
+    ordered = sorted(baseline.values(), key=lambda benchmark: (benchmark.year, benchmark.day, benchmark.part))
+    with open(path, "w") as file:
+        json.dump({benchmark.key: benchmark.to_dict() for benchmark in ordered}, file, indent=2, ensure_ascii=False)
+        file.write("\n")
+
+
+@dataclass
+class Comparison:
+    current: Benchmark
+    baseline: Benchmark | None
+    metric: str = METRICS[0]
+    threshold: float = THRESHOLD
+
+    @property
+    def change(self) -> float | None:
+        """Relative change of the median, 0.25 for a part that got 25% slower."""
+        if self.baseline is None:
+            return None
+        current, baseline = self.current.stats(self.metric), self.baseline.stats(self.metric)
+        if current is None or baseline is None or baseline.median == 0:
+            return None
+        return current.median / baseline.median - 1
+
+    @property
+    def status(self) -> str:
+        """One of error, new, answer changed, slower, faster or ok.
+
+        Slower and faster need the medians to differ by more than the threshold
+        and by more than the spread of both sets of runs.
+        """
+        if self.current.error is not None:
+            return "error"
+        if self.baseline is None or self.change is None:
+            return "new"
+        if self.current.answer != self.baseline.answer:
+            return "answer changed"
+        current, baseline = self.current.stats(self.metric), self.baseline.stats(self.metric)
+        noise = max(current.mad + baseline.mad, RESOLUTION)
+        if self.change > self.threshold and current.median - baseline.median > noise:
+            return "slower"
+        if self.change < -self.threshold and baseline.median - current.median > noise:
+            return "faster"
+        return "ok"
+
+    @property
+    def failed(self) -> bool:
+        return self.status in {"error", "answer changed", "slower"}
+
+
+def compare(
+    benchmarks: Iterable[Benchmark],
+    baseline: Mapping[str, Benchmark],
+    metric: str = METRICS[0],
+    threshold: float = THRESHOLD,
+) -> list[Comparison]:
+    return [Comparison(benchmark, baseline.get(benchmark.key), metric, threshold) for benchmark in benchmarks]
+
+
+def format_comparisons(comparisons: Sequence[Comparison]) -> str:
+    metric = comparisons[0].metric if comparisons else METRICS[0]
+    header = ("day", "part", "runs", f"{metric} median (s)", "mad (s)", "baseline (s)", "change", "status")
+    rows: list[tuple[str, ...]] = [header]
+    for comparison in comparisons:
+        current = comparison.current
+        stats = current.stats(metric)
+        baseline = comparison.baseline.stats(metric) if comparison.baseline is not None else None
+        change = comparison.change
+        status = comparison.status
+        if status == "error":
+            status = f"error: {current.error}"
+        rows.append(
+            (
+                f"{current.year}/day{current.day}",
+                str(current.part),
+                str(current.runs),
+                f"{stats.median:.4f}" if stats is not None else "",
+                f"{stats.mad:.4f}" if stats is not None else "",
+                f"{baseline.median:.4f}" if baseline is not None else "",
+                f"{change:+.1%}" if change is not None else "",
+                status,
+            )
+        )
+    return align(rows)
@@ -0,0 +1,141 @@
+import hashlib
+import json
+import marshal
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+
+from aoc.discover import ROOT, Solution
+from aoc.runner import Measurement
+
+
+CACHE_PATH = ROOT / ".aoc-cache.sqlite"
+
+# entries kept before the least recently used ones are evicted
+MAX_ENTRIES = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    year INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    part INTEGER NOT NULL,
+    answer TEXT NOT NULL,
+    wall REAL NOT NULL,
+    cpu REAL NOT NULL,
+    peak_rss INTEGER NOT NULL,
+    used REAL NOT NULL
+)
+"""
+
+
+def _module_file(module: ModuleType) -> Path | None:
+    file = getattr(module, "__file__", None)
+    if file is None:
+        return None
+    path = Path(file).resolve()
+    return path if path.is_relative_to(ROOT) else None
+
+
+def local_sources(module: ModuleType) -> dict[Path, ModuleType]:
+    """The module and every module of this repository it depends on, directly or not.
+
+    Dependencies are found through the module globals, either imported modules
+    or the modules that define the imported functions and classes.
+    """
+    found: dict[Path, ModuleType] = {}
+    pending = [module]
+    while pending:
+        current = pending.pop()
+        path = _module_file(current)
+        if path is None or path in found:
+            continue
+        found[path] = current
+        for value in vars(current).values():
+            if isinstance(value, ModuleType):
+                pending.append(value)
+            elif (name := getattr(value, "__module__", None)) in sys.modules:
+                pending.append(sys.modules[name])
+    return found
+
+
+def fingerprint(solution: Solution, part: int, input_path: Path | None = None) -> str:
+    """Hash of everything the answer depends on: the part's bytecode,
+    the source of the solution and of the local modules it uses, and the input."""
+    digest = hashlib.sha256()
+    digest.update(f"{solution.name} part {part} {sys.version}".encode())
+    digest.update(marshal.dumps(solution.parts()[part].__code__))
+    for path in sorted(local_sources(solution.load())):
+        digest.update(str(path.relative_to(ROOT)).encode())
+        digest.update(path.read_bytes())
+    digest.update(Path(input_path or solution.input_path).read_bytes())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Answers and timings of solved parts in an SQLite file, keyed by their fingerprint."""
+
+    def __init__(self, path: Path = CACHE_PATH, max_entries: int = MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._db = sqlite3.connect(path)
+        self._db.execute(SCHEMA)
+
+    def key(self, solution: Solution, part: int, input_path: Path | None = None, isolated: bool = True) -> str | None:
+        """The fingerprint of a part, None if it cannot be computed, for example without an input.
+
+        Parts measured in the runner's own process are kept apart, their peak RSS is not comparable.
+        """
+        try:
+            key = fingerprint(solution, part, input_path)
+        except Exception:
+            return None
+        return key if isolated else f"{key} in-process"
+
+    def get(self, key: str) -> Measurement | None:
+        row = self._db.execute(
+            "SELECT year, day, part, answer, wall, cpu, peak_rss FROM results WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        with self._db:
+            self._db.execute("UPDATE results SET used = ? WHERE key = ?", (time.time(), key))
+        year, day, part, answer, wall, cpu, peak_rss = row
+        return Measurement(year, day, part, json.loads(answer), wall, cpu, peak_rss, cached=True)
+
+    def put(self, key: str, measurement: Measurement) -> None:
+        """Stores a successful measurement, answers that JSON cannot hold are not cached."""
+        if measurement.error is not None:
+            return
+        try:
+            answer = json.dumps(measurement.answer)
+        except TypeError:
+            return
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    measurement.year,
+                    measurement.day,
+                    measurement.part,
+                    answer,
+                    measurement.wall,
+                    measurement.cpu,
+                    measurement.peak_rss,
+                    time.time(),
+                ),
+            )
+            self._db.execute(
+                "DELETE FROM results WHERE key NOT IN (SELECT key FROM results ORDER BY used DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+
+    def costs(self) -> dict[tuple[int, int, int], float]:
+        """The most recently used wall time of every part, whatever code it was measured with."""
+        rows = self._db.execute("SELECT year, day, part, wall FROM results ORDER BY used")
+        return {(year, day, part): wall for year, day, part, wall in rows}
+
+    def close(self) -> None:
+        self._db.close()
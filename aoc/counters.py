@@ -0,0 +1,29 @@
+"""Counts of the work a solver does, to compare algorithms independently of machine noise.
+
+Solvers call ``count("name", n)`` from their hot loops, ideally once per loop with
+a total rather than once per iteration. Nothing is recorded unless the caller wraps
+the work in ``counting()``, so a disabled counter costs a global lookup and a test.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+# None while no one is counting
+_counts: dict[str, int] | None = None
+
+
+def count(name: str, n: int = 1) -> None:
+    if _counts is not None:
+        _counts[name] = _counts.get(name, 0) + n
+
+
+@contextmanager
+def counting() -> Iterator[dict[str, int]]:
+    """Records counts while the block runs into the yielded dict, nested blocks count on their own."""
+    global _counts
+    previous, _counts = _counts, {}
+    try:
+        yield _counts
+    finally:
+        _counts = previous
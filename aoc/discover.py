@@ -0,0 +1,128 @@
+import importlib.util
+import re
+import sys
+from collections.abc import Callable, Collection
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+YEAR = re.compile(r"^\d{4}$")
+DAY = re.compile(r"^day(\d+)$")
+
+# the registration interface, a solution module exposes one function per part
+PARTS = {1: "part_one", 2: "part_two"}
+
+# optional module constant with the peak RSS allowed in MiB,
+# either one number for every part or a dict from part to number
+MEMORY_BUDGET = "MEMORY_BUDGET_MIB"
+
+Part = Callable[[str], object]
+
+_MODULES: dict[Path, ModuleType] = {}
+
+
+def load_module(path: Path, name: str) -> ModuleType:
+    """Imports a module from a file once per process.
+
+    The module's directory is on the path while importing,
+    the same as when the file is run as a script.
+    """
+    module = _MODULES.get(path)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(name, path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot load module {path}")
+        module = importlib.util.module_from_spec(spec)
+        sys.path.insert(0, str(path.parent))
+        try:
+            spec.loader.exec_module(module)
+        finally:
+            sys.path.remove(str(path.parent))
+        _MODULES[path] = module
+    return module
+
+
+@dataclass(frozen=True, order=True)
+class Solution:
+    year: int
+    day: int
+    path: Path
+
+    @property
+    def name(self) -> str:
+        return f"{self.year}/day{self.day}"
+
+    @property
+    def input_path(self) -> Path:
+        return self.path.parent / "input.txt"
+
+    @property
+    def generator_path(self) -> Path:
+        return self.path.parent / "generate.py"
+
+    def load(self) -> ModuleType:
+        """Imports the solution module once per process."""
+        return load_module(self.path, f"aoc_{self.year}_day{self.day}")
+
+    def load_generator(self) -> ModuleType:
+        """Imports the synthetic input generator of this day, if it has one."""
+        if not self.generator_path.is_file():
+            raise LookupError(f"No input generator for {self.name}")
+        return load_module(self.generator_path, f"aoc_{self.year}_day{self.day}_generate")
+
+    def parts(self) -> dict[int, Part]:
+        module = self.load()
+        return {
+            part: func
+            for part, name in PARTS.items()
+            if callable(func := getattr(module, name, None))
+        }
+
+    def memory_budget(self, part: int) -> int | None:
+        budget = getattr(self.load(), MEMORY_BUDGET, None)
+        if isinstance(budget, dict):
+            return budget.get(part)
+        return budget
+
+
+def find_solution_file(directory: Path, day: int) -> Path | None:
+    for name in ("main.py", f"day{day}.py"):
+        path = directory / name
+        if path.is_file():
+            return path
+    return None
+
+
+def discover(
+    root: Path = ROOT,
+    years: Collection[int] | None = None,
+    days: Collection[int] | None = None,
+) -> list[Solution]:
+    solutions: list[Solution] = []
+    for year_dir in root.iterdir():
+        if not year_dir.is_dir() or not YEAR.match(year_dir.name):
+            continue
+        year = int(year_dir.name)
+        if years is not None and year not in years:
+            continue
+        for day_dir in year_dir.iterdir():
+            m = DAY.match(day_dir.name)
+            if m is None or not day_dir.is_dir():
+                continue
+            day = int(m.group(1))
+            if days is not None and day not in days:
+                continue
+            path = find_solution_file(day_dir, day)
+            if path is not None:
+                solutions.append(Solution(year, day, path))
+    return sorted(solutions)
+
+
+def find(year: int, day: int, root: Path = ROOT) -> Solution:
+    solutions = discover(root, [year], [day])
+    if not solutions:
+        raise LookupError(f"No solution found for {year}/day{day}")
+    return solutions[0]
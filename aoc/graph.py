@@ -0,0 +1,199 @@
+"""Directed graphs in adjacency array form, over nodes interned to consecutive ints.
+
+The edges leaving node ``n`` are ``targets[offsets[n]:offsets[n + 1]]``, with their
+weights at the same positions in ``weights``. Every traversal is iterative,
+so depth is never limited by the recursion limit.
+"""
+
+from array import array
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from itertools import accumulate
+from typing import TypeVar
+
+
+T = TypeVar("T")
+
+# a labelled edge, with a weight of 1 when it has none
+Edge = tuple[Hashable, Hashable] | tuple[Hashable, Hashable, int]
+
+
+class Graph:
+    __slots__ = ("names", "ids", "offsets", "targets", "weights")
+
+    def __init__(self, names: list[Hashable], offsets: array, targets: array, weights: array) -> None:
+        if len(offsets) != len(names) + 1 or len(targets) != len(weights) or offsets[-1] != len(targets):
+            raise ValueError("Offsets, targets and weights do not describe the same graph")
+        self.names = names
+        self.ids = {name: node for node, name in enumerate(names)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Edge], nodes: Iterable[Hashable] = ()) -> "Graph":
+        """Interns the labels in order of first appearance, the given nodes first.
+
+        The edges of every node keep the order they were given in.
+        """
+        ids: dict[Hashable, int] = {}
+        for name in nodes:
+            ids.setdefault(name, len(ids))
+        sources = array("q")
+        targets = array("q")
+        weights = array("q")
+        for edge in edges:
+            sources.append(ids.setdefault(edge[0], len(ids)))
+            targets.append(ids.setdefault(edge[1], len(ids)))
+            weights.append(edge[2] if len(edge) > 2 else 1)
+        return cls._sorted(list(ids), sources, targets, weights)
+
+    @classmethod
+    def _sorted(cls, names: list[Hashable], sources: array, targets: array, weights: array) -> "Graph":
+        # a stable counting sort of the edges by their source
+        counts = [0] * (len(names) + 1)
+        for source in sources:
+            counts[source + 1] += 1
+        offsets = array("q", accumulate(counts))
+        position = list(offsets[:-1])
+        sorted_targets = array("q", bytes(8 * len(targets)))
+        sorted_weights = array("q", bytes(8 * len(weights)))
+        for source, target, weight in zip(sources, targets, weights):
+            idx = position[source]
+            position[source] += 1
+            sorted_targets[idx] = target
+            sorted_weights[idx] = weight
+        return cls(names, offsets, sorted_targets, sorted_weights)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def id(self, name: Hashable) -> int:
+        return self.ids[name]
+
+    def successors(self, node: int) -> array:
+        return self.targets[self.offsets[node] : self.offsets[node + 1]]
+
+    def edges(self, node: int) -> Iterator[tuple[int, int]]:
+        """The (target, weight) pairs of the edges leaving the node."""
+        start, end = self.offsets[node], self.offsets[node + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+
+    def in_degrees(self) -> list[int]:
+        degrees = [0] * len(self)
+        for target in self.targets:
+            degrees[target] += 1
+        return degrees
+
+    def reverse(self) -> "Graph":
+        """The same nodes with every edge turned around."""
+        sources = array("q", (node for node in range(len(self)) for _ in range(self.offsets[node + 1] - self.offsets[node])))
+        return self._sorted(self.names, self.targets, sources, self.weights)
+
+    def bfs(self, start: int | Iterable[int]) -> list[int]:
+        """Number of edges from the closest start node to every node, -1 for unreachable nodes."""
+        starts = [start] if isinstance(start, int) else list(start)
+        distances = [-1] * len(self)
+        for node in starts:
+            distances[node] = 0
+        queue = deque(starts)
+        offsets, targets = self.offsets, self.targets
+        while queue:
+            node = queue.popleft()
+            distance = distances[node] + 1
+            for idx in range(offsets[node], offsets[node + 1]):
+                target = targets[idx]
+                if distances[target] == -1:
+                    distances[target] = distance
+                    queue.append(target)
+        return distances
+
+    def reachable(self, start: int | Iterable[int]) -> list[int]:
+        """The nodes reachable from the start nodes, the start nodes included."""
+        return [node for node, distance in enumerate(self.bfs(start)) if distance != -1]
+
+    def topological_order(self, nodes: Iterable[int] | None = None) -> list[int]:
+        """Nodes ordered so that every edge goes forward, only considering the given nodes
+        and the edges between them when they are given.
+
+        Raises ValueError when the nodes are part of a cycle.
+        """
+        offsets, targets = self.offsets, self.targets
+        if nodes is None:
+            selected = range(len(self))
+            degrees = self.in_degrees()
+        else:
+            selected = list(nodes)
+            degrees = dict.fromkeys(selected, 0)
+            for node in selected:
+                for idx in range(offsets[node], offsets[node + 1]):
+                    if targets[idx] in degrees:
+                        degrees[targets[idx]] += 1
+        order = [node for node in selected if degrees[node] == 0]
+        for node in order:
+            for idx in range(offsets[node], offsets[node + 1]):
+                target = targets[idx]
+                if nodes is not None and target not in degrees:
+                    continue
+                degrees[target] -= 1
+                if degrees[target] == 0:
+                    order.append(target)
+        if len(order) != len(selected):
+            raise ValueError("The graph has a cycle")
+        return order
+
+    def fold(self, func: Callable[[int, list[tuple[int, T]]], T]) -> list[T]:
+        """Evaluates func(node, [(weight, value of target), ...]) once per node of a DAG,
+        every target before the nodes that point to it."""
+        values: list[T | None] = [None] * len(self)
+        for node in reversed(self.topological_order()):
+            values[node] = func(node, [(weight, values[target]) for target, weight in self.edges(node)])
+        return values  # type: ignore[return-value]
+
+
+class RootedTree:
+    """Depths and ancestors of the nodes reachable from the root of a tree shaped graph,
+    with ancestor tables doubling in reach for logarithmic lowest common ancestor queries."""
+
+    def __init__(self, graph: Graph, root: int) -> None:
+        self.root = root
+        self.depths = [-1] * len(graph)
+        self.depths[root] = 0
+        parents = [root] * len(graph)
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            for target in graph.successors(node):
+                if self.depths[target] != -1:
+                    raise ValueError(f"{graph.names[target]} is reached twice, the graph is not a tree")
+                self.depths[target] = self.depths[node] + 1
+                parents[target] = node
+                queue.append(target)
+        # ancestors[k][node] is the ancestor 2**k levels up, the root for anything higher
+        self.ancestors = [parents]
+        while 1 << len(self.ancestors) <= max(self.depths):
+            previous = self.ancestors[-1]
+            self.ancestors.append([previous[parent] for parent in previous])
+
+    def ancestor(self, node: int, levels: int) -> int:
+        for level, table in enumerate(self.ancestors):
+            if levels >> level & 1:
+                node = table[node]
+        return node
+
+    def lca(self, left: int, right: int) -> int:
+        if self.depths[left] == -1 or self.depths[right] == -1:
+            raise ValueError("Both nodes must be reachable from the root")
+        if self.depths[left] < self.depths[right]:
+            left, right = right, left
+        left = self.ancestor(left, self.depths[left] - self.depths[right])
+        if left == right:
+            return left
+        for table in reversed(self.ancestors):
+            if table[left] != table[right]:
+                left, right = table[left], table[right]
+        return self.ancestors[0][left]
+
+    def distance(self, left: int, right: int) -> int:
+        """Number of edges on the path between two nodes."""
+        return self.depths[left] + self.depths[right] - 2 * self.depths[self.lca(left, right)]
@@ -0,0 +1,147 @@
+from collections.abc import Iterable, Iterator, Sequence
+
+from aoc.inputs import read_grid
+
+
+Coord = tuple[int, int]
+
+# (row, column) steps, rows grow downwards
+ORTHOGONAL: list[Coord] = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+DIAGONAL: list[Coord] = [(-1, 1), (1, 1), (1, -1), (-1, -1)]
+ALL_DIRECTIONS: list[Coord] = ORTHOGONAL + DIAGONAL
+
+
+class Grid:
+    """A rectangle of byte-sized cells, stored row after row in one bytearray.
+
+    Cells are addressed either by (row, column) or by their flat index, row * width + column.
+    Character grids keep the character codes, so `grid[row, col] == ord("#")`.
+    """
+
+    __slots__ = ("width", "height", "cells", "_neighbors")
+
+    def __init__(self, width: int, height: int, cells: bytes | bytearray | None = None) -> None:
+        if cells is None:
+            cells = bytearray(width * height)
+        if len(cells) != width * height:
+            raise ValueError(f"Expected {width * height} cells, got {len(cells)}")
+        self.width = width
+        self.height = height
+        self.cells = bytearray(cells)
+        self._neighbors: dict[tuple[Coord, ...], list[tuple[int, ...]]] = {}
+
+    @classmethod
+    def parse(cls, rows: Iterable[bytes | str]) -> "Grid":
+        lines = [row.encode() if isinstance(row, str) else bytes(row) for row in rows]
+        lines = [line.strip() for line in lines if line.strip()]
+        if not lines:
+            return cls(0, 0)
+        if any(len(line) != len(lines[0]) for line in lines):
+            raise ValueError("Rows of a grid must have the same length")
+        return cls(len(lines[0]), len(lines), b"".join(lines))
+
+    @classmethod
+    def read(cls, filename: str) -> "Grid":
+        return cls.parse(read_grid(filename))
+
+    def __getitem__(self, coord: Coord) -> int:
+        row, col = coord
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            raise IndexError(f"Index out of bounds row: {row}, col: {col}")
+        return self.cells[row * self.width + col]
+
+    def __setitem__(self, coord: Coord, value: int) -> None:
+        row, col = coord
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            raise IndexError(f"Index out of bounds row: {row}, col: {col}")
+        self.cells[row * self.width + col] = value
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return self.width == other.width and self.cells == other.cells
+
+    def __iter__(self) -> Iterator[bytearray]:
+        return self.rows()
+
+    def __str__(self) -> str:
+        return "\n".join(row.decode() for row in self.rows())
+
+    def get(self, row: int, col: int, default: int | None = None) -> int | None:
+        """The cell at (row, col), or the default outside of the grid."""
+        if 0 <= row < self.height and 0 <= col < self.width:
+            return self.cells[row * self.width + col]
+        return default
+
+    def in_bounds(self, row: int, col: int) -> bool:
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def index(self, row: int, col: int) -> int:
+        return row * self.width + col
+
+    def coord(self, index: int) -> Coord:
+        return divmod(index, self.width)
+
+    def row(self, row: int) -> bytearray:
+        return self.cells[row * self.width : (row + 1) * self.width]
+
+    def column(self, col: int) -> bytearray:
+        return self.cells[col :: self.width]
+
+    def rows(self) -> Iterator[bytearray]:
+        return (self.row(row) for row in range(self.height))
+
+    def coords(self) -> Iterator[Coord]:
+        return ((row, col) for row in range(self.height) for col in range(self.width))
+
+    def find(self, value: int) -> Coord | None:
+        index = self.cells.find(value)
+        return self.coord(index) if index != -1 else None
+
+    def find_all(self, value: int) -> Iterator[Coord]:
+        index = self.cells.find(value)
+        while index != -1:
+            yield self.coord(index)
+            index = self.cells.find(value, index + 1)
+
+    def count(self, value: int) -> int:
+        return self.cells.count(value)
+
+    def copy(self) -> "Grid":
+        """A copy of the cells, neighbor tables are shared since the shape is the same."""
+        grid = Grid(self.width, self.height, self.cells)
+        grid._neighbors = self._neighbors
+        return grid
+
+    def diff(self, other: "Grid") -> list[int]:
+        """Flat indices of the cells that differ between two grids of the same shape."""
+        if (self.width, self.height) != (other.width, other.height):
+            raise ValueError("Cannot compare grids of different shapes")
+        return [index for index, (left, right) in enumerate(zip(self.cells, other.cells)) if left != right]
+
+    def neighbors(self, row: int, col: int, directions: Sequence[Coord] = ORTHOGONAL) -> Iterator[Coord]:
+        """The neighboring coordinates that lie inside of the grid."""
+        for drow, dcol in directions:
+            if 0 <= row + drow < self.height and 0 <= col + dcol < self.width:
+                yield row + drow, col + dcol
+
+    def neighbor_table(self, directions: Sequence[Coord] = ORTHOGONAL) -> list[tuple[int, ...]]:
+        """For every flat index the flat indices of its neighbors inside of the grid.
+
+        Built once per grid and set of directions, so hot loops only index lists.
+        """
+        key = tuple(directions)
+        table = self._neighbors.get(key)
+        if table is None:
+            table = self._neighbors[key] = [
+                tuple(self.index(*coord) for coord in self.neighbors(row, col, directions))
+                for row, col in self.coords()
+            ]
+        return table
+
+    def ray(self, row: int, col: int, drow: int, dcol: int) -> Iterator[Coord]:
+        """Coordinates from (row, col), not included, in one direction up to the edge."""
+        row, col = row + drow, col + dcol
+        while 0 <= row < self.height and 0 <= col < self.width:
+            yield row, col
+            row, col = row + drow, col + dcol
@@ -0,0 +1,259 @@
+"""Repeatable timings of single parts.
+
+The solution is imported once, then every sample runs in a process forked from that
+state, so no sample inherits the caches or the heap of another one. A sample first
+calls the part a few times as a warmup, then times a number of calls in a row,
+calibrated so that a sample lasts at least `MIN_SAMPLE_TIME` and fast parts are
+not measured at the resolution of the timer. The samples are reduced to the
+minimum, median and 95th percentile of the time per call, with distribution free
+confidence intervals for the last two.
+"""
+
+import gc
+import io
+import math
+import os
+import statistics
+import time
+import traceback
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from multiprocessing.connection import Connection
+from pathlib import Path
+
+from aoc.discover import Solution
+from aoc.report import align
+from aoc.runner import list_parts
+
+
+SAMPLES = 10
+WARMUP = 1
+
+# seconds a sample lasts at least, fast parts are called repeatedly to fill it
+MIN_SAMPLE_TIME = 0.05
+
+CONFIDENCE = 0.95
+
+
+@dataclass
+class Summary:
+    min: float
+    median: float
+    p95: float
+    median_interval: tuple[float, float]
+    p95_interval: tuple[float, float]
+
+    @classmethod
+    def of(cls, values: Sequence[float], confidence: float = CONFIDENCE) -> "Summary":
+        ordered = sorted(values)
+        return cls(
+            ordered[0],
+            statistics.median(ordered),
+            ordered[math.ceil(0.95 * len(ordered)) - 1],
+            quantile_interval(ordered, 0.5, confidence),
+            quantile_interval(ordered, 0.95, confidence),
+        )
+
+
+def _binomial_cdf(k: int, n: int, p: float) -> float:
+    return sum(math.comb(n, i) * p**i * (1 - p) ** (n - i) for i in range(k + 1))
+
+
+def quantile_interval(ordered: Sequence[float], q: float, confidence: float = CONFIDENCE) -> tuple[float, float]:
+    """Confidence interval of the q quantile from sorted samples, between two of them.
+
+    The number of samples below the true quantile is binomial, so the ranks are picked
+    to leave at most (1 - confidence) / 2 of that distribution outside on each side.
+    With few samples the interval widens to the smallest or largest sample.
+    """
+    n = len(ordered)
+    tail = (1 - confidence) / 2
+    lower = 1
+    while lower < n and _binomial_cdf(lower, n, q) <= tail:
+        lower += 1
+    upper = n
+    while upper > 1 and _binomial_cdf(upper - 2, n, q) >= 1 - tail:
+        upper -= 1
+    return ordered[lower - 1], ordered[upper - 1]
+
+
+@dataclass
+class Timing:
+    year: int
+    day: int
+    part: int
+    calls: int = 0  # calls per sample
+    samples: list[float] = field(default_factory=list)  # seconds per call
+    answer: object = None
+    error: str | None = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.year}/day{self.day}"
+
+    @property
+    def summary(self) -> Summary | None:
+        return Summary.of(self.samples) if self.samples else None
+
+
+def _pin(cpu: int | None) -> None:
+    if cpu is not None:
+        os.sched_setaffinity(0, {cpu})
+
+
+def _run_calls(func: Callable[[str], object], path: str, calls: int, disable_gc: bool) -> tuple[object, float]:
+    """Seconds per call over `calls` calls in a row."""
+    if disable_gc:
+        gc.collect()
+        gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(calls):
+            answer = func(path)
+        return answer, (time.perf_counter() - start) / calls
+    finally:
+        gc.enable()
+
+
+def _sample_child(
+    conn: Connection,
+    func: Callable[[str], object],
+    path: str,
+    calls: int,
+    warmup: int,
+    cpu: int | None,
+    disable_gc: bool,
+    min_time: float,
+) -> None:
+    """Sends (answer, calls, seconds per call), calibrating the calls first when there are none."""
+    try:
+        _pin(cpu)
+        with redirect_stdout(io.StringIO()):
+            for _ in range(warmup):
+                func(path)
+            if calls:
+                answer, seconds = _run_calls(func, path, calls, disable_gc)
+            else:
+                # 1, 2, 5, 10, 20, 50... calls until a sample lasts long enough, as timeit does
+                calls, step = 1, 0
+                while True:
+                    answer, seconds = _run_calls(func, path, calls, disable_gc)
+                    if seconds * calls >= min_time:
+                        break
+                    step += 1
+                    calls = (1, 2, 5)[step % 3] * 10 ** (step // 3)
+        conn.send((answer, calls, seconds))
+    except Exception:
+        conn.send(traceback.format_exc(limit=-1).strip().splitlines()[-1])
+    conn.close()
+
+
+def sample(
+    func: Callable[[str], object],
+    path: str,
+    calls: int = 0,
+    warmup: int = WARMUP,
+    cpu: int | None = None,
+    disable_gc: bool = False,
+    min_time: float = MIN_SAMPLE_TIME,
+    timeout: float | None = None,
+) -> tuple[object, int, float]:
+    """Times the calls in a forked process, calibrating their number when it is 0.
+
+    Raises RuntimeError when the part fails, dies or runs past the timeout.
+    """
+    context = get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_sample_child, args=(sender, func, path, calls, warmup, cpu, disable_gc, min_time), daemon=True
+    )
+    process.start()
+    sender.close()
+    try:
+        if not receiver.poll(timeout):
+            raise RuntimeError(f"timed out after {timeout}s")
+        result = receiver.recv()
+    except EOFError:
+        raise RuntimeError(f"sample died with exit code {process.exitcode}") from None
+    finally:
+        process.kill()
+        process.join()
+        receiver.close()
+    if isinstance(result, str):
+        raise RuntimeError(result)
+    return result
+
+
+def time_part(
+    solution: Solution,
+    part: int,
+    input_path: Path | None = None,
+    samples: int = SAMPLES,
+    warmup: int = WARMUP,
+    cpu: int | None = None,
+    disable_gc: bool = False,
+    min_time: float = MIN_SAMPLE_TIME,
+    timeout: float | None = None,
+) -> Timing:
+    """Calibrates the calls per sample in one forked process, then takes every sample in another."""
+    timing = Timing(solution.year, solution.day, part)
+    if cpu is not None and cpu not in os.sched_getaffinity(0):
+        timing.error = f"cpu {cpu} is not available to this process"
+        return timing
+    path = str(input_path or solution.input_path)
+    try:
+        func = solution.parts()[part]
+        timing.answer, timing.calls, _ = sample(func, path, 0, warmup, cpu, disable_gc, min_time, timeout)
+        for _ in range(samples):
+            _, _, seconds = sample(func, path, timing.calls, warmup, cpu, disable_gc, min_time, timeout)
+            timing.samples.append(seconds)
+    except Exception as error:
+        timing.error = str(error) or repr(error)
+    return timing
+
+
+def time_parts(
+    solutions: Iterable[Solution],
+    parts: Sequence[int] = (1, 2),
+    input_path: Path | None = None,
+    samples: int = SAMPLES,
+    warmup: int = WARMUP,
+    cpu: int | None = None,
+    disable_gc: bool = False,
+    min_time: float = MIN_SAMPLE_TIME,
+    timeout: float | None = None,
+) -> Iterator[Timing]:
+    for solution, part in list_parts(solutions, parts):
+        yield time_part(solution, part, input_path, samples, warmup, cpu, disable_gc, min_time, timeout)
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1e3:.4f}"
+
+
+def format_timings(timings: Iterable[Timing]) -> str:
+    interval = f"{CONFIDENCE:.0%} ci"
+    header = ("day", "part", "samples", "calls", "min (ms)", "median (ms)", interval, "p95 (ms)", interval, "answer")
+    rows = [header]
+    for timing in timings:
+        summary = timing.summary
+        if timing.error is not None or summary is None:
+            rows.append((timing.name, str(timing.part), "", "", "", "", "", "", "", f"error: {timing.error}"))
+            continue
+        rows.append(
+            (
+                timing.name,
+                str(timing.part),
+                str(len(timing.samples)),
+                str(timing.calls),
+                _ms(summary.min),
+                _ms(summary.median),
+                "-".join(_ms(bound) for bound in summary.median_interval),
+                _ms(summary.p95),
+                "-".join(_ms(bound) for bound in summary.p95_interval),
+                str(timing.answer).splitlines()[0] if str(timing.answer) else "",
+            )
+        )
+    return align(rows)
@@ -0,0 +1,120 @@
+"""Input loading without reading the whole file into a list of strings.
+
+The file is memory mapped and parsed in place, only the values that come out
+of it are copied: ints, grid rows as bytes, or the lines of a record.
+"""
+
+import mmap
+import os
+import re
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import AnyStr
+
+
+INT = re.compile(rb"-?\d+")
+
+# digit characters to their values, so a line of digits becomes a bytes of small ints
+DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+@contextmanager
+def mapped(filename: str) -> Iterator[mmap.mmap | bytes]:
+    """The contents of the file, mapped read-only for as long as the context lasts."""
+    with open(filename, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            # empty files cannot be mapped
+            yield b""
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+def _line_bounds(data: mmap.mmap | bytes) -> Iterator[tuple[int, int]]:
+    start = 0
+    size = len(data)
+    while start < size:
+        end = data.find(b"\n", start)
+        if end == -1:
+            end = size
+        yield start, end
+        start = end + 1
+
+
+def lines(filename: str) -> Iterator[memoryview]:
+    """Each line without its newline, as a view into the mapped file.
+
+    A view is only valid until the next line is taken, copy what has to outlive it.
+    """
+    with mapped(filename) as data:
+        view = memoryview(data)
+        try:
+            for start, end in _line_bounds(data):
+                line = view[start:end]
+                try:
+                    yield line
+                finally:
+                    line.release()
+        finally:
+            view.release()
+
+
+def read_ints(filename: str) -> list[int]:
+    """Every integer in the file, whatever separates them, commas, spaces or newlines."""
+    with mapped(filename) as data:
+        return [int(number) for number in INT.findall(data)]
+
+
+def read_int_rows(filename: str) -> list[list[int]]:
+    """The integers of every non-empty line."""
+    with mapped(filename) as data:
+        return [
+            [int(number) for number in INT.findall(data, start, end)]
+            for start, end in _line_bounds(data)
+            if end > start
+        ]
+
+
+def read_digits(filename: str) -> bytes:
+    """The first line as digit values, b"0129" becomes b"\\x00\\x01\\x02\\x09"."""
+    with mapped(filename) as data:
+        end = data.find(b"\n")
+        return data[: end if end != -1 else len(data)].strip().translate(DIGITS)
+
+
+def read_grid(filename: str) -> list[bytes]:
+    """The non-empty lines as rows of characters."""
+    with mapped(filename) as data:
+        return [data[start:end] for start, end in _line_bounds(data) if end > start]
+
+
+def split_records(lines: Iterable[AnyStr]) -> Iterator[list[AnyStr]]:
+    """Groups stripped lines into the blocks between blank lines, yielding each block
+    as soon as it ends, so only one block is held at a time."""
+    record: list[AnyStr] = []
+    for line in lines:
+        line = line.strip()
+        if line:
+            record.append(line)
+        elif record:
+            yield record
+            record = []
+    if record:
+        yield record
+
+
+def records(filename: str) -> Iterator[list[str]]:
+    """The blocks of lines of a text file, read lazily."""
+    with open(filename) as file:
+        yield from split_records(file)
+
+
+def mapped_records(filename: str) -> Iterator[list[bytes]]:
+    """The blocks of lines of a file, read lazily from its memory map."""
+    with mapped(filename) as data:
+        yield from split_records(data[start:end] for start, end in _line_bounds(data))
+
+
+def read_records(filename: str) -> list[list[bytes]]:
+    """Blocks of lines separated by blank lines, each block as its list of lines."""
+    return list(mapped_records(filename))
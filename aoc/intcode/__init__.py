@@ -0,0 +1,24 @@
+"""A shared Intcode machine for the 2019 puzzles."""
+
+from collections.abc import Iterable, Sequence
+
+from aoc.intcode.compiler import CompiledVM
+from aoc.intcode.vm import VM, Status, decode, parse, read_program
+
+# machines by name, the interpreter decodes every instruction once, the compiler
+# turns straight runs of instructions into Python functions, which pays off on long runs
+BACKENDS: dict[str, type[VM]] = {"interpreter": VM, "compiled": CompiledVM}
+
+
+def machine(backend: str) -> type[VM]:
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown Intcode backend {backend}, expected one of {', '.join(BACKENDS)}")
+    return BACKENDS[backend]
+
+
+def run(program: Sequence[int], inputs: Iterable[int] = (), backend: str = "interpreter") -> list[int]:
+    """Runs a copy of the program on the given inputs and returns its outputs."""
+    return machine(backend)(program, inputs).run_until_halt()
+
+
+__all__ = ["BACKENDS", "VM", "CompiledVM", "Status", "decode", "machine", "parse", "read_program", "run"]
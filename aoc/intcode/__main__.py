@@ -0,0 +1,52 @@
+import argparse
+import time
+
+from aoc.intcode import BACKENDS, VM, machine, read_program
+from aoc.report import align
+
+
+def timed_run(vm: VM) -> float:
+    start = time.perf_counter()
+    vm.run_until_halt()
+    return time.perf_counter() - start
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="aoc.intcode", description="Run an Intcode program and time it.")
+    parser.add_argument("program", help="file with the comma separated program")
+    parser.add_argument("inputs", type=int, nargs="*", help="values fed to the program")
+    parser.add_argument("--backend", choices=BACKENDS, default="interpreter")
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="run the program on every backend, twice as the compiled code is kept between runs",
+    )
+    args = parser.parse_args(argv)
+    program = read_program(args.program)
+
+    if not args.compare:
+        vm = machine(args.backend)(program, args.inputs)
+        elapsed = timed_run(vm)
+        print(*vm.outputs, sep=",")
+        print(f"{vm.steps} instructions in {elapsed:.4f}s, {vm.steps / elapsed:,.0f} per second")
+        return
+
+    rows = [("backend", "run", "instructions", "seconds", "per second", "speedup")]
+    baseline: float | None = None
+    outputs: dict[str, list[int]] = {}
+    for backend, vm_class in BACKENDS.items():
+        for run in ("first", "second"):
+            vm = vm_class(program, args.inputs)
+            elapsed = timed_run(vm)
+            outputs[backend] = list(vm.outputs)
+            baseline = baseline or elapsed
+            rows.append(
+                (backend, run, str(vm.steps), f"{elapsed:.4f}", f"{vm.steps / elapsed:,.0f}", f"{baseline / elapsed:.2f}x")
+            )
+    print(align(rows))
+    if len({tuple(values) for values in outputs.values()}) > 1:
+        raise SystemExit("error: the backends disagree on the outputs")
+
+
+if __name__ == "__main__":
+    main()
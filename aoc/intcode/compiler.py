@@ -0,0 +1,341 @@
+"""Intcode compiled to Python, one generated function per basic block.
+
+A block runs from an address to the first jump or halt. Its parameters are constants
+in the generated code, so it does no decoding or mode dispatch, and it returns the
+next pointer, which the dispatcher resolves through a table of compiled blocks.
+Every write checks whether it landed inside compiled code, in which case the block
+returns right away and the blocks covering that address are dropped, to be compiled
+again from the new memory when they are reached.
+
+Programs commonly patch the parameters of their own jumps, to return from a call for
+example, so a parameter that was written once is read from memory from then on
+instead of being compiled in. A program that keeps rewriting its instructions
+is handed over to the interpreter for the rest of its run.
+"""
+
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Self
+
+from aoc.counters import count
+from aoc.intcode.vm import (
+    ADD,
+    ADJUST_BASE,
+    ARITY,
+    EQUALS,
+    HALT,
+    IMMEDIATE,
+    INPUT,
+    JUMP_IF_FALSE,
+    JUMP_IF_TRUE,
+    LESS_THAN,
+    MUL,
+    OUTPUT,
+    POSITION,
+    RELATIVE,
+    VM,
+    Instruction,
+    Status,
+    decode,
+)
+
+
+# instructions in one block at most, longer straight runs are split in several
+MAX_BLOCK = 64
+
+# writes into compiled instructions a machine survives before it falls back to the interpreter
+MAX_INVALIDATIONS = 64
+
+# programs whose compiled code is kept, the least recently loaded is dropped first
+MAX_PROGRAMS = 16
+
+# (pointer, base, steps, signal), the signal is None to go on at the pointer,
+# the status to stop with, or the address of a write that hit compiled code
+Exit = tuple[int, int, int, Status | int | None]
+Block = Callable[[list[int], list[int], deque[int], VM, int, int, bool], Exit]
+
+_OPERATORS = {ADD: "{} + {}", MUL: "{} * {}", LESS_THAN: "1 if {} < {} else 0", EQUALS: "1 if {} == {} else 0"}
+
+_NAMESPACE = {"HALTED": Status.HALTED, "WAITING": Status.WAITING, "OUTPUT": Status.OUTPUT}
+
+
+@dataclass(frozen=True)
+class Compiled:
+    block: Block
+    instructions: tuple[int, ...]  # addresses of the instructions
+    guarded: tuple[int, ...]  # addresses whose change invalidates the block
+
+
+@dataclass
+class Table:
+    """Compiled blocks by start address, and how many of them guard every address."""
+
+    blocks: list[Block | None]
+    covered: list[int]
+    compiled: dict[int, Compiled] = field(default_factory=dict)
+
+    @classmethod
+    def empty(cls, size: int) -> "Table":
+        return cls([None] * size, [0] * size)
+
+    def copy(self) -> "Table":
+        return Table(self.blocks[:], self.covered[:], dict(self.compiled))
+
+    def grow(self, size: int) -> None:
+        self.blocks.extend([None] * (size - len(self.blocks)))
+        self.covered.extend([0] * (size - len(self.covered)))
+
+    def add(self, start: int, compiled: Compiled) -> None:
+        self.blocks[start] = compiled.block
+        self.compiled[start] = compiled
+        for address in compiled.guarded:
+            self.covered[address] += 1
+
+    def remove(self, start: int) -> None:
+        self.blocks[start] = None
+        for address in self.compiled.pop(start).guarded:
+            self.covered[address] -= 1
+
+    def guarding(self, address: int) -> list[int]:
+        return [start for start, compiled in self.compiled.items() if address in compiled.guarded]
+
+
+@dataclass
+class Code:
+    """What every machine running one program shares: the blocks compiled from
+    the program as loaded, and the parameters it is known to overwrite."""
+
+    program: tuple[int, ...]
+    table: Table
+    volatile: set[int] = field(default_factory=set)
+
+
+# by program, so that machines running copies of a program compile it once
+_CODE: OrderedDict[tuple[int, ...], Code] = OrderedDict()
+
+
+def _read(mode: int, word: int | str, size: int) -> str:
+    """Expression for a parameter, the machine reads addresses past the end of memory.
+
+    The word is a constant, or the expression reading it when it is volatile.
+    """
+    if mode == IMMEDIATE:
+        return str(word)
+    if mode == POSITION:
+        # memory never shrinks, so addresses inside of it at compile time always are
+        if isinstance(word, int) and word < size:
+            return f"M[{word}]"
+        return f"(M[{word}] if {word} < len(M) else vm.read({word}))"
+    return f"(M[base + {word}] if base + {word} < len(M) else vm.read(base + {word}))"
+
+
+def _write(mode: int, word: int | str, size: int, value: str, exit_: str) -> list[str]:
+    """Statements storing the value, leaving the block when compiled code was overwritten."""
+    if mode == POSITION and isinstance(word, int) and word < size:
+        return [f"M[{word}] = {value}", f"if C[{word}]: return {exit_.format(word)}"]
+    return [
+        f"t = {'base + ' if mode == RELATIVE else ''}{word}",
+        "if t < len(M):",
+        f"    M[t] = {value}",
+        f"    if C[t]: return {exit_.format('t')}",
+        "else:",
+        f"    vm.write(t, {value})",
+    ]
+
+
+def block_instructions(memory: Sequence[int], start: int) -> list[tuple[int, Instruction]]:
+    """The addresses and decoded instructions of the block starting at `start`.
+
+    Raises ValueError when the first instruction cannot be decoded,
+    a later one that cannot ends the block before it.
+    """
+    instructions: list[tuple[int, Instruction]] = []
+    pointer = start
+    while len(instructions) < MAX_BLOCK and pointer < len(memory):
+        try:
+            instruction = decode(memory[pointer])
+        except ValueError:
+            if not instructions:
+                raise
+            break
+        if pointer + ARITY[instruction[0]] >= len(memory):
+            break
+        instructions.append((pointer, instruction))
+        pointer += ARITY[instruction[0]] + 1
+        if instruction[0] in {JUMP_IF_TRUE, JUMP_IF_FALSE, HALT}:
+            break
+    return instructions
+
+
+def generate(
+    memory: Sequence[int], instructions: list[tuple[int, Instruction]], size: int, volatile: set[int]
+) -> str:
+    """Source of the function running the block, reading the volatile parameters from memory."""
+    lines: list[str] = []
+    for done, (pointer, (opcode, first, second, third)) in enumerate(instructions):
+        words: list[int | str] = [
+            f"M[{address}]" if address in volatile else memory[address]
+            for address in range(pointer + 1, pointer + 1 + ARITY[opcode])
+        ]
+        after = pointer + ARITY[opcode] + 1
+        # leaving right after this instruction, the signal to fill in
+        exit_ = f"({after}, base, steps + {done + 1}, {{}})"
+        if opcode == HALT:
+            lines.append(f"return ({pointer}, base, steps + {done}, HALTED)")
+        elif opcode == INPUT:
+            lines += [
+                "if inputs:",
+                "    v = inputs.popleft()",
+                "elif vm.input_func is not None:",
+                "    v = vm._input()",
+                "else:",
+                f"    return ({pointer}, base, steps + {done}, WAITING)",
+                *_write(first, words[0], size, "v", exit_),
+            ]
+        elif opcode == OUTPUT:
+            lines += [
+                f"v = {_read(first, words[0], size)}",
+                "if vm.output_func is not None:",
+                "    vm._output(v)",
+                "else:",
+                "    vm.outputs.append(v)",
+                f"if pause: return {exit_.format('OUTPUT')}",
+            ]
+        elif opcode == ADJUST_BASE:
+            lines.append(f"base += {_read(first, words[0], size)}")
+        elif opcode in {JUMP_IF_TRUE, JUMP_IF_FALSE}:
+            comparison = "!=" if opcode == JUMP_IF_TRUE else "=="
+            left, right = _read(first, words[0], size), _read(second, words[1], size)
+            lines.append(f"return ({right} if {left} {comparison} 0 else {after}, base, steps + {done + 1}, None)")
+        else:
+            value = _OPERATORS[opcode].format(_read(first, words[0], size), _read(second, words[1], size))
+            lines += _write(third, words[2], size, value, exit_)
+    if instructions[-1][1][0] not in {JUMP_IF_TRUE, JUMP_IF_FALSE, HALT}:
+        pointer, (opcode, *_) = instructions[-1]
+        lines.append(f"return ({pointer + ARITY[opcode] + 1}, base, steps + {len(instructions)}, None)")
+    body = "\n".join(f"    {line}" for line in lines)
+    return f"def block(M, C, inputs, vm, base, steps, pause):\n{body}\n"
+
+
+def compile_block(memory: Sequence[int], start: int, size: int, volatile: set[int]) -> Compiled | None:
+    """Compiles the block at `start` for a memory that holds at least `size` words,
+    None when its first instruction is not entirely in memory."""
+    instructions = block_instructions(memory, start)
+    if not instructions:
+        return None
+    namespace = dict(_NAMESPACE)
+    source = generate(memory, instructions, size, volatile)
+    exec(compile(source, f"<intcode block {start}>", "exec"), namespace)
+    guarded = [
+        address
+        for pointer, (opcode, *_) in instructions
+        for address in range(pointer, pointer + ARITY[opcode] + 1)
+        if address == pointer or address not in volatile
+    ]
+    return Compiled(namespace["block"], tuple(pointer for pointer, _ in instructions), tuple(guarded))
+
+
+class CompiledVM(VM):
+    """An Intcode machine that runs compiled blocks, with the same interface as `VM`."""
+
+    def __init__(
+        self,
+        program: Sequence[int],
+        inputs: Iterable[int] = (),
+        input_func: Callable[[], int] | None = None,
+        output_func: Callable[[int], None] | None = None,
+    ) -> None:
+        super().__init__(program, inputs, input_func, output_func)
+        key = tuple(program)
+        code = _CODE.get(key)
+        if code is None:
+            code = _CODE[key] = Code(key, Table.empty(len(key)))
+            if len(_CODE) > MAX_PROGRAMS:
+                _CODE.popitem(last=False)
+        else:
+            _CODE.move_to_end(key)
+        self._code = code
+        # every block compiled for the program as loaded is valid until one of its words is written
+        self._table = code.table.copy()
+        self.invalidations = 0
+
+    def fork(self) -> Self:
+        forked = super().fork()
+        forked._table = self._table.copy()
+        return forked
+
+    def _grow(self, address: int) -> None:
+        super()._grow(address)
+        self._table.grow(len(self.memory))
+
+    def _compile(self, start: int) -> Block | None:
+        code = self._code
+        compiled = compile_block(self.memory, start, len(code.program), code.volatile)
+        if compiled is None:
+            return None
+        self._table.add(start, compiled)
+        program, memory = code.program, self.memory
+        if start not in code.table.compiled and all(
+            address < len(program) and memory[address] == program[address] for address in compiled.guarded
+        ):
+            code.table.add(start, compiled)
+        return compiled.block
+
+    def write(self, address: int, value: int) -> None:
+        super().write(address, value)
+        if 0 <= address < len(self._table.covered) and self._table.covered[address]:
+            self._invalidate(address)
+
+    def _invalidate(self, address: int) -> None:
+        """Drops every block guarding the address, a parameter becomes volatile for
+        every machine running the program, which compiles it again without it."""
+        self.invalidations += 1
+        rewritten = False
+        for start in self._table.guarding(address):
+            rewritten |= address in self._table.compiled[start].instructions
+            self._table.remove(start)
+        if not rewritten:
+            self._code.volatile.add(address)
+            for start in self._code.table.guarding(address):
+                self._code.table.remove(start)
+
+    def _run(self, pause_on_output: bool) -> Status:
+        if self.invalidations <= MAX_INVALIDATIONS:
+            status = self._run_compiled(pause_on_output)
+            if status is not None:
+                return status
+            # the interpreter's decoded instructions did not follow the compiled writes
+            self._decoded = [None] * len(self.memory)
+        return super()._run(pause_on_output)
+
+    def _run_compiled(self, pause_on_output: bool) -> Status | None:
+        """Runs blocks until the machine stops, None when it gives up on compiled code."""
+        memory, covered, blocks = self.memory, self._table.covered, self._table.blocks
+        inputs = self.inputs
+        pointer, base, steps = self.pointer, self.base, self.steps
+        try:
+            while True:
+                block = blocks[pointer] if pointer < len(blocks) else None
+                if block is None:
+                    block = self._compile(pointer)
+                if block is None:
+                    # an instruction reaching past the end of memory runs on its own
+                    count("intcode instructions", steps - self.steps)
+                    self.pointer, self.base, self.steps = pointer, base, steps
+                    signal = self._step(pause_on_output)
+                    pointer, base, steps = self.pointer, self.base, self.steps
+                else:
+                    pointer, base, steps, signal = block(memory, covered, inputs, self, base, steps, pause_on_output)
+                    if isinstance(signal, int):
+                        self._invalidate(signal)
+                        signal = None
+                if signal is not None:
+                    return signal
+                if self.invalidations > MAX_INVALIDATIONS:
+                    return None
+        finally:
+            count("intcode instructions", steps - self.steps)
+            self.pointer = pointer
+            self.base = base
+            self.steps = steps
@@ -0,0 +1,67 @@
+"""Sparse Intcode memory for the addresses far past the end of a program.
+
+Words are kept in pages of `PAGE_SIZE` 64 bit integers, allocated on the first write
+into them, and untouched pages read as 0. A page that is given a value too large
+for 64 bits is turned into a list of Python ints. Copies share their pages until
+either side writes into one.
+"""
+
+from array import array
+from collections.abc import Iterator
+
+
+PAGE_BITS = 10
+PAGE_SIZE = 1 << PAGE_BITS
+MASK = PAGE_SIZE - 1
+
+_ZEROS = array("q", bytes(8 * PAGE_SIZE))
+
+
+class Pages:
+    def __init__(self) -> None:
+        self.pages: dict[int, array | list[int]] = {}
+        # numbers of the pages another copy also holds
+        self.shared: set[int] = set()
+
+    def __len__(self) -> int:
+        """Number of allocated pages."""
+        return len(self.pages)
+
+    def __getitem__(self, address: int) -> int:
+        page = self.pages.get(address >> PAGE_BITS)
+        return 0 if page is None else page[address & MASK]
+
+    def __setitem__(self, address: int, value: int) -> None:
+        if address < 0:
+            raise ValueError(f"Negative address {address}")
+        number = address >> PAGE_BITS
+        page = self.pages.get(number)
+        if page is None:
+            if value == 0:
+                return
+            page = self.pages[number] = array("q", _ZEROS)
+        elif number in self.shared:
+            page = self.pages[number] = page[:]
+            self.shared.discard(number)
+        try:
+            page[address & MASK] = value
+        except OverflowError:
+            page = self.pages[number] = page.tolist()
+            page[address & MASK] = value
+
+    def copy(self) -> "Pages":
+        copied = Pages()
+        if not self.pages:
+            return copied
+        copied.pages = dict(self.pages)
+        self.shared.update(self.pages)
+        copied.shared = set(self.pages)
+        return copied
+
+    def pop_below(self, address: int) -> Iterator[tuple[int, int]]:
+        """Removes the pages that start below the address, yielding their non zero words."""
+        for number in sorted(number for number in self.pages if number << PAGE_BITS < address):
+            page = self.pages.pop(number)
+            self.shared.discard(number)
+            start = number << PAGE_BITS
+            yield from ((start + offset, value) for offset, value in enumerate(page) if value)
@@ -0,0 +1,153 @@
+import unittest as ut
+
+from aoc.intcode import CompiledVM, Status, machine, run
+from aoc.intcode import compiler
+
+
+QUINE = [109, 1, 204, -1, 1001, 100, 1, 100, 1008, 100, 16, 101, 1006, 101, 0, 99]
+
+# outputs 999 below 8, 1000 for 8 and 1001 above 8
+COMPARE_TO_EIGHT = [
+    3, 21, 1008, 21, 8, 20, 1005, 20, 22, 107, 8, 21, 20, 1006, 20, 31, 1106, 0, 36, 98, 0, 0, 1002, 21, 125,
+    20, 4, 20, 1105, 1, 46, 104, 999, 1105, 1, 46, 1101, 1000, 1, 20, 4, 20, 1105, 1, 46, 98, 99,
+]
+
+
+class TestVM(ut.TestCase):
+    backend = "interpreter"
+
+    def test_quine(self):
+        self.assertEqual(run(QUINE, backend=self.backend), QUINE)
+
+    def test_large_numbers(self):
+        self.assertEqual(run([1102, 34915192, 34915192, 7, 4, 7, 99, 0], backend=self.backend), [1219070632396864])
+        self.assertEqual(run([104, 1125899906842624, 99], backend=self.backend), [1125899906842624])
+
+    def test_jumps_and_comparisons(self):
+        for value, expected in ((7, 999), (8, 1000), (9, 1001)):
+            self.assertEqual(run(COMPARE_TO_EIGHT, [value], self.backend), [expected])
+
+    def test_self_modifying(self):
+        # outputs the first instruction, overwrites it with a halt and jumps back to it
+        program = [4, 0, 1101, 99, 0, 0, 1105, 1, 0]
+        self.assertEqual(run(program, backend=self.backend), [4])
+
+    def test_predecoded_forks(self):
+        # the halt overwrites an instruction that was decoded before the machine was forked
+        vm = machine(self.backend)([4, 0, 1101, 99, 0, 0, 1105, 1, 0])
+        vm.predecode()
+        for _ in range(2):
+            forked = vm.fork()
+            self.assertEqual(forked.run_until_halt(), [4])
+        self.assertEqual(vm.run_until_halt(), [4])
+
+    def test_far_addresses(self):
+        # stores 7 and 2**80 a billion words out, reads them back, then runs code written out there
+        far = 10**9
+        program = [
+            1101, 7, 0, far, 4, far, 1102, 2**40, 2**40, far + 5, 204, far + 5,
+            1101, 104, 0, far + 9, 1101, 42, 0, far + 10, 1101, 99, 0, far + 11, 1105, 1, far + 9,
+        ]
+        vm = machine(self.backend)(program)
+        self.assertEqual(vm.run_until_halt(), [7, 2**80, 42])
+        self.assertEqual(len(vm.memory), len(program))
+        self.assertEqual(len(vm.pages), 1)
+
+    def test_near_reads(self):
+        # reads just past the end, then writes there and reads it back
+        program = [4, 100, 1101, 5, 0, 100, 204, 100, 99]
+        vm = machine(self.backend)(program)
+        self.assertEqual(vm.run_until_halt(), [0, 5])
+        self.assertEqual(len(vm.pages), 0)
+
+    def test_waits_for_input(self):
+        vm = machine(self.backend)([3, 9, 4, 9, 3, 9, 4, 9, 99, 0])
+        self.assertIs(vm.run(), Status.WAITING)
+        vm.send(5)
+        self.assertIs(vm.run(), Status.WAITING)
+        vm.send(6)
+        self.assertIs(vm.run(), Status.HALTED)
+        self.assertEqual(list(vm.outputs), [5, 6])
+
+    def test_fork_and_restore(self):
+        # echoes two inputs, storing the first one far out in memory too
+        far = 10**6
+        vm = machine(self.backend)([3, far, 4, far, 3, 13, 4, 13, 99, 0, 0, 0, 0, 0])
+        self.assertIs(vm.run(), Status.WAITING)
+        snapshot = vm.snapshot()
+        forked = vm.fork()
+        vm.send(1, 2)
+        forked.send(3, 4)
+        vm.run()
+        forked.run()
+        self.assertEqual((list(vm.outputs), list(forked.outputs)), ([1, 2], [3, 4]))
+        vm.restore(snapshot)
+        vm.send(5)
+        self.assertIs(vm.run(), Status.WAITING)
+        self.assertEqual(list(vm.outputs), [5])
+        self.assertEqual(forked.read(far), 3)
+
+    def test_stream(self):
+        stream = machine(self.backend)([3, 9, 4, 9, 3, 9, 4, 9, 99, 0], [1]).stream()
+        self.assertEqual(next(stream), 1)
+        self.assertEqual(stream.send(2), 2)
+
+    def test_index_error_in_callback(self):
+        calls: list[int] = []
+
+        def output(value: int) -> None:
+            calls.append(value)
+            raise IndexError("from the callback")
+
+        with self.assertRaisesRegex(IndexError, "from the callback"):
+            machine(self.backend)([104, 7, 99], output_func=output).run()
+        self.assertEqual(calls, [7])
+
+    def test_callbacks(self):
+        outputs: list[int] = []
+        machine(self.backend)([3, 5, 4, 5, 99, 0], input_func=lambda: 42, output_func=outputs.append).run()
+        self.assertEqual(outputs, [42])
+
+
+class TestCompiledVM(TestVM):
+    backend = "compiled"
+
+    def setUp(self):
+        compiler._CODE.clear()
+
+    def test_patched_jump(self):
+        # calls the subroutine at 20 twice, storing where to return in its last jump
+        program = [
+            1101, 0, 7, 28, 1105, 1, 20, 1101, 0, 14, 28, 1105, 1, 20, 99, 0, 0, 0, 0, 0,
+            4, 31, 1001, 31, 1, 31, 1105, 1, 0, 0, 0, 5,
+        ]
+        vm = CompiledVM(program)
+        self.assertEqual(vm.run_until_halt(), [5, 6])
+        self.assertEqual(vm.invalidations, 1)
+        # the next machine knows the return address is written and does not compile it in
+        again = CompiledVM(program)
+        self.assertEqual(again.run_until_halt(), [5, 6])
+        self.assertEqual(again.invalidations, 0)
+        self.assertEqual(again.steps, 10)
+
+    def test_falls_back_to_the_interpreter(self):
+        # rewrites its first instruction with the same value, then counts down from 100
+        program = [1001, 0, 0, 0, 1001, 20, -1, 20, 1005, 20, 0, 4, 20, 99, 0, 0, 0, 0, 0, 0, 100]
+        vm = CompiledVM(program)
+        self.assertEqual(vm.run_until_halt(), [0])
+        self.assertEqual(vm.invalidations, compiler.MAX_INVALIDATIONS + 1)
+        self.assertEqual(vm.steps, 301)
+
+    def test_keeps_recent_programs(self):
+        programs = [[104, value, 99] for value in range(compiler.MAX_PROGRAMS + 1)]
+        for program in programs:
+            CompiledVM(program).run_until_halt()
+        CompiledVM(programs[1]).run_until_halt()
+        CompiledVM(programs[-1]).run_until_halt()
+        self.assertEqual(len(compiler._CODE), compiler.MAX_PROGRAMS)
+        self.assertNotIn(tuple(programs[0]), compiler._CODE)
+        self.assertEqual(list(compiler._CODE)[-2:], [tuple(programs[1]), tuple(programs[-1])])
+
+
+if __name__ == "__main__":
+    ut.main()
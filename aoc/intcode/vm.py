@@ -0,0 +1,369 @@
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Sequence
+from enum import Enum
+from functools import cache
+from typing import Self
+
+from aoc.counters import count
+from aoc.intcode.memory import PAGE_SIZE, Pages
+
+
+ADD = 1
+MUL = 2
+INPUT = 3
+OUTPUT = 4
+JUMP_IF_TRUE = 5
+JUMP_IF_FALSE = 6
+LESS_THAN = 7
+EQUALS = 8
+ADJUST_BASE = 9
+HALT = 99
+
+POSITION = 0
+IMMEDIATE = 1
+RELATIVE = 2
+
+# number of parameters per opcode
+ARITY = {
+    ADD: 3,
+    MUL: 3,
+    INPUT: 1,
+    OUTPUT: 1,
+    JUMP_IF_TRUE: 2,
+    JUMP_IF_FALSE: 2,
+    LESS_THAN: 3,
+    EQUALS: 3,
+    ADJUST_BASE: 1,
+    HALT: 0,
+}
+
+# (opcode, mode of the first, second and third parameter)
+Instruction = tuple[int, int, int, int]
+
+
+class Status(Enum):
+    HALTED = "halted"
+    WAITING = "waiting"  # blocked on an input that is not there yet
+    OUTPUT = "output"  # paused right after an output
+
+
+@cache
+def decode(value: int) -> Instruction:
+    opcode = value % 100
+    if opcode not in ARITY:
+        raise ValueError(f"Unknown operation code {value}")
+    modes = (value // 100 % 10, value // 1000 % 10, value // 10000 % 10)
+    if any(mode not in {POSITION, IMMEDIATE, RELATIVE} for mode in modes):
+        raise ValueError(f"Unknown parameter mode in {value}")
+    return opcode, *modes
+
+
+def parse(text: str) -> list[int]:
+    return [int(num) for num in text.strip().split(",")]
+
+
+def read_program(filename: str) -> list[int]:
+    with open(filename) as file:
+        return parse(file.readline())
+
+
+class _CallbackError(Exception):
+    """Carries an IndexError out of a callback, so that it is not taken for a read past the end of memory."""
+
+    def __init__(self, error: IndexError) -> None:
+        super().__init__(error)
+        self.error = error
+
+
+class VM:
+    """An Intcode machine.
+
+    Every instruction is decoded once per address into its opcode and parameter modes,
+    a write to an address that holds a decoded instruction drops it from the cache,
+    so self-modifying programs still see their own changes.
+
+    Memory is a list holding the program, which doubles to take writes just past its end,
+    writes farther out go to `pages`. An instruction reaching past the end of the list
+    runs on its own through `read` and `write`, which look at both.
+
+    Inputs are taken from the `inputs` queue, then from `input_func` if it is set,
+    outputs go to `output_func` if it is set and to the `outputs` queue otherwise.
+    """
+
+    def __init__(
+        self,
+        program: Sequence[int],
+        inputs: Iterable[int] = (),
+        input_func: Callable[[], int] | None = None,
+        output_func: Callable[[int], None] | None = None,
+    ) -> None:
+        self.memory = list(program)
+        self.pointer = 0
+        self.base = 0
+        self.steps = 0
+        self.inputs: deque[int] = deque(inputs)
+        self.outputs: deque[int] = deque()
+        self.input_func = input_func
+        self.output_func = output_func
+        self.status: Status | None = None
+        self.pages = Pages()
+        self._decoded: list[Instruction | None] = [None] * len(self.memory)
+
+    @property
+    def halted(self) -> bool:
+        return self.status is Status.HALTED
+
+    def send(self, *values: int) -> None:
+        self.inputs.extend(values)
+
+    def fork(self) -> Self:
+        """An independent machine in the same state, with the same callbacks."""
+        forked = object.__new__(type(self))
+        forked.__dict__ = {
+            **vars(self),
+            "memory": self.memory[:],
+            "pages": self.pages.copy(),
+            "inputs": deque(self.inputs),
+            "outputs": deque(self.outputs),
+            # decoded instructions are immutable, a fork drops its own when it writes over them
+            "_decoded": self._decoded[:],
+        }
+        return forked
+
+    def snapshot(self) -> Self:
+        """The state of the machine, as a machine that is not meant to run."""
+        return self.fork()
+
+    def restore(self, snapshot: "VM") -> None:
+        """Goes back to the state of the snapshot, which can be restored again."""
+        vars(self).update(vars(snapshot.fork()))
+
+    def predecode(self) -> None:
+        """Decodes every word of memory that reads as an instruction, for machines that are forked
+        many times. Data decoded this way is harmless, writes drop what they overwrite."""
+        decoded = self._decoded
+        for address, value in enumerate(self.memory):
+            if decoded[address] is None:
+                try:
+                    decoded[address] = decode(value)
+                except ValueError:
+                    pass
+
+    def _grow(self, address: int) -> None:
+        # in whole pages, so that the pages it reaches are moved into the list entirely
+        size = -(-max(address + 1, 2 * len(self.memory)) // PAGE_SIZE) * PAGE_SIZE
+        self.memory.extend([0] * (size - len(self.memory)))
+        self._decoded.extend([None] * (size - len(self._decoded)))
+        for moved, value in self.pages.pop_below(size):
+            self.memory[moved] = value
+
+    def read(self, address: int) -> int:
+        return self.memory[address] if address < len(self.memory) else self.pages[address]
+
+    def write(self, address: int, value: int) -> None:
+        if address < len(self.memory):
+            self.memory[address] = value
+            self._decoded[address] = None
+        elif address < 2 * len(self.memory) + PAGE_SIZE:
+            self._grow(address)
+            self.memory[address] = value
+        else:
+            self.pages[address] = value
+
+    def run(self, pause_on_output: bool = False) -> Status:
+        """Runs until the program halts, needs an input it does not have,
+        or, when asked to, right after every output."""
+        try:
+            while True:
+                try:
+                    self.status = self._run(pause_on_output)
+                    return self.status
+                except IndexError:
+                    # a read past the end of memory, callbacks raise _CallbackError instead,
+                    # the instruction has not changed any state yet, so it runs again, in the
+                    # grown list when it reads just past its end and on its own otherwise
+                    reach = self._reach()
+                    if len(self.memory) <= reach < 2 * len(self.memory) + PAGE_SIZE:
+                        self._grow(reach)
+                        continue
+                    status = self._step(pause_on_output)
+                    if status is not None:
+                        self.status = status
+                        return status
+        except _CallbackError as error:
+            raise error.error from None
+
+    def _input(self) -> int:
+        try:
+            return self.input_func()  # type: ignore[misc]
+        except IndexError as error:
+            raise _CallbackError(error) from error
+
+    def _output(self, value: int) -> None:
+        try:
+            self.output_func(value)  # type: ignore[misc]
+        except IndexError as error:
+            raise _CallbackError(error) from error
+
+    def _reach(self) -> int:
+        """The highest address the instruction at the pointer reads or writes."""
+        read = self.read
+        opcode, *modes = decode(read(self.pointer))
+        reach = self.pointer + ARITY[opcode]
+        for offset, mode in enumerate(modes[: ARITY[opcode]], 1):
+            if mode != IMMEDIATE:
+                word = read(self.pointer + offset)
+                reach = max(reach, word + self.base if mode == RELATIVE else word)
+        return reach
+
+    def _step(self, pause_on_output: bool) -> Status | None:
+        """Runs the instruction at the pointer, anywhere in memory, returns the status it stops with."""
+        read = self.read
+        opcode, *modes = decode(read(self.pointer))
+        if opcode == HALT:
+            return Status.HALTED
+        words = [read(self.pointer + offset) for offset in range(1, ARITY[opcode] + 1)]
+        addresses = [word + self.base if mode == RELATIVE else word for word, mode in zip(words, modes)]
+        values = [word if mode == IMMEDIATE else read(address) for word, mode, address in zip(words, modes, addresses)]
+        pointer = self.pointer + ARITY[opcode] + 1
+        if opcode == INPUT:
+            if self.inputs:
+                self.write(addresses[0], self.inputs.popleft())
+            elif self.input_func is not None:
+                self.write(addresses[0], self._input())
+            else:
+                return Status.WAITING
+        elif opcode == ADJUST_BASE:
+            self.base += values[0]
+        elif opcode == JUMP_IF_TRUE:
+            pointer = values[1] if values[0] != 0 else pointer
+        elif opcode == JUMP_IF_FALSE:
+            pointer = values[1] if values[0] == 0 else pointer
+        elif opcode != OUTPUT:
+            left, right = values[:2]
+            results = {ADD: left + right, MUL: left * right, LESS_THAN: int(left < right), EQUALS: int(left == right)}
+            self.write(addresses[2], results[opcode])
+        self.pointer = pointer
+        self.steps += 1
+        count("intcode instructions")
+        if opcode == OUTPUT:
+            if self.output_func is not None:
+                self._output(values[0])
+            else:
+                self.outputs.append(values[0])
+            if pause_on_output:
+                return Status.OUTPUT
+        return None
+
+    def _run(self, pause_on_output: bool) -> Status:
+        memory = self.memory
+        decoded = self._decoded
+        inputs = self.inputs
+        pointer = self.pointer
+        base = self.base
+        steps = self.steps
+        try:
+            while True:
+                instruction = decoded[pointer]
+                if instruction is None:
+                    instruction = decoded[pointer] = decode(memory[pointer])
+                opcode, first, second, third = instruction
+
+                if opcode == HALT:
+                    return Status.HALTED
+
+                if opcode == INPUT:
+                    target = memory[pointer + 1]
+                    if first == RELATIVE:
+                        target += base
+                    if inputs:
+                        value = inputs.popleft()
+                    elif self.input_func is not None:
+                        value = self._input()
+                    else:
+                        return Status.WAITING
+                    if target < len(memory):
+                        memory[target] = value
+                        decoded[target] = None
+                    else:
+                        self.write(target, value)
+                    pointer += 2
+                    steps += 1
+                    continue
+
+                left = memory[pointer + 1]
+                if first == POSITION:
+                    left = memory[left]
+                elif first == RELATIVE:
+                    left = memory[base + left]
+
+                if opcode == OUTPUT:
+                    pointer += 2
+                    steps += 1
+                    if self.output_func is not None:
+                        self._output(left)
+                    else:
+                        self.outputs.append(left)
+                    if pause_on_output:
+                        return Status.OUTPUT
+                    continue
+
+                if opcode == ADJUST_BASE:
+                    base += left
+                    pointer += 2
+                    steps += 1
+                    continue
+
+                right = memory[pointer + 2]
+                if second == POSITION:
+                    right = memory[right]
+                elif second == RELATIVE:
+                    right = memory[base + right]
+
+                if opcode == JUMP_IF_TRUE:
+                    pointer = right if left != 0 else pointer + 3
+                elif opcode == JUMP_IF_FALSE:
+                    pointer = right if left == 0 else pointer + 3
+                else:
+                    target = memory[pointer + 3]
+                    if third == RELATIVE:
+                        target += base
+                    if opcode == ADD:
+                        value = left + right
+                    elif opcode == MUL:
+                        value = left * right
+                    elif opcode == LESS_THAN:
+                        value = 1 if left < right else 0
+                    else:
+                        value = 1 if left == right else 0
+                    if target < len(memory):
+                        memory[target] = value
+                        decoded[target] = None
+                    else:
+                        self.write(target, value)
+                    pointer += 4
+                steps += 1
+        finally:
+            count("intcode instructions", steps - self.steps)
+            self.pointer = pointer
+            self.base = base
+            self.steps = steps
+
+    def run_until_halt(self) -> list[int]:
+        """Runs a program that must not need more input than it was given, returns all outputs."""
+        if self.run() is Status.WAITING:
+            raise ValueError("Intcode program is waiting for input")
+        return list(self.outputs)
+
+    def stream(self) -> Generator[int, int | None, None]:
+        """Yields outputs one at a time, a value sent in is queued as the next input."""
+        while True:
+            status = self.run(pause_on_output=True)
+            while self.outputs:
+                value = yield self.outputs.popleft()
+                if value is not None:
+                    self.inputs.append(value)
+            if status is Status.HALTED:
+                return
+            if status is Status.WAITING and not self.inputs:
+                raise ValueError("Intcode program is waiting for input")
@@ -0,0 +1,179 @@
+"""Half-open integer intervals ``start <= x < stop``.
+
+`IntervalSet` is the union of intervals, kept as sorted disjoint runs, and
+`IntervalTree` keeps possibly overlapping intervals with a value each for lookups.
+Both cost in the number of intervals, never in the number of integers they span.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from typing import Generic, TypeVar
+
+
+T = TypeVar("T")
+
+Interval = tuple[int, int]
+
+
+class IntervalSet:
+    """Sorted disjoint intervals, an added interval is merged with every one it overlaps or touches.
+
+    Empty intervals are ignored.
+    """
+
+    __slots__ = ("starts", "stops")
+
+    def __init__(self, intervals: Iterable[Interval] = ()) -> None:
+        self.starts: list[int] = []
+        self.stops: list[int] = []
+        for start, stop in sorted(interval for interval in intervals if interval[0] < interval[1]):
+            if self.stops and start <= self.stops[-1]:
+                self.stops[-1] = max(self.stops[-1], stop)
+            else:
+                self.starts.append(start)
+                self.stops.append(stop)
+
+    @classmethod
+    def _from_sorted(cls, starts: list[int], stops: list[int]) -> "IntervalSet":
+        intervals = cls()
+        intervals.starts, intervals.stops = starts, stops
+        return intervals
+
+    def add(self, start: int, stop: int) -> None:
+        if start >= stop:
+            return
+        # the runs from first to last overlap or touch the new interval
+        first = bisect_left(self.stops, start)
+        last = bisect_right(self.starts, stop)
+        if first < last:
+            start = min(start, self.starts[first])
+            stop = max(stop, self.stops[last - 1])
+        self.starts[first:last] = [start]
+        self.stops[first:last] = [stop]
+
+    def __contains__(self, point: int) -> bool:
+        idx = bisect_right(self.starts, point) - 1
+        return idx >= 0 and point < self.stops[idx]
+
+    def overlaps(self, start: int, stop: int) -> bool:
+        idx = bisect_right(self.stops, start)
+        return idx < len(self.starts) and self.starts[idx] < stop and start < stop
+
+    def __iter__(self) -> Iterator[Interval]:
+        return zip(self.starts, self.stops)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.starts == other.starts and self.stops == other.stops
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
+
+    def size(self) -> int:
+        """Number of integers in the set."""
+        return sum(self.stops) - sum(self.starts)
+
+    def union(self, other: "IntervalSet") -> "IntervalSet":
+        return IntervalSet([*self, *other])
+
+    def intersection(self, other: "IntervalSet") -> "IntervalSet":
+        starts: list[int] = []
+        stops: list[int] = []
+        left, right = 0, 0
+        while left < len(self.starts) and right < len(other.starts):
+            start = max(self.starts[left], other.starts[right])
+            stop = min(self.stops[left], other.stops[right])
+            if start < stop:
+                starts.append(start)
+                stops.append(stop)
+            # the run that ends first cannot overlap anything further along
+            if self.stops[left] < other.stops[right]:
+                left += 1
+            else:
+                right += 1
+        return self._from_sorted(starts, stops)
+
+    def difference(self, other: "IntervalSet") -> "IntervalSet":
+        starts: list[int] = []
+        stops: list[int] = []
+        right = 0
+        for start, stop in self:
+            while right < len(other.starts) and other.stops[right] <= start:
+                right += 1
+            idx = right
+            while idx < len(other.starts) and other.starts[idx] < stop:
+                if start < other.starts[idx]:
+                    starts.append(start)
+                    stops.append(other.starts[idx])
+                start = max(start, other.stops[idx])
+                idx += 1
+            if start < stop:
+                starts.append(start)
+                stops.append(stop)
+        return self._from_sorted(starts, stops)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+
+class IntervalTree(Generic[T]):
+    """Static intervals that may overlap, each with a value.
+
+    The intervals are sorted by start and read as a balanced binary tree, the middle
+    one of a slice being the root of its subtree, annotated with the largest stop
+    in the subtree. Queries cost O(log n) plus the number of intervals they return.
+    """
+
+    __slots__ = ("starts", "stops", "values", "max_stops")
+
+    def __init__(self, intervals: Iterable[tuple[int, int, T]]) -> None:
+        ordered = sorted(intervals, key=lambda interval: (interval[0], interval[1]))
+        if any(start >= stop for start, stop, _ in ordered):
+            raise ValueError("Intervals must not be empty")
+        self.starts = [start for start, _, _ in ordered]
+        self.stops = [stop for _, stop, _ in ordered]
+        self.values = [value for _, _, value in ordered]
+        self.max_stops = self.stops[:]
+        self._annotate(0, len(ordered))
+
+    def _annotate(self, lo: int, hi: int) -> int:
+        mid = (lo + hi) // 2
+        if lo < mid:
+            self.max_stops[mid] = max(self.max_stops[mid], self._annotate(lo, mid))
+        if mid + 1 < hi:
+            self.max_stops[mid] = max(self.max_stops[mid], self._annotate(mid + 1, hi))
+        return self.max_stops[mid] if lo < hi else 0
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[tuple[int, int, T]]:
+        return zip(self.starts, self.stops, self.values)
+
+    def overlapping(self, start: int, stop: int) -> list[tuple[int, int, T]]:
+        """The intervals sharing at least one integer with start <= x < stop, by start."""
+        found: list[int] = []
+        pending = [(0, len(self.starts))]
+        while pending:
+            lo, hi = pending.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if self.max_stops[mid] <= start:
+                continue
+            pending.append((lo, mid))
+            if self.starts[mid] < stop:
+                if start < self.stops[mid]:
+                    found.append(mid)
+                pending.append((mid + 1, hi))
+        found.sort()
+        return [(self.starts[idx], self.stops[idx], self.values[idx]) for idx in found]
+
+    def at(self, point: int) -> list[tuple[int, int, T]]:
+        """The intervals containing the point."""
+        return self.overlapping(point, point + 1)
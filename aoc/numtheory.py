@@ -0,0 +1,69 @@
+from collections.abc import Iterable, Sequence
+from math import isqrt
+
+
+# baby steps kept by discrete_log, about 8 MiB of dict, larger groups take more giant steps
+MAX_TABLE = 1 << 16
+
+
+def egcd(a: int, b: int) -> tuple[int, int, int]:
+    """(g, x, y) with g = gcd(a, b) = a * x + b * y."""
+    x0, y0, x1, y1 = 1, 0, 0, 1
+    while b:
+        q, a, b = a // b, b, a % b
+        x0, x1 = x1, x0 - q * x1
+        y0, y1 = y1, y0 - q * y1
+    return a, x0, y0
+
+
+def crt(congruences: Iterable[tuple[int, int]]) -> tuple[int, int]:
+    """Solves x = residue (mod modulus) for every (residue, modulus) pair.
+
+    The moduli do not need to be coprime. Returns (x, m) with 0 <= x < m, m the lcm
+    of the moduli, so the solutions are x + k * m. Raises ValueError when there are none.
+    """
+    x, m = 0, 1
+    for residue, modulus in congruences:
+        if modulus <= 0:
+            raise ValueError(f"Moduli must be positive, got {modulus}")
+        g, p, _ = egcd(m, modulus)
+        diff = residue - x
+        if diff % g:
+            raise ValueError(f"No solution for x = {residue} (mod {modulus}) and x = {x} (mod {m})")
+        # x + m * t = residue (mod modulus), t = diff / g * p (mod modulus / g)
+        t = diff // g * p % (modulus // g)
+        x, m = x + m * t, m // g * modulus
+        x %= m
+    return x, m
+
+
+def modpow(bases: Sequence[int], exponent: int, modulus: int) -> list[int]:
+    """Every base raised to the same exponent."""
+    return [pow(base, exponent, modulus) for base in bases]
+
+
+def discrete_log(base: int, target: int, modulus: int, order: int | None = None, max_table: int = MAX_TABLE) -> int | None:
+    """Smallest x >= 0 with base ** x = target (mod modulus), None if there is none.
+
+    Baby-step giant-step: the table of baby steps holds at most `max_table` powers,
+    so the search takes about order / max_table giant steps once sqrt(order) is larger.
+    The base must be invertible, the order defaults to the modulus, enough for any base.
+    """
+    if modulus == 1:
+        return 0
+    order = order or modulus
+    target %= modulus
+    steps = min(isqrt(order) + 1, max_table)
+    table: dict[int, int] = {}
+    value = 1
+    for j in range(steps):
+        table.setdefault(value, j)
+        value = value * base % modulus
+    giant = pow(base, -steps, modulus)
+    value = target
+    for i in range(order // steps + 1):
+        j = table.get(value)
+        if j is not None:
+            return i * steps + j
+        value = value * giant % modulus
+    return None
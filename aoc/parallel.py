@@ -0,0 +1,70 @@
+"""Splitting a search across forked processes.
+
+Every call runs in a child forked from this process, so it starts with everything
+already set up here, parsed inputs or primed machines, and the function need not
+be picklable, only its result. Solutions are loaded from files under names that
+other processes cannot import, so a regular process pool could not run their functions.
+"""
+
+import traceback
+from collections.abc import Callable, Iterable
+from multiprocessing import get_context
+from multiprocessing.connection import Connection, wait
+from multiprocessing.process import BaseProcess
+from typing import TypeVar
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _call(conn: Connection, func: Callable[[T], R], item: T) -> None:
+    try:
+        conn.send((True, func(item)))
+    except Exception:
+        conn.send((False, traceback.format_exc(limit=-1).strip().splitlines()[-1]))
+    conn.close()
+
+
+def fork_map(func: Callable[[T], R], items: Iterable[T], jobs: int) -> list[R]:
+    """The results of `func` on every item in order, computed `jobs` children at a time.
+
+    With one job everything runs in this process. Raises RuntimeError when a call fails.
+    """
+    items = list(items)
+    if jobs <= 1:
+        return [func(item) for item in items]
+
+    context = get_context("fork")
+    results: dict[int, R] = {}
+    running: dict[Connection, tuple[int, BaseProcess]] = {}
+    pending = iter(enumerate(items))
+    try:
+        while len(results) < len(items):
+            for idx, item in pending:
+                receiver, sender = context.Pipe(duplex=False)
+                process = context.Process(target=_call, args=(sender, func, item), daemon=True)
+                process.start()
+                sender.close()
+                running[receiver] = idx, process
+                if len(running) >= jobs:
+                    break
+            for receiver in wait(list(running)):
+                idx, process = running.pop(receiver)
+                try:
+                    succeeded, result = receiver.recv()
+                except EOFError:
+                    process.join()
+                    raise RuntimeError(f"process for item {idx} died with exit code {process.exitcode}") from None
+                finally:
+                    receiver.close()
+                    process.join()
+                if not succeeded:
+                    raise RuntimeError(result)
+                results[idx] = result
+    finally:
+        for receiver, (_, process) in running.items():
+            process.kill()
+            process.join()
+            receiver.close()
+    return [results[idx] for idx in range(len(items))]
@@ -0,0 +1,208 @@
+import cProfile
+import io
+import linecache
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Collection, Iterator
+from contextlib import redirect_stdout
+from pathlib import Path
+from types import CodeType, FrameType, FunctionType, ModuleType
+
+from aoc.cache import local_sources
+from aoc.discover import ROOT, Solution
+
+
+PROFILE_DIR = ROOT / "profiles"
+
+MODES = ("sample", "cprofile")
+
+
+def _call(func: Callable[[str], object], filename: str) -> object:
+    # the outermost frame of a profiled part, samples stop walking the stack here
+    with redirect_stdout(io.StringIO()):
+        return func(filename)
+
+
+def _label(code: CodeType) -> str:
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+def _stack(frame: FrameType | None) -> list[str]:
+    """Labels from the part's entry function down to the given frame."""
+    labels: list[str] = []
+    while frame is not None and frame.f_code is not _call.__code__:
+        labels.append(_label(frame.f_code))
+        frame = frame.f_back
+    return labels[::-1] if frame is not None else []
+
+
+def sample(func: Callable[[str], object], filename: str, interval: float = 0.001) -> tuple[object, Counter[str]]:
+    """Runs the part while a thread samples its stack every interval seconds.
+
+    Returns the answer and the number of samples per collapsed stack,
+    the format flamegraph tools read.
+    """
+    stacks: Counter[str] = Counter()
+    target = threading.get_ident()
+    done = threading.Event()
+
+    def sampler() -> None:
+        while not done.wait(interval):
+            stack = _stack(sys._current_frames().get(target))
+            if stack:
+                stacks[";".join(stack)] += 1
+
+    switch = sys.getswitchinterval()
+    sys.setswitchinterval(interval)
+    thread = threading.Thread(target=sampler, daemon=True)
+    thread.start()
+    try:
+        answer = _call(func, filename)
+    finally:
+        done.set()
+        thread.join()
+        sys.setswitchinterval(switch)
+    return answer, stacks
+
+
+def format_samples(stacks: Counter[str], top: int) -> str:
+    total = sum(stacks.values())
+    if not total:
+        return "no samples, the part finished too quickly"
+    own: Counter[str] = Counter()
+    inclusive: Counter[str] = Counter()
+    for stack, count in stacks.items():
+        frames = stack.split(";")
+        own[frames[-1]] += count
+        for frame in set(frames):
+            inclusive[frame] += count
+    lines = [f"{total} samples", f"{'own %':>7}  {'total %':>7}  function"]
+    for frame, count in own.most_common(top):
+        lines.append(f"{100 * count / total:>7.1f}  {100 * inclusive[frame] / total:>7.1f}  {frame}")
+    return "\n".join(lines)
+
+
+def profile_calls(func: Callable[[str], object], filename: str) -> tuple[object, pstats.Stats]:
+    profiler = cProfile.Profile()
+    answer = profiler.runcall(_call, func, filename)
+    return answer, pstats.Stats(profiler)
+
+
+def format_stats(stats: pstats.Stats, top: int) -> str:
+    stream = io.StringIO()
+    stats.stream = stream  # type: ignore[attr-defined]
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    return stream.getvalue().strip()
+
+
+def _functions(module: ModuleType) -> Iterator[FunctionType]:
+    for value in vars(module).values():
+        if isinstance(value, FunctionType):
+            yield value
+        elif isinstance(value, type):
+            for attr in vars(value).values():
+                func = getattr(attr, "__func__", attr)
+                if isinstance(func, FunctionType):
+                    yield func
+
+
+def find_code(solution: Solution, names: Collection[str]) -> dict[CodeType, str]:
+    """Code of the named functions and methods, in the solution or the repository modules it uses.
+
+    A name matches either the plain or the qualified name, `count_neighbors` or `Seats.count_neighbors`.
+    """
+    found: dict[CodeType, str] = {}
+    for module in local_sources(solution.load()).values():
+        for func in _functions(module):
+            if func.__name__ in names or func.__qualname__ in names:
+                found[func.__code__] = func.__qualname__
+    return found
+
+
+def time_lines(
+    func: Callable[[str], object], filename: str, targets: Collection[CodeType]
+) -> tuple[object, Counter[tuple[CodeType, int]]]:
+    """Runs the part tracing the target functions line by line.
+
+    The time between two line events of a frame is charged to the earlier line,
+    time spent in callees is included.
+    """
+    timings: Counter[tuple[CodeType, int]] = Counter()
+
+    def trace_lines(frame: FrameType, event: str, arg: object) -> Callable | None:
+        now = time.perf_counter()
+        previous = starts.get(frame)
+        if previous is not None:
+            line, started = previous
+            timings[frame.f_code, line] += now - started
+        if event == "line":
+            starts[frame] = (frame.f_lineno, now)
+        elif event == "return":
+            starts.pop(frame, None)
+        return trace_lines
+
+    def trace_calls(frame: FrameType, event: str, arg: object) -> Callable | None:
+        return trace_lines if frame.f_code in targets else None
+
+    starts: dict[FrameType, tuple[int, float]] = {}
+    sys.settrace(trace_calls)
+    try:
+        answer = _call(func, filename)
+    finally:
+        sys.settrace(None)
+    return answer, timings
+
+
+def format_lines(timings: Counter[tuple[CodeType, int]], names: dict[CodeType, str], top: int) -> str:
+    total = sum(timings.values())
+    if not total:
+        return "none of the named functions ran"
+    lines = [f"{'seconds':>9}  {'%':>5}  line"]
+    for (code, line), seconds in timings.most_common(top):
+        source = linecache.getline(code.co_filename, line).strip()
+        lines.append(f"{seconds:>9.4f}  {100 * seconds / total:>5.1f}  {names[code]}:{line}  {source}")
+    return "\n".join(lines)
+
+
+def profile_part(
+    solution: Solution,
+    part: int,
+    input_path: Path | None = None,
+    mode: str = "sample",
+    top: int = 15,
+    names: Collection[str] = (),
+    directory: Path = PROFILE_DIR,
+) -> str:
+    """Profiles one part in this process, writes the raw profile next to the others
+    and returns the report to print."""
+    func = solution.parts()[part]
+    filename = str(input_path or solution.input_path)
+    directory.mkdir(parents=True, exist_ok=True)
+    stem = directory / f"{solution.year}_day{solution.day}_part{part}"
+    sections = [f"{solution.name} part {part}"]
+
+    if mode == "cprofile":
+        _, stats = profile_calls(func, filename)
+        stats.dump_stats(stem.with_suffix(".prof"))
+        sections.append(format_stats(stats, top))
+        sections.append(f"profile written to {stem.with_suffix('.prof')}")
+    else:
+        _, stacks = sample(func, filename)
+        stem.with_suffix(".folded").write_text(
+            "".join(f"{stack} {count}\n" for stack, count in sorted(stacks.items()))
+        )
+        sections.append(format_samples(stacks, top))
+        sections.append(f"collapsed stacks written to {stem.with_suffix('.folded')}")
+
+    if names:
+        targets = find_code(solution, names)
+        matched = {name for qualname in targets.values() for name in (qualname, qualname.rpartition(".")[2])}
+        if missing := set(names) - matched:
+            sections.append(f"no function named {', '.join(sorted(missing))}")
+        if targets:
+            _, timings = time_lines(func, filename, targets)
+            sections.append(format_lines(timings, targets, top))
+    return "\n\n".join(sections)
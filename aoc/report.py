@@ -0,0 +1,77 @@
+import json
+from collections.abc import Iterable, Sequence
+from dataclasses import asdict
+
+from aoc.runner import Measurement
+
+
+HEADER = ("day", "part", "wall (s)", "cpu (s)", "peak rss (MiB)", "answer")
+
+# extra columns when memory was traced, placed before the answer
+TRACED_HEADER = ("traced peak (MiB)", "retained blocks")
+
+# extra column when the solutions counted their work, after the memory ones
+COUNTERS_HEADER = ("counters",)
+
+
+def format_answer(measurement: Measurement, width: int = 40) -> str:
+    if measurement.error is not None:
+        text = f"error: {measurement.error}"
+    else:
+        lines = str(measurement.answer).splitlines() or [""]
+        text = lines[0] if len(lines) == 1 else f"{lines[0]} (+{len(lines) - 1} lines)"
+        if measurement.cached:
+            text = f"{text} (cached)"
+    return text if len(text) <= width else text[: width - 3] + "..."
+
+
+def format_counters(measurement: Measurement) -> str:
+    counters = measurement.counters or {}
+    return ", ".join(f"{name}={value}" for name, value in sorted(counters.items()))
+
+
+def format_row(measurement: Measurement, traced: bool = False, counted: bool = False) -> tuple[str, ...]:
+    row = (
+        measurement.name,
+        str(measurement.part),
+        f"{measurement.wall:.4f}",
+        f"{measurement.cpu:.4f}",
+        f"{measurement.peak_rss / 2**20:.1f}",
+    )
+    if traced:
+        row += (
+            f"{measurement.traced_peak / 2**20:.1f}" if measurement.traced_peak is not None else "",
+            str(measurement.retained_blocks) if measurement.retained_blocks is not None else "",
+        )
+    if counted:
+        row += (format_counters(measurement),)
+    return (*row, format_answer(measurement))
+
+
+def format_table(measurements: Iterable[Measurement]) -> str:
+    measurements = list(measurements)
+    traced = any(measurement.traced_peak is not None for measurement in measurements)
+    counted = any(measurement.counters for measurement in measurements)
+    header = (
+        *HEADER[:-1],
+        *(TRACED_HEADER if traced else ()),
+        *(COUNTERS_HEADER if counted else ()),
+        HEADER[-1],
+    )
+    return align([header, *(format_row(measurement, traced, counted) for measurement in measurements)])
+
+
+def align(rows: Sequence[Sequence[str]]) -> str:
+    """Lays out a header and its rows in columns, the first and last ones left aligned."""
+    widths = [max(len(row[idx]) for row in rows) for idx in range(len(rows[0]))]
+    left = {0, len(widths) - 1}
+    lines = [
+        "  ".join(cell.ljust(width) if idx in left else cell.rjust(width) for idx, (cell, width) in enumerate(zip(row, widths)))
+        for row in rows
+    ]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    return "\n".join(line.rstrip() for line in lines)
+
+
+def to_json(measurements: Iterable[Measurement]) -> str:
+    return json.dumps([asdict(measurement) for measurement in measurements], indent=2, default=str)
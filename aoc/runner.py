@@ -0,0 +1,236 @@
+import io
+import resource
+import sys
+import time
+import traceback
+import tracemalloc
+from collections.abc import Collection, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from multiprocessing import get_context
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from aoc.counters import counting
+from aoc.discover import Solution
+
+if TYPE_CHECKING:
+    from aoc.cache import ResultCache
+
+
+@dataclass
+class Measurement:
+    year: int
+    day: int
+    part: int
+    answer: object = None
+    wall: float = 0.0
+    cpu: float = 0.0
+    peak_rss: int = 0
+    error: str | None = None
+    cached: bool = False
+    traced_peak: int | None = None
+    retained_blocks: int | None = None
+    counters: dict[str, int] | None = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.year}/day{self.day}"
+
+
+def peak_rss() -> int:
+    """Peak resident set size of the current process in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def measure(
+    solution: Solution, part: int, input_path: Path | None = None, trace_memory: bool = False
+) -> Measurement:
+    """Runs a single part in the current process.
+
+    Anything the solution prints is swallowed, only the returned answer is kept,
+    along with whatever the solution counted, None if it counted nothing.
+    Tracing memory records the peak of the memory allocated by Python while the part ran,
+    and how many of its allocations were still alive after it returned. It slows the part down.
+    """
+    measurement = Measurement(solution.year, solution.day, part)
+    path = str(input_path or solution.input_path)
+    try:
+        func = solution.parts()[part]
+        if trace_memory:
+            tracemalloc.start()
+        with redirect_stdout(io.StringIO()), counting() as counts:
+            wall = time.perf_counter()
+            cpu = time.process_time()
+            measurement.answer = func(path)
+            measurement.cpu = time.process_time() - cpu
+            measurement.wall = time.perf_counter() - wall
+        measurement.counters = counts or None
+    except Exception:
+        measurement.error = traceback.format_exc(limit=-1).strip().splitlines()[-1]
+    finally:
+        if tracemalloc.is_tracing():
+            _, measurement.traced_peak = tracemalloc.get_traced_memory()
+            measurement.retained_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+            tracemalloc.stop()
+    measurement.peak_rss = peak_rss()
+    return measurement
+
+
+def _measure_child(
+    conn: Connection, solution: Solution, part: int, input_path: Path | None, trace_memory: bool
+) -> None:
+    conn.send(measure(solution, part, input_path, trace_memory))
+    conn.close()
+
+
+def measure_isolated(
+    solution: Solution,
+    part: int,
+    input_path: Path | None = None,
+    timeout: float | None = None,
+    trace_memory: bool = False,
+) -> Measurement:
+    """Runs a single part in a fresh interpreter, so peak RSS belongs to that part alone.
+
+    A part that runs longer than the timeout is killed and reported as an error.
+    """
+    context = get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_measure_child, args=(sender, solution, part, input_path, trace_memory), daemon=True)
+    process.start()
+    sender.close()
+    try:
+        if receiver.poll(timeout):
+            return receiver.recv()
+        error = f"timed out after {timeout}s"
+    except EOFError:
+        error = f"worker died with exit code {process.exitcode}"
+    finally:
+        process.kill()
+        process.join()
+        receiver.close()
+    return Measurement(solution.year, solution.day, part, error=error)
+
+
+def list_parts(solutions: Iterable[Solution], parts: Collection[int] = (1, 2)) -> Iterator[tuple[Solution, int]]:
+    for solution in solutions:
+        try:
+            registered = solution.parts()
+        except Exception:
+            registered = {part: None for part in parts}
+        for part in sorted(registered):
+            if part in parts:
+                yield solution, part
+
+
+def longest_first(
+    tasks: Iterable[tuple[Solution, int]], costs: Mapping[tuple[int, int, int], float]
+) -> list[tuple[Solution, int]]:
+    """Orders parts by their last measured wall time, longest first.
+
+    Parts that were never measured go first, they might be the slowest ones.
+    """
+    return sorted(tasks, key=lambda task: -costs.get((task[0].year, task[0].day, task[1]), float("inf")))
+
+
+def run_parallel(
+    tasks: Iterable[tuple[Solution, int]],
+    jobs: int,
+    input_path: Path | None = None,
+    timeout: float | None = None,
+    trace_memory: bool = False,
+) -> Iterator[tuple[Solution, int, Measurement]]:
+    """Runs isolated parts `jobs` at a time, yielding them as they finish.
+
+    The threads only wait on the worker processes, so a part that runs
+    past the timeout can still be killed on its own.
+    """
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(measure_isolated, solution, part, input_path, timeout, trace_memory): (solution, part)
+            for solution, part in tasks
+        }
+        for future in as_completed(futures):
+            solution, part = futures[future]
+            yield solution, part, future.result()
+
+
+def run(
+    solutions: Iterable[Solution],
+    parts: Collection[int] = (1, 2),
+    input_path: Path | None = None,
+    isolate: bool = True,
+    timeout: float | None = None,
+    cache: "ResultCache | None" = None,
+    refresh: bool = False,
+    jobs: int = 1,
+    trace_memory: bool = False,
+) -> Iterator[Measurement]:
+    """Measures every part, parts already solved for the same code and input
+    come from the cache unless asked to refresh them.
+
+    With more than one job, isolated parts run in parallel, started longest first
+    according to the timings in the cache, and are yielded as they finish.
+    Isolated parts whose peak RSS exceeds the memory budget of their day are reported as errors.
+    In this process the peak is shared with everything that ran before, so a part only
+    reports how far it raised it, and budgets are not checked.
+    """
+    for solution, measurement in _run(
+        solutions, parts, input_path, isolate, timeout, cache, refresh, jobs, trace_memory
+    ):
+        if isolate:
+            check_budget(solution, measurement)
+        yield measurement
+
+
+def check_budget(solution: Solution, measurement: Measurement) -> None:
+    if measurement.error is not None:
+        return
+    budget = solution.memory_budget(measurement.part)
+    if budget is not None and measurement.peak_rss > budget * 2**20:
+        measurement.error = f"peak rss {measurement.peak_rss / 2**20:.1f} MiB over the budget of {budget} MiB"
+
+
+def _run(
+    solutions: Iterable[Solution],
+    parts: Collection[int],
+    input_path: Path | None,
+    isolate: bool,
+    timeout: float | None,
+    cache: "ResultCache | None",
+    refresh: bool,
+    jobs: int,
+    trace_memory: bool,
+) -> Iterator[tuple[Solution, Measurement]]:
+    pending: list[tuple[Solution, int]] = []
+    keys: dict[tuple[Solution, int], str | None] = {}
+    for solution, part in list_parts(solutions, parts):
+        key = keys[solution, part] = cache.key(solution, part, input_path, isolate) if cache is not None else None
+        if key is not None and not refresh and (measurement := cache.get(key)) is not None:
+            yield solution, measurement
+            continue
+        if isolate and jobs > 1:
+            pending.append((solution, part))
+            continue
+        if isolate:
+            measurement = measure_isolated(solution, part, input_path, timeout, trace_memory)
+        else:
+            before = peak_rss()
+            measurement = measure(solution, part, input_path, trace_memory)
+            measurement.peak_rss -= before
+        if key is not None:
+            cache.put(key, measurement)
+        yield solution, measurement
+
+    if pending:
+        costs = cache.costs() if cache is not None else {}
+        for solution, part, measurement in run_parallel(
+            longest_first(pending, costs), jobs, input_path, timeout, trace_memory
+        ):
+            if (key := keys[solution, part]) is not None:
+                cache.put(key, measurement)
+            yield solution, measurement
@@ -0,0 +1,122 @@
+import math
+import tempfile
+import time
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+
+from aoc.discover import Solution
+
+
+# candidate growth curves, the fit picks the one that explains the timings best
+MODELS: dict[str, Callable[[float], float]] = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": lambda n: math.log(n),
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * math.log(n),
+    "O(n^2)": lambda n: n**2,
+    "O(n^2 log n)": lambda n: n**2 * math.log(n),
+    "O(n^3)": lambda n: n**3,
+}
+
+
+@dataclass
+class Sample:
+    size: int
+    seconds: float
+
+
+@dataclass
+class Fit:
+    model: str
+    coefficient: float
+    error: float
+
+
+def fit_exponent(samples: Sequence[Sample]) -> float:
+    """Least squares slope of log(time) against log(size), t ~ n^k gives k."""
+    xs = [math.log(sample.size) for sample in samples]
+    ys = [math.log(max(sample.seconds, 1e-9)) for sample in samples]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if spread == 0:
+        raise ValueError("Need at least two distinct sizes to fit a curve")
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+
+
+def fit_models(samples: Sequence[Sample]) -> list[Fit]:
+    """Fits t = c * f(n) for every model, best fit first.
+
+    The error is the root mean square of the relative residuals,
+    so the smallest sizes weigh as much as the largest ones.
+    """
+    fits: list[Fit] = []
+    for model, func in MODELS.items():
+        # minimises sum(((c * f(n) - t) / t)^2)
+        ratios = [func(sample.size) / sample.seconds for sample in samples if sample.seconds > 0]
+        if not ratios:
+            continue
+        coefficient = sum(ratios) / sum(ratio**2 for ratio in ratios)
+        error = math.sqrt(sum((coefficient * ratio - 1) ** 2 for ratio in ratios) / len(ratios))
+        fits.append(Fit(model, coefficient, error))
+    return sorted(fits, key=lambda fit: fit.error)
+
+
+def time_workload(workload: Callable[[], object], repeat: int = 1) -> float:
+    """Best wall time over the given number of runs."""
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        workload()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def make_workload(solution: Solution, generator: ModuleType, filename: str, part: int | None) -> Callable[[], object]:
+    """Picks what to time on a generated input.
+
+    Either a whole part, or the generator's own ``workload(solution_module, filename)``
+    that isolates the function whose scaling is of interest.
+    """
+    if part is not None:
+        func = solution.parts()[part]
+        return lambda: func(filename)
+    module = solution.load()
+    return lambda: generator.workload(module, filename)
+
+
+def scale(
+    solution: Solution,
+    sizes: Sequence[int] | None = None,
+    part: int | None = None,
+    repeat: int = 1,
+    seed: int = 0,
+    limit: float | None = None,
+) -> Iterator[Sample]:
+    """Times the solution on generated inputs of growing size.
+
+    Sizes are run in increasing order, once a run takes longer than
+    the limit the larger sizes are skipped.
+    """
+    generator = solution.load_generator()
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sorted(sizes or generator.SIZES):
+            path = Path(directory) / f"input_{size}.txt"
+            path.write_text(generator.generate(size, seed))
+            sample = Sample(size, time_workload(make_workload(solution, generator, str(path), part), repeat))
+            yield sample
+            if limit is not None and sample.seconds > limit:
+                break
+
+
+def format_scaling(samples: Sequence[Sample]) -> str:
+    lines = [f"{'size':>10}  {'wall (s)':>10}"]
+    lines += [f"{sample.size:>10}  {sample.seconds:>10.4f}" for sample in samples]
+    if len({sample.size for sample in samples}) > 1:
+        lines.append("")
+        lines.append(f"empirical exponent: {fit_exponent(samples):.2f}")
+        for fit in fit_models(samples)[:3]:
+            lines.append(f"{fit.model:<14} relative error {fit.error:.3f}")
+    return "\n".join(lines)
@@ -0,0 +1,66 @@
+import unittest as ut
+from itertools import product
+
+from aoc import automaton
+from aoc.automaton import BoundedAutomaton, SparseAutomaton
+
+
+MOORE = [offset for offset in product([-1, 0, 1], repeat=2) if any(offset)]
+
+GLIDER = {(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)}
+
+
+def torus(size: int) -> list[list[int]]:
+    return [
+        [(row + drow) % size * size + (col + dcol) % size for drow, dcol in MOORE]
+        for row in range(size)
+        for col in range(size)
+    ]
+
+
+class TestSparseAutomaton(ut.TestCase):
+    def test_glider_moves_diagonally(self):
+        life = SparseAutomaton(MOORE, birth={3}, survival={2, 3})
+        cells = life.run(GLIDER, 1000)
+        self.assertEqual({life.unpack(cell) for cell in cells}, {(x + 250, y + 250) for x, y in GLIDER})
+
+    def test_overflow(self):
+        life = SparseAutomaton(MOORE, birth={3}, survival={2, 3})
+        # moves one cell diagonally every 4 generations, towards the end of the packed range
+        start = automaton.BIAS - 10
+        cells = life.run({(x + start, y + start) for x, y in GLIDER}, 20)
+        self.assertEqual({life.unpack(cell) for cell in cells}, {(x + start + 5, y + start + 5) for x, y in GLIDER})
+        with self.assertRaises(ValueError):
+            life.run({(x + start, y + start) for x, y in GLIDER}, 40)
+
+    def test_pack_round_trip(self):
+        cubes = SparseAutomaton(product([-1, 0, 1], repeat=3), birth={3}, survival={2, 3})
+        self.assertEqual(cubes.unpack(cubes.pack((-5, 0, 7))), (-5, 0, 7))
+        with self.assertRaises(ValueError):
+            cubes.pack((1 << automaton.BITS, 0, 0))
+
+
+class TestBoundedAutomaton(ut.TestCase):
+    def run_glider(self, backend: str) -> bytearray:
+        life = BoundedAutomaton(torus(8), birth={3}, survival={2, 3}, backend=backend)
+        alive = bytearray(64)
+        for x, y in GLIDER:
+            alive[y * 8 + x] = 1
+        # the glider crosses the torus and comes back after 4 * 8 generations
+        return life.run(alive, 32)
+
+    def test_python_glider_wraps_around(self):
+        final = self.run_glider("python")
+        self.assertEqual({(cell % 8, cell // 8) for cell, alive in enumerate(final) if alive}, GLIDER)
+
+    @ut.skipIf(automaton.np is None, "NumPy is not installed")
+    def test_backends_agree(self):
+        self.assertEqual(self.run_glider("numpy"), self.run_glider("python"))
+
+    def test_stops_when_stable(self):
+        # a block never changes, so the cells are only evaluated once
+        block = BoundedAutomaton(torus(6), birth={3}, survival={2, 3}, backend="python")
+        alive = bytearray(36)
+        for cell in (7, 8, 13, 14):
+            alive[cell] = 1
+        self.assertEqual(block.run(alive), alive)
@@ -0,0 +1,102 @@
+import random
+import unittest as ut
+
+from aoc.graph import Graph, RootedTree
+
+
+def is_ordered(graph: Graph, order: list[int]) -> bool:
+    position = {node: idx for idx, node in enumerate(order)}
+    return all(
+        position[node] < position[target]
+        for node in order
+        for target in graph.successors(node)
+        if target in position
+    )
+
+
+def naive_lca(parents: dict[int, int], left: int, right: int) -> int:
+    ancestors = {left}
+    while left in parents:
+        left = parents[left]
+        ancestors.add(left)
+    while right not in ancestors:
+        right = parents[right]
+    return right
+
+
+class TestGraph(ut.TestCase):
+    def test_from_edges(self):
+        graph = Graph.from_edges([("b", "c", 5), ("a", "b"), ("b", "a")], nodes=["a"])
+        self.assertEqual(graph.names, ["a", "b", "c"])
+        self.assertEqual(list(graph.edges(graph.id("b"))), [(2, 5), (0, 1)])
+        self.assertEqual(graph.in_degrees(), [1, 1, 1])
+
+    def test_reverse(self):
+        graph = Graph.from_edges([("a", "b", 2), ("a", "c", 3), ("b", "c", 4)])
+        reversed_ = graph.reverse()
+        self.assertEqual(reversed_.names, graph.names)
+        self.assertEqual(list(reversed_.edges(graph.id("a"))), [])
+        self.assertEqual(list(reversed_.edges(graph.id("c"))), [(0, 3), (1, 4)])
+        self.assertEqual(reversed_.reverse().targets, graph.targets)
+
+    def test_topological_order(self):
+        rng = random.Random(0)
+        for _ in range(100):
+            size = rng.randrange(1, 12)
+            # edges only go from smaller to larger nodes, so there is no cycle
+            edges = [(source, target) for source in range(size) for target in range(source + 1, size) if rng.random() < 0.3]
+            graph = Graph.from_edges(edges, nodes=rng.sample(range(size), size))
+            order = graph.topological_order()
+            self.assertEqual(sorted(order), list(range(size)))
+            self.assertTrue(is_ordered(graph, order))
+
+            subset = rng.sample(range(size), rng.randrange(0, size + 1))
+            order = graph.topological_order(subset)
+            self.assertEqual(sorted(order), sorted(subset))
+            self.assertTrue(is_ordered(graph, order))
+
+    def test_cycle(self):
+        graph = Graph.from_edges([("a", "b"), ("b", "c"), ("c", "a"), ("c", "d")])
+        with self.assertRaises(ValueError):
+            graph.topological_order()
+        # edges leaving the subset do not count
+        ids = [graph.id(name) for name in "cd"]
+        self.assertEqual(graph.topological_order(ids), ids)
+
+    def test_fold(self):
+        # number of weighted paths from every node to the sinks
+        graph = Graph.from_edges([("a", "b", 2), ("a", "c"), ("b", "d"), ("c", "d", 3)])
+        paths = graph.fold(lambda node, edges: sum(weight * value for weight, value in edges) if edges else 1)
+        self.assertEqual(dict(zip(graph.names, paths)), {"a": 5, "b": 1, "c": 3, "d": 1})
+
+
+class TestRootedTree(ut.TestCase):
+    def test_matches_naive(self):
+        rng = random.Random(0)
+        for _ in range(50):
+            size = rng.randrange(1, 40)
+            parents = {node: rng.randrange(node) for node in range(1, size)}
+            tree = RootedTree(Graph.from_edges(((parent, node) for node, parent in parents.items()), nodes=[0]), 0)
+            for _ in range(20):
+                left, right = rng.randrange(size), rng.randrange(size)
+                lca = naive_lca(parents, left, right)
+                self.assertEqual(tree.lca(left, right), lca)
+                self.assertEqual(tree.distance(left, right), tree.depths[left] + tree.depths[right] - 2 * tree.depths[lca])
+
+    def test_distance(self):
+        graph = Graph.from_edges([("r", "a"), ("a", "b"), ("b", "c"), ("r", "d")])
+        tree = RootedTree(graph, graph.id("r"))
+        self.assertEqual(tree.distance(graph.id("c"), graph.id("d")), 4)
+        self.assertEqual(tree.distance(graph.id("b"), graph.id("b")), 0)
+        self.assertEqual(tree.lca(graph.id("c"), graph.id("a")), graph.id("a"))
+
+    def test_rejects(self):
+        with self.assertRaises(ValueError):
+            RootedTree(Graph.from_edges([("r", "a"), ("r", "b"), ("a", "b")]), 0)
+        tree = RootedTree(Graph.from_edges([("r", "a"), ("b", "a")]), 0)
+        with self.assertRaises(ValueError):
+            tree.lca(0, 2)
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,72 @@
+import unittest as ut
+
+from aoc.grid import ALL_DIRECTIONS, Grid
+
+
+SAMPLE = ["#..", "", ".#.\n", b"..#"]
+
+
+class TestGrid(ut.TestCase):
+    def test_parse(self):
+        grid = Grid.parse(SAMPLE)
+        self.assertEqual((grid.width, grid.height), (3, 3))
+        self.assertEqual(grid[0, 0], ord("#"))
+        self.assertEqual(grid[1, 0], ord("."))
+        self.assertEqual(str(grid), "#..\n.#.\n..#")
+        self.assertEqual(list(grid.find_all(ord("#"))), [(0, 0), (1, 1), (2, 2)])
+        self.assertEqual(Grid.parse([]), Grid(0, 0))
+        with self.assertRaises(ValueError):
+            Grid.parse(["##", "#"])
+
+    def test_get(self):
+        grid = Grid.parse(SAMPLE)
+        self.assertEqual(grid.get(1, 1), ord("#"))
+        self.assertIsNone(grid.get(-1, 0))
+        self.assertEqual(grid.get(0, 3, 0), 0)
+        with self.assertRaises(IndexError):
+            grid[3, 0]
+        with self.assertRaises(IndexError):
+            grid[0, -1] = 0
+
+    def test_neighbors(self):
+        grid = Grid(3, 2)
+        self.assertEqual(list(grid.neighbors(0, 0)), [(0, 1), (1, 0)])
+        self.assertEqual(list(grid.neighbors(1, 1)), [(0, 1), (1, 2), (1, 0)])
+        self.assertEqual(len(list(grid.neighbors(0, 1, ALL_DIRECTIONS))), 5)
+
+    def test_neighbor_table(self):
+        grid = Grid(3, 2)
+        table = grid.neighbor_table()
+        self.assertEqual(len(table), 6)
+        for index, neighbors in enumerate(table):
+            expected = [grid.index(*coord) for coord in grid.neighbors(*grid.coord(index))]
+            self.assertEqual(list(neighbors), expected)
+        self.assertIs(grid.neighbor_table(), table)
+        self.assertIsNot(grid.neighbor_table(ALL_DIRECTIONS), table)
+
+    def test_rows_and_columns(self):
+        grid = Grid(3, 2, b"abcdef")
+        self.assertEqual(list(grid.rows()), [b"abc", b"def"])
+        self.assertEqual(grid.column(1), b"be")
+        self.assertEqual(list(grid.coords())[-1], (1, 2))
+        self.assertEqual(grid.coord(grid.index(1, 2)), (1, 2))
+
+    def test_copy(self):
+        grid = Grid.parse(SAMPLE)
+        table = grid.neighbor_table()
+        copied = grid.copy()
+        copied[0, 0] = ord(".")
+        self.assertEqual(grid[0, 0], ord("#"))
+        self.assertNotEqual(grid, copied)
+        self.assertIs(copied.neighbor_table(), table)
+
+    def test_diff(self):
+        grid = Grid.parse(SAMPLE)
+        copied = grid.copy()
+        self.assertEqual(grid.diff(copied), [])
+        copied[1, 2] = ord("#")
+        copied[2, 2] = ord(".")
+        self.assertEqual(grid.diff(copied), [5, 8])
+        with self.assertRaises(ValueError):
+            grid.diff(Grid(9, 1))
+
@@ -0,0 +1,35 @@
+import unittest as ut
+
+from aoc.harness import Summary, quantile_interval, sample
+
+
+class TestSummary(ut.TestCase):
+    def test_median_interval(self):
+        # with 10 samples the median lies between the 2nd and the 9th at 95% confidence
+        self.assertEqual(quantile_interval([float(value) for value in range(1, 11)], 0.5), (2.0, 9.0))
+
+    def test_few_samples(self):
+        self.assertEqual(quantile_interval([1.0, 2.0, 3.0], 0.5), (1.0, 3.0))
+        self.assertEqual(quantile_interval([4.0], 0.95), (4.0, 4.0))
+
+    def test_of(self):
+        summary = Summary.of([float(value) for value in range(20, 0, -1)])
+        self.assertEqual((summary.min, summary.median, summary.p95), (1.0, 10.5, 19.0))
+        low, high = summary.p95_interval
+        self.assertLessEqual(low, summary.p95)
+        self.assertLessEqual(summary.p95, high)
+
+
+class TestSample(ut.TestCase):
+    def test_fixed_calls(self):
+        answer, calls, seconds = sample(len, "input", calls=3, warmup=0)
+        self.assertEqual((answer, calls), (5, 3))
+        self.assertGreater(seconds, 0)
+
+    def test_calibrates(self):
+        _, calls, seconds = sample(len, "input", min_time=0.001)
+        self.assertGreaterEqual(calls * seconds, 0.001)
+
+    def test_failure(self):
+        with self.assertRaisesRegex(RuntimeError, "ZeroDivisionError"):
+            sample(lambda path: 1 // 0, "input", calls=1)
@@ -0,0 +1,69 @@
+import random
+import unittest as ut
+
+from aoc.intervals import IntervalSet, IntervalTree
+
+
+def points(intervals: IntervalSet) -> set[int]:
+    return {point for start, stop in intervals for point in range(start, stop)}
+
+
+def random_intervals(rng: random.Random, count: int) -> list[tuple[int, int]]:
+    intervals = []
+    for _ in range(count):
+        start = rng.randrange(-50, 50)
+        intervals.append((start, start + rng.randrange(0, 15)))
+    return intervals
+
+
+class TestIntervalSet(ut.TestCase):
+    def test_add_merges_touching(self):
+        intervals = IntervalSet([(0, 2), (5, 7)])
+        intervals.add(2, 5)
+        self.assertEqual(list(intervals), [(0, 7)])
+        intervals.add(10, 12)
+        intervals.add(-3, -1)
+        intervals.add(3, 3)
+        self.assertEqual(list(intervals), [(-3, -1), (0, 7), (10, 12)])
+
+    def test_queries(self):
+        intervals = IntervalSet([(0, 3), (10, 20)])
+        self.assertIn(0, intervals)
+        self.assertNotIn(3, intervals)
+        self.assertIn(19, intervals)
+        self.assertTrue(intervals.overlaps(2, 11))
+        self.assertFalse(intervals.overlaps(3, 10))
+        self.assertEqual(intervals.size(), 13)
+
+    def test_operations_match_sets(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            left = IntervalSet(random_intervals(rng, 6))
+            right = IntervalSet()
+            for start, stop in random_intervals(rng, 6):
+                right.add(start, stop)
+            self.assertEqual(points(left | right), points(left) | points(right))
+            self.assertEqual(points(left & right), points(left) & points(right))
+            self.assertEqual(points(left - right), points(left) - points(right))
+            # results stay disjoint and never touch
+            for result in (left | right, left & right, left - right):
+                self.assertTrue(all(stop < start for stop, start in zip(result.stops, result.starts[1:])))
+
+
+class TestIntervalTree(ut.TestCase):
+    def test_queries_match_scan(self):
+        rng = random.Random(1)
+        for _ in range(100):
+            intervals = [(start, stop, idx) for idx, (start, stop) in enumerate(random_intervals(rng, 20)) if start < stop]
+            tree = IntervalTree(intervals)
+            for point in range(-60, 70, 3):
+                expected = sorted(interval for interval in intervals if interval[0] <= point < interval[1])
+                self.assertEqual(sorted(tree.at(point)), expected)
+            start = rng.randrange(-60, 60)
+            stop = start + rng.randrange(1, 20)
+            expected = sorted(interval for interval in intervals if interval[0] < stop and start < interval[1])
+            self.assertEqual(sorted(tree.overlapping(start, stop)), expected)
+
+    def test_rejects_empty(self):
+        with self.assertRaises(ValueError):
+            IntervalTree([(1, 1, None)])
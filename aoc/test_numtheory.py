@@ -0,0 +1,76 @@
+import random
+import unittest as ut
+from math import gcd
+
+from aoc.numtheory import MAX_TABLE, crt, discrete_log, modpow
+
+
+def brute_log(base: int, target: int, modulus: int) -> int | None:
+    value = 1 % modulus
+    for x in range(modulus):
+        if value == target % modulus:
+            return x
+        value = value * base % modulus
+    return None
+
+
+class TestCrt(ut.TestCase):
+    def test_coprime(self):
+        self.assertEqual(crt([(2, 3), (3, 5), (2, 7)]), (23, 105))
+
+    def test_not_coprime(self):
+        self.assertEqual(crt([(2, 4), (4, 6)]), (10, 12))
+        self.assertEqual(crt([(3, 6), (3, 6), (1, 2)]), (3, 6))
+
+    def test_matches_brute_force(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            congruences = [(rng.randrange(-20, 20), rng.randrange(1, 13)) for _ in range(rng.randrange(1, 4))]
+            solutions = [x for x in range(13 ** 3) if all((x - residue) % modulus == 0 for residue, modulus in congruences)]
+            if not solutions:
+                with self.assertRaises(ValueError):
+                    crt(congruences)
+                continue
+            x, m = crt(congruences)
+            self.assertEqual(x, solutions[0])
+            self.assertEqual(m, solutions[1] - solutions[0] if len(solutions) > 1 else m)
+
+    def test_unsolvable(self):
+        with self.assertRaises(ValueError):
+            crt([(1, 4), (2, 6)])
+        with self.assertRaises(ValueError):
+            crt([(0, 0)])
+
+
+class TestModpow(ut.TestCase):
+    def test_bases(self):
+        self.assertEqual(modpow([2, 3, 10], 5, 7), [4, 5, 5])
+        self.assertEqual(modpow([], 5, 7), [])
+        self.assertEqual(modpow([3], 0, 1), [0])
+
+
+class TestDiscreteLog(ut.TestCase):
+    def test_matches_brute_force(self):
+        for modulus in (2, 7, 11, 12, 97):
+            for base in range(1, modulus):
+                if gcd(base, modulus) != 1:
+                    continue
+                for target in range(modulus):
+                    self.assertEqual(discrete_log(base, target, modulus), brute_log(base, target, modulus))
+
+    def test_no_solution(self):
+        # 2 only generates 1, 2 and 4 modulo 7
+        self.assertIsNone(discrete_log(2, 3, 7))
+        self.assertIsNone(discrete_log(4, 6, 9))
+
+    def test_capped_table(self):
+        # the baby steps are capped far below sqrt(20201227), the giant steps make up for it
+        modulus = 20201227
+        self.assertEqual(discrete_log(7, pow(7, 12345678, modulus), modulus, max_table=64), 12345678)
+        self.assertEqual(discrete_log(7, 5, 101, max_table=3), brute_log(7, 5, 101))
+        self.assertIsNone(discrete_log(10, 2, 11, max_table=2))
+        # past the default cap the giant steps take over as well
+        prime = 4294967311
+        self.assertGreater(prime, MAX_TABLE ** 2)
+        target = pow(3, prime - 1234567, prime)
+        self.assertEqual(pow(3, discrete_log(3, target, prime), prime), target)
@@ -0,0 +1,21 @@
+import unittest as ut
+
+from aoc.parallel import fork_map
+
+
+class TestForkMap(ut.TestCase):
+    def test_results_in_order(self):
+        # closures are not picklable, the children inherit them instead
+        offset = 100
+        self.assertEqual(fork_map(lambda value: value + offset, range(7), jobs=3), list(range(100, 107)))
+
+    def test_serial(self):
+        self.assertEqual(fork_map(str, [1, 2], jobs=1), ["1", "2"])
+
+    def test_failure(self):
+        with self.assertRaisesRegex(RuntimeError, "ZeroDivisionError"):
+            fork_map(lambda value: 1 // value, [1, 0, 2], jobs=2)
+
+
+if __name__ == "__main__":
+    ut.main()
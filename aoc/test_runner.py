@@ -0,0 +1,49 @@
+import tempfile
+import unittest as ut
+from pathlib import Path
+
+from aoc.cache import ResultCache
+from aoc.discover import Solution
+from aoc.runner import run
+
+
+SOLUTION = """
+MEMORY_BUDGET_MIB = 64
+
+
+def part_one(filename):
+    # touched, so that every page counts towards the peak rss
+    return len(b"x" * (160 * 2**20))
+
+
+def part_two(filename):
+    return 2
+"""
+
+
+class TestRun(ut.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        path = Path(self.directory.name) / "day1.py"
+        path.write_text(SOLUTION)
+        (path.parent / "input.txt").write_text("")
+        self.solution = Solution(1999, 1, path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_in_process_budgets(self):
+        first, second = run([self.solution], isolate=False)
+        # over the budget on its own, but in-process budgets are not checked
+        self.assertIsNone(first.error)
+        self.assertGreater(first.peak_rss, 64 * 2**20)
+        # not charged for the peak of the first part
+        self.assertIsNone(second.error)
+        self.assertLess(second.peak_rss, 16 * 2**20)
+
+    def test_cache_keys(self):
+        cache = ResultCache(Path(self.directory.name) / "cache.sqlite")
+        try:
+            self.assertNotEqual(cache.key(self.solution, 2), cache.key(self.solution, 2, isolated=False))
+        finally:
+            cache.close()
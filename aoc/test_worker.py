@@ -0,0 +1,31 @@
+import threading
+import unittest as ut
+
+from aoc.worker import Worker
+
+
+class TestWorker(ut.TestCase):
+    def setUp(self):
+        self.worker = Worker([])
+        self.solver = threading.Thread(target=self.worker.solve_forever, daemon=True)
+        self.solver.start()
+
+    def tearDown(self):
+        self.worker.jobs.put(None)
+        self.solver.join()
+
+    def test_missing_fields(self):
+        reply = self.worker.submit({"year": 2020, "part": 1})
+        self.assertEqual(reply.measurement.error, "Job is missing day")
+        self.assertEqual((reply.measurement.year, reply.measurement.part), (2020, 1))
+
+    def test_survives_failing_jobs(self):
+        # a list cannot key the solutions, solving it raises on the solver thread
+        reply = self.worker.submit({"year": [2020], "day": 1, "part": 1})
+        self.assertIn("TypeError", reply.measurement.error)
+        reply = self.worker.submit({"year": 2020, "day": 1, "part": 1})
+        self.assertEqual(reply.measurement.error, "No solution found for 2020/day1")
+
+
+if __name__ == "__main__":
+    ut.main()
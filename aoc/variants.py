@@ -0,0 +1,155 @@
+"""Interchangeable implementations of one computation, picked by the size of their input.
+
+Every variant declares its complexity class, and optionally the constant factors
+measured for it, so the estimated cost of a variant is ``overhead + scale * class(n)``
+for an input of size ``n``. A registry is called like the functions it holds and runs
+the variant with the lowest estimate. `cross_check` runs every variant on the small
+examples of the registry, to show they agree and how their timings compare.
+"""
+
+import copy
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from math import log2
+from types import ModuleType
+from typing import Any
+
+from aoc.report import align
+
+
+# growth of the work of a variant with the size of its input
+COMPLEXITIES: dict[str, Callable[[int], float]] = {
+    "1": lambda n: 1.0,
+    "log n": lambda n: max(log2(n), 1.0) if n > 0 else 1.0,
+    "n": lambda n: float(n),
+    "n log n": lambda n: n * max(log2(n), 1.0) if n > 0 else 0.0,
+    "n^2": lambda n: float(n) ** 2,
+    "n^3": lambda n: float(n) ** 3,
+    # capped so that large inputs compare as huge instead of overflowing
+    "2^n": lambda n: 2.0 ** min(n, 1000),
+}
+
+
+@dataclass(frozen=True)
+class Variant:
+    name: str
+    func: Callable[..., Any]
+    complexity: str
+    scale: float = 1.0
+    overhead: float = 0.0
+
+    def cost(self, size: int) -> float:
+        return self.overhead + self.scale * COMPLEXITIES[self.complexity](size)
+
+
+@dataclass
+class Check:
+    registry: str
+    example: int
+    size: int
+    variant: str
+    chosen: bool
+    seconds: float
+    result: object = None
+    error: str | None = None
+    agrees: bool = True
+
+
+class Registry:
+    """Variants of one computation taking the same arguments.
+
+    `size` measures the arguments, `canonical` turns a result into the form results are
+    compared in, for variants whose answers are equal without being identical,
+    and `examples` gives the small argument tuples to cross check the variants on.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        size: Callable[..., int],
+        examples: Callable[[], Iterable[tuple]] = tuple,
+        canonical: Callable[[Any], object] = lambda result: result,
+    ) -> None:
+        self.name = name
+        self.size = size
+        self.examples = examples
+        self.canonical = canonical
+        self.variants: list[Variant] = []
+
+    def add(
+        self,
+        func: Callable[..., Any],
+        complexity: str,
+        scale: float = 1.0,
+        overhead: float = 0.0,
+        name: str | None = None,
+    ) -> Callable[..., Any]:
+        if complexity not in COMPLEXITIES:
+            raise ValueError(f"Unknown complexity {complexity}, expected one of {', '.join(COMPLEXITIES)}")
+        self.variants.append(Variant(name or func.__name__, func, complexity, scale, overhead))
+        return func
+
+    def variant(
+        self, complexity: str, scale: float = 1.0, overhead: float = 0.0
+    ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """Registers the decorated function, which stays callable on its own."""
+        return lambda func: self.add(func, complexity, scale, overhead)
+
+    def choose(self, size: int) -> Variant:
+        if not self.variants:
+            raise ValueError(f"No variants registered for {self.name}")
+        return min(self.variants, key=lambda variant: variant.cost(size))
+
+    def __call__(self, *args: Any) -> Any:
+        return self.choose(self.size(*args)).func(*args)
+
+    def cross_check(self) -> Iterator[Check]:
+        """Runs every variant on every example, each on its own copy of the arguments.
+
+        A variant agrees when its canonical result equals the one of the chosen variant.
+        """
+        for example, args in enumerate(self.examples(), start=1):
+            size = self.size(*args)
+            chosen = self.choose(size)
+            checks: list[Check] = []
+            for variant in self.variants:
+                check = Check(self.name, example, size, variant.name, variant is chosen, 0.0)
+                start = time.perf_counter()
+                try:
+                    check.result = self.canonical(variant.func(*copy.deepcopy(args)))
+                except Exception as error:
+                    check.error = repr(error)
+                check.seconds = time.perf_counter() - start
+                checks.append(check)
+            expected = next(check for check in checks if check.chosen)
+            for check in checks:
+                check.agrees = check.error is None and expected.error is None and check.result == expected.result
+            yield from checks
+
+
+def find_registries(module: ModuleType) -> list[Registry]:
+    return [value for value in vars(module).values() if isinstance(value, Registry)]
+
+
+def format_checks(checks: Iterable[tuple[str, Check]]) -> str:
+    """Rows of (day, check), the chosen variant of every example marked with a star."""
+    header = ("day", "registry", "example", "size", "variant", "time (s)", "result")
+    rows = [header]
+    for name, check in checks:
+        if check.error is not None:
+            status = f"error: {check.error}"
+        else:
+            status = "ok" if check.agrees else "differs"
+        rows.append(
+            (
+                name,
+                check.registry,
+                str(check.example),
+                str(check.size),
+                f"{check.variant}{' *' if check.chosen else ''}",
+                f"{check.seconds:.4f}",
+                status,
+            )
+        )
+    return align(rows)
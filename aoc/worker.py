@@ -0,0 +1,187 @@
+"""A long-lived process that keeps every solution imported and solves parts on request.
+
+Jobs arrive over a Unix socket as one JSON object per line,
+``{"year": 2020, "day": 1, "part": 1, "input": "path/or/null"}``, and every job
+gets one JSON line back with the measurement and the time the job waited in the queue.
+``{"stop": true}`` shuts the worker down. A job that is not valid JSON, misses a field
+or fails to run is answered with a measurement whose error says why.
+"""
+
+import json
+import queue
+import socket
+import socketserver
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from aoc.discover import ROOT, Solution, discover
+from aoc.report import align, format_answer
+from aoc.runner import Measurement, measure
+
+
+SOCKET_PATH = ROOT / ".aoc-worker.sock"
+
+REQUIRED = ("year", "day", "part")
+
+
+@dataclass
+class Reply:
+    measurement: Measurement
+    queued: float  # seconds the job waited for the solver
+    round_trip: float = 0.0  # seconds from sending the job to reading its reply
+
+
+class Worker:
+    """Solves jobs one at a time on its own thread, so they never compete for the GIL
+    and solutions that keep module level caches keep them warm between jobs."""
+
+    def __init__(self, solutions: Iterable[Solution]) -> None:
+        self.solutions = {(solution.year, solution.day): solution for solution in solutions}
+        self.load_errors: dict[tuple[int, int], str] = {}
+        for key, solution in self.solutions.items():
+            try:
+                solution.load()
+            except Exception as error:
+                self.load_errors[key] = repr(error)
+        self.jobs: queue.Queue[tuple[dict, float, queue.Queue[Reply]] | None] = queue.Queue()
+
+    def solve(self, job: dict, received: float) -> Reply:
+        missing = [key for key in REQUIRED if key not in job]
+        if missing:
+            return failed(job, f"Job is missing {', '.join(missing)}", received)
+        year, day, part = job["year"], job["day"], job["part"]
+        solution = self.solutions.get((year, day))
+        started = time.perf_counter()
+        if solution is None:
+            measurement = Measurement(year, day, part, error=f"No solution found for {year}/day{day}")
+        elif (year, day) in self.load_errors:
+            measurement = Measurement(year, day, part, error=self.load_errors[year, day])
+        else:
+            input_path = Path(job["input"]) if job.get("input") else None
+            measurement = measure(solution, part, input_path)
+        return Reply(measurement, started - received)
+
+    def solve_forever(self) -> None:
+        while (item := self.jobs.get()) is not None:
+            job, received, replies = item
+            try:
+                reply = self.solve(job, received)
+            except Exception as error:
+                # the solver thread must survive, every later job would wait for it forever
+                reply = failed(job, repr(error), received)
+            replies.put(reply)
+
+    def submit(self, job: dict) -> Reply:
+        """Queues a job and waits for its reply."""
+        replies: queue.Queue[Reply] = queue.Queue(maxsize=1)
+        self.jobs.put((job, time.perf_counter(), replies))
+        return replies.get()
+
+
+def failed(job: object, error: str, received: float) -> Reply:
+    """The reply to a job that could not be solved, 0 stands in for the fields it lacks."""
+    fields = job if isinstance(job, dict) else {}
+    year, day, part = (fields.get(key, 0) for key in REQUIRED)
+    return Reply(Measurement(year, day, part, error=error), time.perf_counter() - received)
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    worker: Worker
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: _Server
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                job = json.loads(line)
+            except ValueError as error:
+                reply = failed(None, f"Invalid job: {error}", time.perf_counter())
+            else:
+                if not isinstance(job, dict):
+                    reply = failed(job, "Job must be a JSON object", time.perf_counter())
+                elif job.get("stop"):
+                    threading.Thread(target=self.server.shutdown).start()
+                    return
+                else:
+                    reply = self.server.worker.submit(job)
+            data = {"measurement": asdict(reply.measurement), "queued": reply.queued}
+            self.wfile.write(json.dumps(data, default=str).encode() + b"\n")
+            self.wfile.flush()
+
+
+def is_running(path: Path = SOCKET_PATH) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(path))
+        except OSError:
+            return False
+    return True
+
+
+def serve(path: Path = SOCKET_PATH, solutions: Iterable[Solution] | None = None) -> None:
+    """Imports the solutions and answers jobs until asked to stop."""
+    if is_running(path):
+        raise RuntimeError(f"A worker is already listening on {path}")
+    # left behind by a worker that did not shut down cleanly
+    path.unlink(missing_ok=True)
+    worker = Worker(discover() if solutions is None else solutions)
+    solver = threading.Thread(target=worker.solve_forever, daemon=True)
+    solver.start()
+    with _Server(str(path), _Handler) as server:
+        server.worker = worker
+        try:
+            server.serve_forever()
+        finally:
+            worker.jobs.put(None)
+            path.unlink(missing_ok=True)
+
+
+def submit(
+    tasks: Iterable[tuple[Solution, int]], input_path: Path | None = None, path: Path = SOCKET_PATH
+) -> Iterator[Reply]:
+    """Sends the parts to a running worker one after the other, yielding their replies."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(path))
+        with sock.makefile("rwb") as file:
+            for solution, part in tasks:
+                job = {
+                    "year": solution.year,
+                    "day": solution.day,
+                    "part": part,
+                    "input": str(input_path.resolve()) if input_path is not None else None,
+                }
+                sent = time.perf_counter()
+                file.write(json.dumps(job).encode() + b"\n")
+                file.flush()
+                data = json.loads(file.readline())
+                yield Reply(Measurement(**data["measurement"]), data["queued"], time.perf_counter() - sent)
+
+
+def stop(path: Path = SOCKET_PATH) -> None:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(path))
+        sock.sendall(json.dumps({"stop": True}).encode() + b"\n")
+
+
+def format_replies(replies: Iterable[Reply]) -> str:
+    header = ("day", "part", "queued (s)", "solve (s)", "round trip (s)", "answer")
+    rows = [header]
+    for reply in replies:
+        measurement = reply.measurement
+        rows.append(
+            (
+                measurement.name,
+                str(measurement.part),
+                f"{reply.queued:.4f}",
+                f"{measurement.wall:.4f}",
+                f"{reply.round_trip:.4f}",
+                format_answer(measurement),
+            )
+        )
+    return align(rows)